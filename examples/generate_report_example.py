@@ -1,11 +1,15 @@
 """Example of generating a arXiv paper report."""
 
-from datetime import datetime
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from functools import lru_cache
 from pathlib import Path
 from dotenv import load_dotenv
+from weasyprint import HTML
 from arxiv_paper_summarizer import ArxivPaperSummarizer
-from arxiv_paper_summarizer.report import ReportGenerator
-from arxiv_paper_summarizer.utils import get_publication_week_folder
+from arxiv_paper_summarizer.arxiv import ArxivClient, fetch_metadata_by_url
+from arxiv_paper_summarizer.report import ReportGenerator, write_pdf
+from arxiv_paper_summarizer.utils import get_publication_week_folder, is_report_up_to_date, write_report_metadata
 
 load_dotenv()
 
@@ -22,9 +26,35 @@ ARXIV_URL_LIST = [
 LANGUAGE = "Traditional Chinese"
 PAPER_SAVE_DIR = Path("papers")
 EXTRACT_SECTION_NOTES = True
+MAX_WORKERS = 8
+# Bump when prompts or models change so existing reports are regenerated.
+PROMPT_VERSION = "v1"
 
 
-def generate_report(arxiv_url, language, base_save_dir):
+def get_output_path(title, published, language, base_save_dir):
+    # Use paper's publication date to determine folder structure
+    weekly_dir = get_publication_week_folder(published, base_save_dir)
+    return weekly_dir / f"{title} ({language}).pdf"
+
+
+def get_report_metadata(arxiv_url, published, language):
+    return {
+        "arxiv_id": ArxivClient.parse_arxiv_id(arxiv_url),
+        "published": published,
+        "language": language,
+        "extract_section_notes": EXTRACT_SECTION_NOTES,
+        "prompt_version": PROMPT_VERSION,
+    }
+
+
+@lru_cache(maxsize=None)
+def create_weekly_dir(weekly_dir):
+    # Papers published in the same week share the folder, so create it only once per run
+    weekly_dir.mkdir(parents=True, exist_ok=True)
+    return weekly_dir
+
+
+def summarize_paper(arxiv_url, language, base_save_dir):
     print(f"Starting to summarize the paper {arxiv_url}")
     summarizer = ArxivPaperSummarizer(
         arxiv_url=arxiv_url,
@@ -32,9 +62,8 @@ def generate_report(arxiv_url, language, base_save_dir):
     )
     summary_result = summarizer.summarize()
 
-    # Use paper's publication date to determine folder structure
-    weekly_dir = get_publication_week_folder(summarizer.paper.published, base_save_dir)
-    weekly_dir.mkdir(parents=True, exist_ok=True)
+    output_path = get_output_path(summarizer.paper.title, summarizer.paper.published, language, base_save_dir)
+    weekly_dir = create_weekly_dir(output_path.parent)
 
     print(f"Paper published: {summarizer.paper.published}")
     print(f"Using folder: {weekly_dir}")
@@ -47,19 +76,83 @@ def generate_report(arxiv_url, language, base_save_dir):
         language=language,
         cover_path=summarizer.get_cover_image_path(),
     )
+    # Translation makes LLM calls, so build the HTML here and leave only the rendering to the worker processes
+    html_content = report.generate_html(report.generate_report_content())
 
-    output_path = weekly_dir / f"{summarizer.paper.title} ({language}).pdf"
-    report.generate_pdf_report(output_path=output_path)
+    return html_content, output_path, get_report_metadata(arxiv_url, summarizer.paper.published, language)
+
+
+def warm_up_pdf_renderer():
+    # Load fonts and Pango/Cairo once per worker process instead of on the first report
+    HTML(string="<p></p>").write_pdf()
+
+
+def render_pdf(html_content, output_path, metadata):
+    write_pdf(html_content, output_path)
+    write_report_metadata(output_path, metadata)
     print(f"Report successfully generated at {output_path}")
 
 
+def get_pending_urls(urls, language, base_save_dir):
+    # One metadata request for all papers, no PDF download, to skip the reports that are up to date
+    try:
+        metadata = fetch_metadata_by_url(urls)
+    except Exception as e:
+        # Without metadata nothing can be checked, so regenerate everything rather than aborting the run
+        print(f"Failed to fetch the metadata, treating all papers as pending: {e}")
+        return list(urls)
+    pending_urls = []
+    for url in urls:
+        result = metadata.get(url)
+        published = result.published.isoformat() if result and result.published else None
+        if result is not None and is_report_up_to_date(
+            get_output_path(result.title, published, language, base_save_dir),
+            get_report_metadata(url, published, language),
+        ):
+            print(f"Skipping {url}: report is up to date")
+            continue
+        pending_urls.append(url)
+    return pending_urls
+
+
 def main():
-    for url in ARXIV_URL_LIST:
-        try:
-            generate_report(url, LANGUAGE, base_save_dir=PAPER_SAVE_DIR)
-        except Exception as e:
-            print(f"Failed to generate report for {url}: {e}")
-    print("All reports generated successfully!")
+    pending_urls = get_pending_urls(ARXIV_URL_LIST, LANGUAGE, PAPER_SAVE_DIR)
+    if not pending_urls:
+        print("All reports are already generated!")
+        return
+
+    # Summarizing is dominated by network I/O (arXiv + LLM calls) and runs in threads, while
+    # PDF rendering is CPU-bound and runs in processes as soon as each summary is ready.
+    failed_urls = []
+    with (
+        ThreadPoolExecutor(max_workers=min(MAX_WORKERS, len(pending_urls))) as thread_executor,
+        # The workers start while the summarizing threads are running, so they are spawned rather than forked
+        ProcessPoolExecutor(mp_context=multiprocessing.get_context("spawn"), initializer=warm_up_pdf_renderer) as process_executor,
+    ):
+        summarize_futures = {thread_executor.submit(summarize_paper, url, LANGUAGE, PAPER_SAVE_DIR): url for url in pending_urls}
+        render_futures = {}
+        for future in as_completed(summarize_futures):
+            url = summarize_futures[future]
+            try:
+                html_content, output_path, metadata = future.result()
+            except Exception as e:
+                failed_urls.append(url)
+                print(f"Failed to summarize the paper {url}: {e}")
+                continue
+            render_futures[process_executor.submit(render_pdf, html_content, output_path, metadata)] = url
+
+        for future in as_completed(render_futures):
+            url = render_futures[future]
+            try:
+                future.result()
+            except Exception as e:
+                failed_urls.append(url)
+                print(f"Failed to generate report for {url}: {e}")
+
+    if failed_urls:
+        print(f"{len(failed_urls)} of {len(pending_urls)} reports failed.")
+    else:
+        print("All reports generated successfully!")
 
 
 if __name__ == "__main__":
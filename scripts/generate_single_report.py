@@ -1,199 +1,307 @@
 #!/usr/bin/env python3
 """Script for generating a single arXiv paper report via GitHub Actions."""
 
+from __future__ import annotations
+
 import argparse
+import logging
 import os
+import re
 import sys
-import traceback
-from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache, partial
 from pathlib import Path
+from typing import TYPE_CHECKING, Callable
+
 from dotenv import load_dotenv
 
-from arxiv_paper_summarizer import ArxivPaperSummarizer
-from arxiv_paper_summarizer.report import ReportGenerator
-from arxiv_paper_summarizer.utils import get_publication_week_folder
+# The package pulls in WeasyPrint, unstructured and NLTK, which take seconds to import.
+# They are imported inside the functions that need them, so `--help` and argument errors stay instant.
+if TYPE_CHECKING:
+    from arxiv_paper_summarizer import ArxivPaperSummarizer
+    from arxiv_paper_summarizer.types import SummaryResult
+
+logger = logging.getLogger(__name__)
+
+# Characters kept in output filenames: letters, digits, underscores, spaces and hyphens
+_UNSAFE_FILENAME_CHARS = re.compile(r"[^\w \-]")
+
+# Bump when prompts or models change so cached summaries and existing reports are not reused.
+SUMMARY_CACHE_VERSION = "v1"
+
+
+@lru_cache(maxsize=None)
+def create_weekly_dir(weekly_dir: Path) -> Path:
+    """Create the output folder once per run; papers published in the same week share it."""
+    weekly_dir.mkdir(parents=True, exist_ok=True)
+    return weekly_dir
+
+
+def _expected_output_path(title: str, language: str, mode: str, weekly_dir: Path) -> Path:
+    """Return the deterministic output path of a report."""
+    safe_title = _UNSAFE_FILENAME_CHARS.sub("", title).strip().replace(" ", "_")[:80]  # Limit length
+
+    language_code = "TC" if language == "Traditional Chinese" else "EN"
+    mode_code = "detailed" if mode == "detailed" else "simple"
+    return weekly_dir / f"{safe_title}_{language_code}_{mode_code}.pdf"
+
+
+def get_report_metadata(arxiv_url: str, published: str | None, language: str, mode: str, keynote_model: str) -> dict[str, str | None]:
+    """Return the metadata recorded next to a report, used to detect whether it is up to date."""
+    from arxiv_paper_summarizer.arxiv import ArxivClient
+
+    return {
+        "arxiv_id": ArxivClient.parse_arxiv_id(arxiv_url),
+        "published": published,
+        "language": language,
+        "mode": mode,
+        # Batched keynotes are written by another model, so those reports are not interchangeable with the others
+        "keynote_model": keynote_model,
+        "prompt_version": SUMMARY_CACHE_VERSION,
+    }
+
+
+def find_up_to_date_report(arxiv_url: str, language: str, mode: str, keynote_model: str, papers_base_dir: Path = Path("papers")) -> Path | None:
+    """Return the path of an existing up-to-date report, checked from arXiv metadata only (no PDF download)."""
+    from arxiv_paper_summarizer.arxiv import fetch_metadata_by_url
+    from arxiv_paper_summarizer.utils import get_publication_week_folder, is_report_up_to_date
+
+    result = fetch_metadata_by_url(arxiv_url).get(arxiv_url)
+    if result is None:
+        return None
+
+    published = result.published.isoformat() if result.published else None
+    output_path = _expected_output_path(result.title, language, mode, get_publication_week_folder(published, papers_base_dir))
+    if is_report_up_to_date(output_path, get_report_metadata(arxiv_url, published, language, mode, keynote_model)):
+        return output_path
+    return None
 
 
 def validate_environment():
     """Validate that all required environment variables and dependencies are available."""
-    print("🔍 Validating environment...")
+    logger.info("🔍 Validating environment...")
 
     # Check OpenAI API key
     api_key = os.getenv("OPENAI_API_KEY")
     if not api_key:
         raise ValueError("OPENAI_API_KEY environment variable is not set")
-    print(f"✅ OpenAI API key found (length: {len(api_key)})")
+    logger.info("✅ OpenAI API key found (length: %d)", len(api_key))
 
     # Check OpenAI base URL (optional)
     base_url = os.getenv("OPENAI_BASE_URL")
     if base_url:
-        print(f"✅ OpenAI base URL: {base_url}")
+        logger.info("✅ OpenAI base URL: %s", base_url)
     else:
-        print("ℹ️  Using default OpenAI base URL")
+        logger.info("ℹ️  Using default OpenAI base URL")
 
     # Check Python version
     python_version = sys.version_info
-    print(f"🐍 Python version: {python_version.major}.{python_version.minor}.{python_version.micro}")
+    logger.info("🐍 Python version: %d.%d.%d", python_version.major, python_version.minor, python_version.micro)
 
-    print("✅ Environment validation completed")
+    logger.info("✅ Environment validation completed")
 
 
-def generate_report(arxiv_url: str, language: str = "English", mode: str = "simple") -> Path:
+def generate_report(
+    arxiv_url: str,
+    language: str = "English",
+    mode: str = "simple",
+    summarizer: ArxivPaperSummarizer | None = None,
+    summary_result: SummaryResult | None = None,
+    batch: bool = False,
+) -> Path:
     """Generate report for a single arXiv paper.
 
     Args:
         arxiv_url: The arXiv paper URL
         language: Report language ("English" or "Traditional Chinese")
         mode: Report mode ("simple" or "detailed")
+        summarizer: An already initialized summarizer for the paper (optional)
+        summary_result: An already generated summary for the paper, e.g. from the Batch API (optional)
+        batch: Whether the keynote of `summary_result` was written through the Batch API
 
     Returns:
         Path to the generated PDF report
     """
-    print(f"🚀 Starting to summarize the paper: {arxiv_url}")
-    print(f"📝 Language: {language}")
-    print(f"⚙️  Mode: {mode}")
+    from arxiv_paper_summarizer import ArxivPaperSummarizer
+    from arxiv_paper_summarizer.cache import get_default_cache, make_cache_key
+    from arxiv_paper_summarizer.report import ReportGenerator
+    from arxiv_paper_summarizer.types import SummaryResult
+    from arxiv_paper_summarizer.utils import get_publication_week_folder, write_report_metadata
+
+    logger.info("🚀 Starting to summarize the paper: %s (language: %s, mode: %s)", arxiv_url, language, mode)
 
     # Convert mode to extract_section_notes boolean
     extract_section_notes = mode == "detailed"
-    print(f"🔧 Extract section notes: {extract_section_notes}")
 
     # Base papers directory
     papers_base_dir = Path("papers")
-
-    summarizer = None
-    summary_result = None
-    report = None
+    keynote_model = ArxivPaperSummarizer.get_keynote_model_name(batch=batch)
 
     try:
+        # Skip papers whose report is already up to date (e.g. retried jobs) before downloading anything
+        if summarizer is None and (existing_path := find_up_to_date_report(arxiv_url, language, mode, keynote_model, papers_base_dir)) is not None:
+            logger.info("⏭️  Report is up to date, skipping: %s", existing_path)
+            return existing_path
+
         # Step 1: Initialize summarizer
-        print("\n📋 Step 1: Initializing ArXiv paper summarizer...")
-        try:
+        if summarizer is None:
             summarizer = ArxivPaperSummarizer(
                 arxiv_url=arxiv_url,
                 extract_section_notes=extract_section_notes,
             )
-            print(f"✅ Summarizer initialized successfully")
-            print(f"📄 Paper title: {summarizer.paper.title}")
-            print(f"👥 Authors: {', '.join(summarizer.paper.authors)}")
-            print(f"📅 Published: {summarizer.paper.published}")
+        logger.info("📄 Paper: %s", summarizer.paper.title)
+        logger.info("👥 Authors: %s", ", ".join(summarizer.paper.authors))
+        logger.info("📅 Published: %s", summarizer.paper.published)
 
-            # Use paper's publication date to determine folder structure
-            weekly_dir = get_publication_week_folder(summarizer.paper.published, papers_base_dir)
-            weekly_dir.mkdir(parents=True, exist_ok=True)
-            print(f"📁 Output directory created: {weekly_dir}")
-
-        except Exception as e:
-            print(f"❌ ERROR in Step 1 - Summarizer initialization failed:")
-            print(f"   Error type: {type(e).__name__}")
-            print(f"   Error message: {str(e)}")
-            print(f"   Full traceback:")
-            traceback.print_exc()
-            raise RuntimeError(f"Failed to initialize summarizer: {e}") from e
+        # Use paper's publication date to determine folder structure
+        weekly_dir = create_weekly_dir(get_publication_week_folder(summarizer.paper.published, papers_base_dir))
 
         # Step 2: Generate summary
-        print("\n📋 Step 2: Generating paper summary...")
-        try:
+        # Reuse the summary of a previous run (e.g. one that failed at PDF generation) when caching is enabled
+        summary_cache = get_default_cache("summaries")
+        summary_cache_key = make_cache_key(str(summarizer.paper.url), mode, SUMMARY_CACHE_VERSION, keynote_model)
+        if summary_result is not None:
+            logger.info("♻️  Using the provided summary")
+        elif summary_cache is not None and (cached_summary := summary_cache.get(summary_cache_key)) is not None:
+            summary_result = SummaryResult.model_validate(cached_summary)
+            logger.info("♻️  Reusing cached summary from %s", summary_cache.cache_dir)
+        else:
             summary_result = summarizer.summarize()
-            print(f"✅ Summary generated successfully")
-            print(f"📝 Keynote length: {len(summary_result.keynote)} characters")
-            print(f"📊 Section notes count: {len(summary_result.section_notes)}")
-        except Exception as e:
-            print(f"❌ ERROR in Step 2 - Summary generation failed:")
-            print(f"   Error type: {type(e).__name__}")
-            print(f"   Error message: {str(e)}")
-            print(f"   Full traceback:")
-            traceback.print_exc()
-            raise RuntimeError(f"Failed to generate summary: {e}") from e
+            if summary_cache is not None:
+                summary_cache.set(summary_cache_key, summary_result.model_dump(mode="json"))
+        logger.info("📝 Keynote length: %d characters, section notes: %d", len(summary_result.keynote), len(summary_result.section_notes))
 
         # Step 3: Initialize report generator
-        print("\n📋 Step 3: Initializing report generator...")
-        try:
-            cover_path = summarizer.get_cover_image_path()
-            print(f"🖼️  Cover image path: {cover_path}")
-
-            report = ReportGenerator(
-                paper=summarizer.paper,
-                keynote=summary_result.keynote,
-                section_notes=summary_result.section_notes,
-                language=language,
-                cover_path=cover_path,
-            )
-            print(f"✅ Report generator initialized successfully")
-        except Exception as e:
-            print(f"❌ ERROR in Step 3 - Report generator initialization failed:")
-            print(f"   Error type: {type(e).__name__}")
-            print(f"   Error message: {str(e)}")
-            print(f"   Full traceback:")
-            traceback.print_exc()
-            raise RuntimeError(f"Failed to initialize report generator: {e}") from e
+        report = ReportGenerator(
+            paper=summarizer.paper,
+            keynote=summary_result.keynote,
+            section_notes=summary_result.section_notes,
+            language=language,
+            cover_path=summarizer.get_cover_image_path(),
+        )
 
         # Step 4: Create output filename
-        print("\n📋 Step 4: Creating output filename...")
+        output_path = _expected_output_path(summarizer.paper.title, language, mode, weekly_dir)
+
+        # Step 5: Generate PDF report
+        report.generate_pdf_report(output_path=output_path)
+
+        # Verify file was created
         try:
-            safe_title = "".join(c for c in summarizer.paper.title if c.isalnum() or c in (" ", "-", "_")).strip()
-            safe_title = safe_title.replace(" ", "_")[:80]  # Limit length
+            file_size = output_path.stat().st_size
+        except FileNotFoundError as e:
+            raise FileNotFoundError(f"Output file was not created: {output_path}") from e
+        logger.info("📊 Generated file size: %d bytes (%.2f MB)", file_size, file_size / 1048576)
+        write_report_metadata(output_path, get_report_metadata(arxiv_url, summarizer.paper.published, language, mode, keynote_model))
+
+    except Exception:
+        logger.exception("💥 generate_report failed for %s (language: %s, mode: %s)", arxiv_url, language, mode)
+        raise
 
-            language_code = "TC" if language == "Traditional Chinese" else "EN"
-            mode_code = "detailed" if mode == "detailed" else "simple"
-            output_filename = f"{safe_title}_{language_code}_{mode_code}.pdf"
-            output_path = weekly_dir / output_filename
+    logger.info("🎉 Report successfully generated at %s", output_path)
+    return output_path
 
-            print(f"✅ Output filename created: {output_filename}")
-            print(f"📄 Full output path: {output_path}")
-        except Exception as e:
-            print(f"❌ ERROR in Step 4 - Filename creation failed:")
-            print(f"   Error type: {type(e).__name__}")
-            print(f"   Error message: {str(e)}")
-            print(f"   Full traceback:")
-            traceback.print_exc()
-            raise RuntimeError(f"Failed to create output filename: {e}") from e
 
-        # Step 5: Generate PDF report
-        print("\n📋 Step 5: Generating PDF report...")
-        try:
-            report.generate_pdf_report(output_path=output_path)
-            print(f"✅ PDF report generated successfully")
+def generate_reports(arxiv_urls: list[str], language: str = "English", mode: str = "simple", jobs: int = 1) -> list[Path]:
+    """Generate reports for several arXiv papers concurrently.
 
-            # Verify file was created
-            if output_path.exists():
-                file_size = output_path.stat().st_size
-                print(f"📊 Generated file size: {file_size:,} bytes ({file_size/1024/1024:.2f} MB)")
-            else:
-                raise FileNotFoundError(f"Output file was not created: {output_path}")
+    Args:
+        arxiv_urls: The arXiv paper URLs
+        language: Report language ("English" or "Traditional Chinese")
+        mode: Report mode ("simple" or "detailed")
+        jobs: Maximum number of papers processed in parallel
 
+    Returns:
+        Paths to the generated PDF reports, in the same order as ``arxiv_urls``
+
+    Raises:
+        RuntimeError: If any of the reports failed to generate. The other reports are still generated.
+    """
+    output_paths = []
+    failed_urls = []
+
+    def collect(url: str, get_output_path: Callable[[], Path]) -> None:
+        try:
+            output_paths.append(get_output_path())
         except Exception as e:
-            print(f"❌ ERROR in Step 5 - PDF generation failed:")
-            print(f"   Error type: {type(e).__name__}")
-            print(f"   Error message: {str(e)}")
-            print(f"   Full traceback:")
-            traceback.print_exc()
-            raise RuntimeError(f"Failed to generate PDF report: {e}") from e
-
-        print(f"\n🎉 Report successfully generated at {output_path}")
-        return output_path
+            # generate_report already logged the traceback
+            logger.error("❌ Failed to generate report for %s: %s", url, e)
+            failed_urls.append(url)
 
-    except Exception as e:
-        print(f"\n💥 CRITICAL ERROR in generate_report function:")
-        print(f"   Error type: {type(e).__name__}")
-        print(f"   Error message: {str(e)}")
-        print(f"   ArXiv URL: {arxiv_url}")
-        print(f"   Language: {language}")
-        print(f"   Mode: {mode}")
-
-        # Add debugging information about the current state
-        if summarizer:
-            try:
-                print(f"   Paper title: {summarizer.paper.title}")
-            except:
-                print("   Could not access paper title")
-
-        if summary_result:
-            print(f"   Summary keynote length: {len(summary_result.keynote) if summary_result.keynote else 0}")
-            print(f"   Section notes count: {len(summary_result.section_notes) if summary_result.section_notes else 0}")
-
-        print(f"\n🔍 Full error traceback:")
-        traceback.print_exc()
-        raise
+    if len(arxiv_urls) == 1 or jobs <= 1:
+        for url in arxiv_urls:
+            collect(url, partial(generate_report, url, language, mode))
+    else:
+        # Report generation is dominated by network I/O (arXiv + LLM calls), so threads are enough here.
+        with ThreadPoolExecutor(max_workers=min(jobs, len(arxiv_urls))) as executor:
+            futures = [executor.submit(generate_report, url, language, mode) for url in arxiv_urls]
+
+        for url, future in zip(arxiv_urls, futures):
+            collect(url, future.result)
+
+    if failed_urls:
+        raise RuntimeError(f"Failed to generate {len(failed_urls)} of {len(arxiv_urls)} reports: {', '.join(failed_urls)}")
+    return output_paths
+
+
+def generate_reports_in_batch(arxiv_urls: list[str], language: str = "English", mode: str = "simple", poll_interval: float = 60.0) -> list[Path]:
+    """Generate reports with the keynote requests of all papers submitted through the OpenAI Batch API.
+
+    The Batch API is 50% cheaper and not subject to the per-minute rate limits, but results can take up to 24 hours.
+    Section notes (detailed mode) depend on earlier responses and are still generated in real time.
+    The keynote model is not served by the Batch API, so the keynotes are written by another model.
+
+    Args:
+        arxiv_urls: The arXiv paper URLs
+        language: Report language ("English" or "Traditional Chinese")
+        mode: Report mode ("simple" or "detailed")
+        poll_interval: Seconds between two batch status checks
+
+    Returns:
+        Paths to the generated PDF reports
+
+    Raises:
+        RuntimeError: If any of the reports failed to generate. The other reports are still generated.
+    """
+    from arxiv_paper_summarizer import ArxivPaperSummarizer
+    from arxiv_paper_summarizer.batch import run_batch
+
+    keynote_model = ArxivPaperSummarizer.get_keynote_model_name(batch=True)
+    logger.warning(
+        "⚠️  Batched keynotes are written by %s instead of %s; the reports are kept apart from the non-batched ones",
+        keynote_model,
+        ArxivPaperSummarizer.get_keynote_model_name(),
+    )
+    summarizers: dict[str, ArxivPaperSummarizer] = {}
+    output_paths = []
+    failed_urls = []
+    for url in arxiv_urls:
+        try:
+            if (existing_path := find_up_to_date_report(url, language, mode, keynote_model)) is not None:
+                logger.info("⏭️  Report is up to date, skipping: %s", existing_path)
+                output_paths.append(existing_path)
+                continue
+            summarizers[url] = ArxivPaperSummarizer(arxiv_url=url, extract_section_notes=mode == "detailed")
+        except Exception:
+            logger.exception("❌ Failed to initialize summarizer for %s", url)
+            failed_urls.append(url)
+
+    batch_requests = [request for summarizer in summarizers.values() for request in summarizer.build_batch_requests()]
+    logger.info("📦 Submitting %d requests through the OpenAI Batch API...", len(batch_requests))
+    responses = run_batch(batch_requests, poll_interval=poll_interval) if batch_requests else {}
+    logger.info("✅ Received %d batch responses", len(responses))
+
+    for url, summarizer in summarizers.items():
+        try:
+            summary_result = summarizer.apply_batch_responses(responses)
+            output_paths.append(generate_report(url, language, mode, summarizer=summarizer, summary_result=summary_result, batch=True))
+        except Exception:
+            logger.exception("❌ Failed to generate report for %s", url)
+            failed_urls.append(url)
+
+    if failed_urls:
+        raise RuntimeError(f"Failed to generate {len(failed_urls)} of {len(arxiv_urls)} reports: {', '.join(failed_urls)}")
+    return output_paths
 
 
 def main():
@@ -205,10 +313,11 @@ def main():
 Examples:
   python scripts/generate_single_report.py https://arxiv.org/abs/2410.20672
   python scripts/generate_single_report.py https://arxiv.org/abs/2410.20672 --language "Traditional Chinese" --mode detailed
+  python scripts/generate_single_report.py https://arxiv.org/abs/2410.20672 https://arxiv.org/abs/2410.10762 --jobs 2
         """,
     )
 
-    parser.add_argument("url", help="ArXiv paper URL (e.g., https://arxiv.org/abs/2410.20672)")
+    parser.add_argument("urls", nargs="+", metavar="url", help="ArXiv paper URL(s) (e.g., https://arxiv.org/abs/2410.20672)")
 
     parser.add_argument("--language", choices=["English", "Traditional Chinese"], default="English", help="Report language (default: English)")
 
@@ -219,63 +328,75 @@ Examples:
         help="Report mode: simple (keynote only) or detailed (with section notes) (default: simple)",
     )
 
+    parser.add_argument("-j", "--jobs", type=int, default=1, help="Number of papers processed in parallel (default: 1)")
+
+    parser.add_argument(
+        "--batch",
+        action="store_true",
+        help="Submit the keynote requests through the OpenAI Batch API (50%% cheaper, results can take up to 24 hours, written by another model)",
+    )
+
     args = parser.parse_args()
 
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(message)s", stream=sys.stdout)
+
     # Load environment variables
     load_dotenv()
 
-    print("=" * 80)
-    print("🚀 ArXiv Paper Report Generator")
-    print("=" * 80)
+    logger.info("=" * 80)
+    logger.info("🚀 ArXiv Paper Report Generator")
+    logger.info("=" * 80)
 
     try:
         # Validate environment before processing
         validate_environment()
 
-        print(f"\n📋 Processing Parameters:")
-        print(f"   📄 ArXiv URL: {args.url}")
-        print(f"   🌍 Language: {args.language}")
-        print(f"   ⚙️  Mode: {args.mode}")
+        logger.info("📋 Processing Parameters:")
+        logger.info("   📄 ArXiv URL(s): %s", ", ".join(args.urls))
+        logger.info("   🌍 Language: %s", args.language)
+        logger.info("   ⚙️  Mode: %s", args.mode)
+        logger.info("   🧵 Jobs: %d", args.jobs)
 
-        # Generate the report
-        output_path = generate_report(args.url, args.language, args.mode)
+        # Generate the reports
+        if args.batch:
+            output_paths = generate_reports_in_batch(args.urls, args.language, args.mode)
+        else:
+            output_paths = generate_reports(args.urls, args.language, args.mode, jobs=args.jobs)
 
         # Output information for GitHub Actions
         if os.getenv("GITHUB_OUTPUT"):
             with open(os.environ["GITHUB_OUTPUT"], "a") as f:
-                f.write(f"report_path={output_path}\n")
-                f.write(f"report_filename={output_path.name}\n")
-            print(f"✅ GitHub Actions output variables set")
+                f.write(f"report_path={output_paths[0]}\n")
+                f.write(f"report_filename={output_paths[0].name}\n")
+            logger.info("✅ GitHub Actions output variables set")
 
-        print(f"\n" + "=" * 80)
-        print(f"🎉 SUCCESS: Report generation completed!")
-        print(f"📄 Generated file: {output_path}")
-        print("=" * 80)
+        logger.info("=" * 80)
+        logger.info("🎉 SUCCESS: Report generation completed!")
+        for output_path in output_paths:
+            logger.info("📄 Generated file: %s", output_path)
+        logger.info("=" * 80)
 
     except KeyboardInterrupt:
-        print(f"\n⚠️  Process interrupted by user")
+        logger.warning("⚠️  Process interrupted by user")
         sys.exit(130)  # Standard exit code for SIGINT
 
     except Exception as e:
-        print(f"\n" + "=" * 80)
-        print(f"💥 FATAL ERROR: Report generation failed!")
-        print(f"=" * 80)
-        print(f"❌ Error type: {type(e).__name__}")
-        print(f"❌ Error message: {str(e)}")
-        print(f"📋 Input parameters:")
-        print(f"   📄 ArXiv URL: {args.url}")
-        print(f"   🌍 Language: {args.language}")
-        print(f"   ⚙️  Mode: {args.mode}")
-
-        print(f"\n🔍 Full error details:")
-        traceback.print_exc()
-
-        print(f"\n💡 Troubleshooting tips:")
-        print(f"   1. Verify the ArXiv URL is valid and accessible")
-        print(f"   2. Check your internet connection")
-        print(f"   3. Ensure OpenAI API key is valid and has sufficient credits")
-        print(f"   4. Try running with a different paper URL")
-        print("=" * 80)
+        logger.error("=" * 80)
+        logger.error("💥 FATAL ERROR: Report generation failed!")
+        logger.error("=" * 80)
+        logger.error("❌ Error type: %s", type(e).__name__)
+        logger.error("❌ Error message: %s", e)
+        logger.error("📋 Input parameters:")
+        logger.error("   📄 ArXiv URL(s): %s", ", ".join(args.urls))
+        logger.error("   🌍 Language: %s", args.language)
+        logger.error("   ⚙️  Mode: %s", args.mode)
+
+        logger.error("💡 Troubleshooting tips:")
+        logger.error("   1. Verify the ArXiv URL is valid and accessible")
+        logger.error("   2. Check your internet connection")
+        logger.error("   3. Ensure OpenAI API key is valid and has sufficient credits")
+        logger.error("   4. Try running with a different paper URL")
+        logger.error("=" * 80)
 
         sys.exit(1)
 
@@ -1,13 +1,80 @@
 """Windows setup helper for arxiv-paper-summarizer."""
 
+import functools
+import hashlib
+import json
 import os
+import platform
 import sys
 import subprocess
 import tempfile
 import shutil
+import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
+# Temporary directories younger than this (in seconds) may belong to running processes
+TEMP_DIR_MIN_AGE = 10 * 60
 
+# Successful checks are remembered for a day, as long as the OS version and PATH do not change
+STATE_FILE = Path(tempfile.gettempdir()) / "arxiv-setup-state.json"
+STATE_TTL = 24 * 60 * 60
+
+
+def _get_state_key():
+    payload = json.dumps([platform.version(), sys.version, os.environ.get("PATH", "")])
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def _load_state():
+    """Load the results of previous successful checks, or an empty dict if they are stale."""
+    try:
+        state = json.loads(STATE_FILE.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+
+    if state.get("key") != _get_state_key() or time.time() - state.get("timestamp", 0) > STATE_TTL:
+        return {}
+    return state.get("results", {})
+
+
+def _save_state(results):
+    try:
+        STATE_FILE.write_text(json.dumps({"key": _get_state_key(), "timestamp": time.time(), "results": results}), encoding="utf-8")
+    except OSError:
+        pass
+
+
+def cached_check(func):
+    """Skip a check that already succeeded in a recent run. Failures are always re-checked."""
+
+    @functools.lru_cache(maxsize=None)
+    @functools.wraps(func)
+    def wrapper():
+        results = _load_state()
+        if results.get(func.__name__):
+            print(f"✓ {func.__name__}: passed in a previous run (cached)")
+            return True
+
+        ok = func()
+        if ok:
+            # Reload so that results saved by other checks in the meantime are kept
+            _save_state({**_load_state(), func.__name__: True})
+        return ok
+
+    return wrapper
+
+
+def _list_dir(path):
+    """Return the names of the entries in a directory, or an empty set if it does not exist."""
+    try:
+        with os.scandir(path) as entries:
+            return {entry.name for entry in entries}
+    except OSError:
+        return set()
+
+
+@cached_check
 def check_weasyprint_installation():
     """Check if WeasyPrint is properly installed."""
     try:
@@ -20,6 +87,7 @@ def check_weasyprint_installation():
         return False
 
 
+@cached_check
 def check_pango_installation():
     """Check if Pango is available for WeasyPrint."""
     try:
@@ -39,20 +107,26 @@ def check_pango_installation():
         return False
 
 
-def clean_temp_directories():
-    """Clean up temporary directories that might be locked."""
-    temp_dir = Path(tempfile.gettempdir())
-    cleaned = 0
+def clean_temp_directories(min_age: float = TEMP_DIR_MIN_AGE, max_workers: int = 8):
+    """Clean up temporary directories that might be locked.
 
-    for item in temp_dir.glob("tmp*"):
-        if item.is_dir():
+    Directories modified within the last `min_age` seconds are kept, since they may still be in use.
+    """
+    cutoff = time.time() - min_age
+    candidates = []
+    with os.scandir(tempfile.gettempdir()) as entries:
+        for entry in entries:
             try:
-                shutil.rmtree(item, ignore_errors=True)
-                cleaned += 1
-            except Exception:
+                if entry.name.startswith("tmp") and entry.is_dir(follow_symlinks=False) and entry.stat().st_mtime < cutoff:
+                    candidates.append(entry.path)
+            except OSError:
                 pass
 
-    print(f"✓ Cleaned {cleaned} temporary directories")
+    # Removing directory trees is I/O-bound, so threads speed it up on large temp folders
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        list(executor.map(lambda path: shutil.rmtree(path, ignore_errors=True), candidates))
+
+    print(f"✓ Cleaned {len(candidates)} temporary directories")
 
 
 def test_pdf_generation():
@@ -96,6 +170,7 @@ def test_pdf_generation():
         return False
 
 
+@cached_check
 def check_msys2_installation():
     """Check if MSYS2 is installed and Pango is available."""
     msys2_paths = [
@@ -104,13 +179,15 @@ def check_msys2_installation():
     ]
 
     for path in msys2_paths:
-        if Path(path).exists():
+        # Read each directory once instead of checking every DLL separately
+        present = _list_dir(path)
+        if present:
             print(f"✓ MSYS2 found at {path}")
             # Check if pango DLLs are present
             pango_libs = ["libpango-1.0-0.dll", "libpangocairo-1.0-0.dll"]
             all_found = True
             for lib in pango_libs:
-                if not (Path(path) / lib).exists():
+                if lib not in present:
                     print(f"  ✗ Missing: {lib}")
                     all_found = False
                 else:
@@ -123,6 +200,7 @@ def check_msys2_installation():
     return False
 
 
+@cached_check
 def check_poppler_installation():
     """Check if Poppler is installed for PDF processing."""
     try:
@@ -142,8 +220,7 @@ def check_poppler_installation():
     ]
 
     for path in poppler_paths:
-        pdftoppm_path = Path(path) / "pdftoppm.exe"
-        if pdftoppm_path.exists():
+        if "pdftoppm.exe" in _list_dir(path):
             print(f"✓ Poppler found at {path}")
             return True
 
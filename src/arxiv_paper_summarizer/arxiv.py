@@ -3,187 +3,480 @@
 from __future__ import annotations
 
 import io
+import logging
+import multiprocessing
+import os
 import re
 import ssl
-import tempfile
-from typing import Iterable, cast
+import threading
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from functools import lru_cache
+from itertools import islice
+from typing import Iterable, Sequence, cast
+from urllib.parse import urlparse
 
 import fitz
+import requests
 from arxiv import Client as _ArxivClient
 from arxiv import Result as ArxivResult
 from arxiv import Search as ArxivSearch
-from more_itertools import flatten, unique_everseen
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
+from arxiv_paper_summarizer.cache import FileCache, get_default_cache
 from arxiv_paper_summarizer.error import InvalidArxivURLException
 from arxiv_paper_summarizer.types import Paper
 
+logger = logging.getLogger(__name__)
+
+# arXiv's documented host for programmatic and bulk access
+PDF_DOWNLOAD_DOMAIN = "export.arxiv.org"
+# Error and rate-limit pages are served with a success status too, so downloads are checked for the PDF header
+_PDF_MAGIC = b"%PDF"
+
+_ARXIV_ID_RE = re.compile(r"(\d{4}\.\d{4,5})(v\d+)?")
+# Matches a reference URL and captures its arXiv ID, so both come out of a single scan of the text
+_ARXIV_REF_RE = re.compile(r"https?://arxiv\.org/abs/(\d{4}\.\d{4,5})(?:v\d+)?")
+# The same URLs without a capture group, so `findall` returns the whole URLs
+_ARXIV_REF_URL_RE = re.compile(r"https?://arxiv\.org/abs/\d{4}\.\d{4,5}(?:v\d+)?")
+_NONWORD_RE = re.compile(r"\W+")
+# Plain text mode with its default flags, minus recovering character IDs for glyphs without a Unicode mapping
+_PDF_TEXT_FLAGS = fitz.TEXT_PRESERVE_LIGATURES | fitz.TEXT_PRESERVE_WHITESPACE | fitz.TEXT_MEDIABOX_CLIP
+# Every reference URL contains this, and a substring check is far cheaper than a regex scan of a page without any
+_ARXIV_REF_MARKER = "arxiv.org/abs/"
+
+
+@lru_cache(maxsize=4096)
+def parse_arxiv_id(url: str) -> str:
+    """
+    Extracts the Arxiv ID from a given URL.
+
+    Args:
+        url (str): The URL containing the Arxiv ID.
+
+    Returns:
+        str: The extracted Arxiv ID.
+
+    Raises:
+        InvalidArxivURLException: If the URL does not contain an Arxiv ID.
+
+    Example:
+        >>> parse_arxiv_id("https://huggingface.co/papers/2404.01475")
+        '2404.01475'
+    """
+    if (arxiv_id := _parse_abs_url_id(url)) is not None:
+        return arxiv_id
+    match = _ARXIV_ID_RE.search(url)
+    if match:
+        return match.group(1)
+    raise InvalidArxivURLException(f"Invalid Arxiv URL: {url}. Expected url should contain Arxiv ID.")
+
+
+def _parse_abs_url_id(url: str) -> str | None:
+    """Slice the ID out of the common `.../abs/<id>[v<n>]` form without the regex, or return None for any other form."""
+    _, sep, rest = url.partition("/abs/")
+    if not sep:
+        return None
+    arxiv_id = rest.partition("?")[0].partition("#")[0].partition("v")[0]
+    year_month, dot, number = arxiv_id.partition(".")
+    if dot and len(year_month) == 4 and len(number) in (4, 5) and (year_month + number).isdecimal() and arxiv_id.isascii():
+        return arxiv_id
+    return None
+
+
+def extract_id(url: str) -> str | None:
+    match = _ARXIV_ID_RE.search(url)
+    return match.group(1) if match else None
+
+
+def parse_references(text: str) -> list[str]:
+    if _ARXIV_REF_MARKER not in text:
+        return []
+    return _ARXIV_REF_URL_RE.findall(text)
+
+
+def parse_reference_ids(text: str) -> list[str]:
+    """Return the arXiv IDs of the referenced papers, without parsing each reference URL again."""
+    if _ARXIV_REF_MARKER not in text:
+        return []
+    return _ARXIV_REF_RE.findall(text)
+
+
+def _parse_pdf_pages(pdf_bytes: bytes) -> list[str]:
+    """Extract the text of each page of the PDF. Module-level, so it can run in a worker process."""
+    doc = cast(fitz.Document, fitz.open(stream=pdf_bytes, filetype="pdf"))
+    try:
+        if doc.needs_pass:
+            logger.warning("Skipping the text of a password-protected PDF")
+            return []
+        return [page.get_text("text", flags=_PDF_TEXT_FLAGS) for page in doc]  # type: ignore
+    finally:
+        doc.close()
+
+
+def _get_worker_context() -> multiprocessing.context.BaseContext:
+    if "forkserver" not in multiprocessing.get_all_start_methods():
+        return multiprocessing.get_context("spawn")
+    context = multiprocessing.get_context("forkserver")
+    context.set_forkserver_preload([__name__])
+    return context
+
 
 class ArxivClient:
 
-    def __init__(self) -> None:
-        self.client = _ArxivClient()
+    _DOWNLOAD_CHUNK_SIZE = 64 * 1024
+    # The arXiv API returns up to 100 results per page, so larger ID lists would be paged anyway
+    _SEARCH_BATCH_SIZE = 100
+    _DOWNLOAD_TIMEOUT = 60
+    # Bounds the downloads for papers whose text repeats arXiv links far beyond a normal bibliography, e.g. surveys
+    _MAX_REFERENCES_PER_PAPER = 200
+
+    def __init__(
+        self,
+        session: requests.Session | None = None,
+        max_workers: int = 8,
+        cache: FileCache | None = None,
+        num_workers: int | None = None,
+    ) -> None:
+        """
+        Args:
+            max_workers: Number of threads downloading PDFs concurrently.
+            num_workers: Number of processes extracting PDF text; 1 extracts it in the downloading threads.
+                Defaults to the number of CPUs, up to 4.
+        """
+        # One API client for all searches, following arXiv's guidance of a 3 second delay between requests
+        self.client = _ArxivClient(page_size=self._SEARCH_BATCH_SIZE, delay_seconds=3, num_retries=3)
+        self.session = session or self.create_session(pool_size=max(16, max_workers))
+        self.max_workers = max_workers
+        self.num_workers = num_workers or min(os.cpu_count() or 1, 4)
+        self._process_pool: ProcessPoolExecutor | None = None
+        self._process_pool_lock = threading.Lock()
+        # Search results keyed by arXiv ID and by query; None marks an ID without a result
+        self._search_cache: dict[str, ArxivResult | None] = {}
+        self._query_cache: dict[str, list[ArxivResult]] = {}
+        self._cache = cache
         self.ensure_ssl_verified()
 
+    @property
+    def cache(self) -> FileCache | None:
+        """Cache of downloaded papers. Versioned arXiv IDs are immutable, so entries never expire."""
+        return self._cache or get_default_cache("papers")
+
     @staticmethod
     def ensure_ssl_verified() -> None:
         ssl._create_default_https_context = ssl._create_unverified_context
 
+    @staticmethod
+    def create_session(pool_size: int = 16) -> requests.Session:
+        """Create a session whose keep-alive connections are reused across PDF downloads."""
+        session = requests.Session()
+        # Retry dropped connections and transient server errors with backoff instead of failing the whole batch
+        retries = Retry(total=3, backoff_factor=0.3, status_forcelist=(429, 500, 502, 503, 504))
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size, max_retries=retries)
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        return session
+
+    @staticmethod
+    def get_pdf_url(paper: ArxivResult) -> str:
+        if not paper.pdf_url:
+            raise ValueError(f"No PDF URL available for paper '{paper.title}'.")
+        return urlparse(paper.pdf_url)._replace(scheme="https", netloc=PDF_DOWNLOAD_DOMAIN).geturl()
+
+    def download_pdf(self, paper: ArxivResult, dirpath: str = "./", filename: str | None = None) -> str:
+        """Download the PDF of the paper through the pooled session and return the file path."""
+        path = os.path.join(dirpath, filename or f"{paper.get_short_id()}.pdf")
+        part_path = f"{path}.part"
+        try:
+            with self.session.get(self.get_pdf_url(paper), stream=True, timeout=self._DOWNLOAD_TIMEOUT) as response:
+                response.raise_for_status()
+                with open(part_path, "wb") as f:
+                    for i, chunk in enumerate(response.iter_content(chunk_size=self._DOWNLOAD_CHUNK_SIZE)):
+                        if i == 0:
+                            self._check_pdf_header(paper, chunk)
+                        f.write(chunk)
+            os.replace(part_path, path)
+        except BaseException:
+            if os.path.exists(part_path):
+                os.remove(part_path)
+            raise
+        return path
+
+    def download_pdf_bytes(self, paper: ArxivResult) -> bytes:
+        """Download the PDF of the paper into memory through the pooled session."""
+        response = self.session.get(self.get_pdf_url(paper), timeout=self._DOWNLOAD_TIMEOUT)
+        response.raise_for_status()
+        self._check_pdf_header(paper, response.content)
+        return response.content
+
+    @staticmethod
+    def _check_pdf_header(paper: ArxivResult, data: bytes) -> None:
+        if not data.startswith(_PDF_MAGIC):
+            raise ValueError(f"The downloaded file of paper '{paper.title}' is not a PDF.")
+
     def search_by_url(self, id_list: list[str]) -> Iterable[ArxivResult]:
-        search = ArxivSearch(id_list=id_list)
-        yield from self.client.results(search=search)
+        """Search the papers by arXiv ID. Papers cited by several papers are only searched once per client."""
+        missing_ids = [id_ for id_ in dict.fromkeys(id_list) if id_ not in self._search_cache]
+        if missing_ids:
+            results = {parse_arxiv_id(result.entry_id): result for result in self._search_by_id_list(missing_ids)}
+            for id_ in missing_ids:
+                self._search_cache[id_] = results.get(id_)
+
+        for id_ in id_list:
+            if (result := self._search_cache[id_]) is not None:
+                yield result
+
+    def _search_by_id_list(self, id_list: list[str], batch_size: int = _SEARCH_BATCH_SIZE) -> Iterable[ArxivResult]:
+        """Search the IDs with one API request per batch, rather than one per paper."""
+        for start in range(0, len(id_list), batch_size):
+            id_batch = id_list[start : start + batch_size]
+            yield from self.client.results(search=ArxivSearch(id_list=id_batch, max_results=len(id_batch)))
 
     def search_by_query(self, queries: Iterable[str]) -> Iterable[ArxivResult]:
         for query in queries:
-            search = ArxivSearch(query=query, max_results=1)
-            yield from self.client.results(search=search)
+            if query not in self._query_cache:
+                self._query_cache[query] = list(self.client.results(search=ArxivSearch(query=query, max_results=1)))
+            yield from self._query_cache[query]
 
     @staticmethod
     def parse_arxiv_id(url: str) -> str:
-        """
-        Extracts the Arxiv ID from a given URL.
+        return parse_arxiv_id(url)
 
-        Args:
-            url (str): The URL containing the Arxiv ID.
+    @staticmethod
+    def extract_id(url: str) -> str | None:
+        return extract_id(url)
 
-        Returns:
-            str: The extracted Arxiv ID.
+    @staticmethod
+    def parse_references(text: str) -> list[str]:
+        return parse_references(text)
 
-        Raises:
-            InvalidArxivURLException: If the URL does not contain an Arxiv ID.
+    @staticmethod
+    def parse_reference_ids(text: str) -> list[str]:
+        return parse_reference_ids(text)
 
-        Example:
-            >>> arxiv_client = ArxivClient()
-            >>> arxiv_client.parse_arxiv_id("https://huggingface.co/papers/2404.01475")
-            '2404.01475'
+    @staticmethod
+    def parse_page_reference_ids(page_texts: Sequence[str]) -> list[str]:
         """
-        match = re.search(r"(\d{4}\.\d{4,5})(v\d+)?", url)
-        if match:
-            return match.group(1)
-        raise InvalidArxivURLException(f"Invalid Arxiv URL: {url}. Expected url should contain Arxiv ID.")
+        Return the arXiv IDs of the referenced papers in document order, scanning the paper page by page.
 
-    @staticmethod
-    def extract_id(url: str) -> str | None:
-        match = re.search(r"(\d{4}\.\d{4,5})(v\d+)?", url)
-        return match.group(1) if match else None
+        Every page is scanned, since a bibliography page may cite no arXiv papers at all; the pages without an
+        arXiv link are skipped without running the regex.
+        """
+        return [id_ for text in page_texts for id_ in parse_reference_ids(text)]
 
-    @staticmethod
-    def parse_references(text: str) -> list[str]:
-        arxiv_urls = re.findall(r"(https?://arxiv\.org/abs/\d{4}\.\d{4,5}(v\d+)?)", text)
-        return [match[0] for match in arxiv_urls]
+    def fetch_metadata_by_url(self, urls: Iterable[str]) -> dict[str, ArxivResult]:
+        """Fetch the metadata of the papers with a single API request, without downloading any PDF.
+
+        Returns the search results keyed by the requested URL; URLs without a result are left out.
+        """
+        id_by_url = {url: parse_arxiv_id(url) for url in urls}
+        if not id_by_url:
+            return {}
+
+        results = {parse_arxiv_id(result.entry_id): result for result in self.search_by_url(list(dict.fromkeys(id_by_url.values())))}
+        return {url: results[id_] for url, id_ in id_by_url.items() if id_ in results}
 
     def fetch_papers_by_url(self, urls: Iterable[str]) -> list[Paper]:
-        id_list = list(filter(None, (self.parse_arxiv_id(url) for url in urls)))
-
-        papers = []
-        for paper in self.search_by_url(id_list):
-            with tempfile.TemporaryDirectory() as temp_dir:
-                pdf_path = paper.download_pdf(dirpath=temp_dir)
-                doc = cast(fitz.Document, fitz.open(pdf_path))
-                try:
-                    text = "".join([page.get_text() for page in doc])  # type: ignore
-                finally:
-                    doc.close()  # Ensure document is closed before temp dir cleanup
-
-            papers.append(
-                Paper(
-                    title=paper.title,
-                    text=text,
-                    url=paper.entry_id,
-                    authors=[author.name for author in paper.authors],
-                    published=paper.published.isoformat() if paper.published else None,
-                )
-            )  # type: ignore
-
-        return papers
+        # Deduplicate while keeping the order, so the same paper is not searched and downloaded twice
+        id_list = list(dict.fromkeys(filter(None, (parse_arxiv_id(url) for url in urls))))
+        return self.fetch_papers_by_id(id_list)
+
+    def fetch_papers_by_id(self, id_list: list[str]) -> list[Paper]:
+        if not id_list:
+            return []
+        return self._fetch_all(list(self.search_by_url(id_list)))
+
+    def _fetch_all(self, results: list[ArxivResult]) -> list[Paper]:
+        """Download and parse the papers concurrently, keeping the order of the results."""
+        return [paper for paper, _ in self._fetch_all_with_pages(results)]
+
+    def _fetch_all_with_pages(self, results: list[ArxivResult]) -> list[tuple[Paper, list[str] | None]]:
+        if len(results) <= 1:
+            return [self._fetch_one(result) for result in results]
+
+        # Downloading is I/O-bound, so it runs in threads
+        with ThreadPoolExecutor(max_workers=min(self.max_workers, len(results))) as executor:
+            if self.num_workers <= 1:
+                return list(executor.map(self._fetch_one, results))
+
+            # Text extraction is CPU-bound inside MuPDF, so each PDF is handed to a worker process as soon as it arrives.
+            # The download threads never wait for parsing, so downloading and parsing overlap across papers.
+            process_pool = self._get_process_pool()
+            download_futures = {executor.submit(self._load_cached_or_download, result): index for index, result in enumerate(results)}
+            fetched: list[tuple[Paper, list[str] | None] | None] = [None] * len(results)
+            parse_futures: dict[int, Future[list[str]]] = {}
+            for download_future in as_completed(download_futures):
+                index = download_futures[download_future]
+                cached_paper, pdf_bytes = download_future.result()
+                if cached_paper is not None:
+                    fetched[index] = (cached_paper, None)
+                else:
+                    parse_futures[index] = process_pool.submit(_parse_pdf_pages, cast(bytes, pdf_bytes))
+
+            for index, parse_future in parse_futures.items():
+                page_texts = parse_future.result()
+                fetched[index] = (self._store_paper(results[index], page_texts), page_texts)
+            return cast(list[tuple[Paper, list[str] | None]], fetched)
+
+    def _get_process_pool(self) -> ProcessPoolExecutor:
+        """Return the text extraction pool, created on first use and reused by later fetches.
+
+        Forking a process that is running download threads can deadlock the child, so the workers are forked from a
+        single-threaded fork server instead. It imports this module once, so workers do not each import the package.
+        Platforms without a fork server spawn the workers.
+        """
+        with self._process_pool_lock:
+            if self._process_pool is None:
+                self._process_pool = ProcessPoolExecutor(max_workers=self.num_workers, mp_context=_get_worker_context())
+            return self._process_pool
+
+    def close(self) -> None:
+        """Shut down the text extraction worker processes, if any were started."""
+        with self._process_pool_lock:
+            if self._process_pool is not None:
+                self._process_pool.shutdown()
+                self._process_pool = None
+
+    def _fetch_one(self, paper: ArxivResult) -> tuple[Paper, list[str] | None]:
+        """Fetch the paper, together with the text of each page when the PDF was parsed (None on a cache hit)."""
+        cached_paper, pdf_bytes = self._load_cached_or_download(paper)
+        if cached_paper is not None:
+            return cached_paper, None
+
+        page_texts = _parse_pdf_pages(cast(bytes, pdf_bytes))
+        return self._store_paper(paper, page_texts), page_texts
+
+    def _load_cached_or_download(self, paper: ArxivResult) -> tuple[Paper | None, bytes | None]:
+        """Return the cached paper, or download its PDF on a cache miss."""
+        cache = self.cache
+        if cache is not None and (cached_paper := cache.get(paper.get_short_id())) is not None:
+            return Paper.model_validate(cached_paper), None
+        return None, self.download_pdf_bytes(paper)
+
+    def _store_paper(self, paper: ArxivResult, page_texts: list[str]) -> Paper:
+        result = self._build_paper(paper, "".join(page_texts))
+        if (cache := self.cache) is not None:
+            cache.set(paper.get_short_id(), result.model_dump(mode="json"))
+        return result
+
+    @classmethod
+    def _parse_paper(cls, paper: ArxivResult, pdf_bytes: bytes) -> Paper:
+        return cls._build_paper(paper, "".join(_parse_pdf_pages(pdf_bytes)))
+
+    @staticmethod
+    def _build_paper(paper: ArxivResult, text: str) -> Paper:
+        return Paper(
+            title=paper.title,
+            text=text,
+            url=paper.entry_id,
+            authors=[author.name for author in paper.authors],
+            published=paper.published.isoformat() if paper.published else None,
+        )  # type: ignore
 
     def fetch_papers_with_references_by_url(self, urls: Iterable[str]) -> list[Paper]:
-        parent_papers = self.fetch_papers_by_url(urls)
+        id_list = list(dict.fromkeys(filter(None, (parse_arxiv_id(url) for url in urls))))
+        if not id_list:
+            return []
+        return self._fetch_with_references(list(self.search_by_url(id_list)))
+
+    def _fetch_with_references(self, results: list[ArxivResult]) -> list[Paper]:
+        fetched = self._fetch_all_with_pages(results)
+        parent_papers = [paper for paper, _ in fetched]
+        # Pages without arXiv links are skipped when the pages are at hand; cached papers keep just the full text
+        reference_ids_by_paper = [
+            self.parse_page_reference_ids(page_texts) if page_texts is not None else parse_reference_ids(paper.text)
+            for paper, page_texts in fetched
+        ]
+        self._attach_references(parent_papers, reference_ids_by_paper)
+        return parent_papers
 
-        for paper in parent_papers:
-            reference_urls = self.parse_references(paper.text)
-            if reference_urls:
-                referenced_papers = self.fetch_papers_by_url(reference_urls)
-                paper.references = referenced_papers
+    def _attach_references(self, parent_papers: list[Paper], reference_ids_by_paper: list[list[str]]) -> None:
+        """Fetch the references of all papers at once, so papers cited by several parents are fetched only once."""
+        reference_ids_by_paper = [
+            list(islice(dict.fromkeys(reference_ids), self._MAX_REFERENCES_PER_PAPER)) for reference_ids in reference_ids_by_paper
+        ]
+        all_reference_ids = list(dict.fromkeys(id_ for reference_ids in reference_ids_by_paper for id_ in reference_ids))
+        if not all_reference_ids:
+            return
 
-        return parent_papers
+        papers_by_id = {parse_arxiv_id(str(paper.url)): paper for paper in self.fetch_papers_by_id(all_reference_ids)}
+        for paper, reference_ids in zip(parent_papers, reference_ids_by_paper):
+            if reference_ids:
+                paper.references = [papers_by_id[id_] for id_ in reference_ids if id_ in papers_by_id]
 
     def fetch_papers_by_query(self, queries: Iterable[str]) -> list[Paper]:
-        papers = []
+        return self._fetch_all(self._search_exact_titles(queries))
+
+    def _search_exact_titles(self, queries: Iterable[str]) -> list[ArxivResult]:
+        """Search each query and keep only the results whose title matches the query exactly."""
+        results = []
         for requested_query in queries:
-            results = self.search_by_query([requested_query])
-            for paper in results:
-                if paper.title.lower() != requested_query.lower():
+            normalized_query = requested_query.lower()
+            for paper in self.search_by_query([requested_query]):
+                if paper.title.lower() != normalized_query:
                     continue
-                with tempfile.TemporaryDirectory() as temp_dir:
-                    pdf_path = paper.download_pdf(dirpath=temp_dir)
-                    doc = cast(fitz.Document, fitz.open(pdf_path))
-                    try:
-                        text = "".join([page.get_text() for page in doc])  # type: ignore
-                    finally:
-                        doc.close()  # Ensure document is closed before temp dir cleanup
-                papers.append(
-                    Paper(
-                        title=paper.title,
-                        text=text,
-                        url=paper.entry_id,
-                        authors=[author.name for author in paper.authors],
-                        published=paper.published.isoformat() if paper.published else None,
-                    )
-                )  # type: ignore
-
-        return papers
+                results.append(paper)
+        return results
 
     def fetch_papers_with_references_by_query(self, queries: Iterable[str]) -> list[Paper]:
-        parent_papers = self.fetch_papers_by_query(queries)
-
-        for paper in parent_papers:
-            reference_urls = self.parse_references(paper.text)
-            if reference_urls:
-                referenced_papers = self.fetch_papers_by_url(reference_urls)
-                paper.references = referenced_papers
-
-        return parent_papers
+        return self._fetch_with_references(self._search_exact_titles(queries))
 
     def download_papers_by_url(self, urls: str | Iterable[str], save_dir: str) -> None:
-        id_list = list(filter(None, (self.parse_arxiv_id(url) for url in urls)))
-
-        for paper in self.search_by_url(id_list):
-            filename = re.sub(r"\W+", "_", paper.title) + ".pdf"
-            paper.download_pdf(dirpath=save_dir, filename=filename)
+        id_list = list(dict.fromkeys(filter(None, (parse_arxiv_id(url) for url in urls))))
+        self._download_all(list(self.search_by_url(id_list)), save_dir)
 
     def download_papers_by_query(self, queries: str | Iterable[str], save_dir: str) -> None:
-        for requested_query in queries:
-            results = self.search_by_query([requested_query])
+        self._download_all(self._search_exact_titles(queries), save_dir)
+
+    def _download_all(self, results: list[ArxivResult], save_dir: str) -> None:
+        def download(paper: ArxivResult) -> str:
+            filename = _NONWORD_RE.sub("_", paper.title) + ".pdf"
+            return self.download_pdf(paper, dirpath=save_dir, filename=filename)
+
+        if len(results) <= 1:
             for paper in results:
-                if paper.title.lower() != requested_query.lower():
-                    continue
-                filename = re.sub(r"\W+", "_", paper.title) + ".pdf"
-                paper.download_pdf(dirpath=save_dir, filename=filename)
+                download(paper)
+            return
+
+        with ThreadPoolExecutor(max_workers=min(self.max_workers, len(results))) as executor:
+            list(executor.map(download, results))
 
     def load_paper_as_file_by_url(self, url: str) -> io.BytesIO | None:
         if not isinstance(url, str):
             raise ValueError("Only one URL is allowed.")
 
-        id_ = self.parse_arxiv_id(url)
+        id_ = parse_arxiv_id(url)
         if id_ is None:
             return None
 
         for paper in self.search_by_url([id_]):
-            with tempfile.TemporaryDirectory() as temp_dir:
-                pdf_path = paper.download_pdf(dirpath=temp_dir)
-                with open(pdf_path, "rb") as f:
-                    return io.BytesIO(f.read())
+            return io.BytesIO(self._load_pdf_bytes(paper))
         return None
 
+    def fetch_paper_with_pdf_by_url(self, url: str) -> tuple[Paper, bytes] | None:
+        """Fetch a paper together with its PDF, so the PDF can be processed further without downloading it again."""
+        for result in self.search_by_url([parse_arxiv_id(url)]):
+            pdf_bytes = self._load_pdf_bytes(result)
+            return self._parse_paper(result, pdf_bytes), pdf_bytes
+        return None
+
+    def _load_pdf_bytes(self, paper: ArxivResult) -> bytes:
+        cache = self.cache
+        if cache is not None and (pdf_bytes := cache.get_bytes(paper.get_short_id())) is not None:
+            return pdf_bytes
+
+        pdf_bytes = self.download_pdf_bytes(paper)
+        if cache is not None:
+            cache.set_bytes(paper.get_short_id(), pdf_bytes)
+        return pdf_bytes
+
 
 arxiv_client = ArxivClient()
 
 
 def fetch_papers_by_url(urls: str | Iterable[str], parse_reference: bool = False) -> list[Paper]:
-    if isinstance(urls, str):
-        urls = [urls]
-
-    urls = list(flatten([urls]))
+    urls = [urls] if isinstance(urls, str) else list(urls)
 
     if parse_reference:
         return arxiv_client.fetch_papers_with_references_by_url(urls)
@@ -191,11 +484,13 @@ def fetch_papers_by_url(urls: str | Iterable[str], parse_reference: bool = False
     return arxiv_client.fetch_papers_by_url(urls)
 
 
-def fetch_papers_by_query(queries: str | Iterable[str], parse_reference: bool = False) -> list[Paper]:
-    if isinstance(queries, str):
-        queries = [queries]
+def fetch_metadata_by_url(urls: str | Iterable[str]) -> dict[str, ArxivResult]:
+    urls = [urls] if isinstance(urls, str) else list(urls)
+    return arxiv_client.fetch_metadata_by_url(urls)
 
-    queries = list(flatten([queries]))
+
+def fetch_papers_by_query(queries: str | Iterable[str], parse_reference: bool = False) -> list[Paper]:
+    queries = [queries] if isinstance(queries, str) else list(queries)
 
     if parse_reference:
         return arxiv_client.fetch_papers_with_references_by_query(queries)
@@ -204,18 +499,12 @@ def fetch_papers_by_query(queries: str | Iterable[str], parse_reference: bool =
 
 
 def load_papers_by_url(urls: str | Iterable[str], save_dir: str = "./") -> None:
-    if isinstance(urls, str):
-        urls = [urls]
-
-    urls = list(flatten([urls]))
+    urls = [urls] if isinstance(urls, str) else list(urls)
     arxiv_client.download_papers_by_url(urls, save_dir)
 
 
 def load_papers_by_query(queries: str | Iterable[str], save_dir: str = "./") -> None:
-    if isinstance(queries, str):
-        queries = [queries]
-
-    queries = list(flatten([queries]))
+    queries = [queries] if isinstance(queries, str) else list(queries)
     arxiv_client.download_papers_by_query(queries, save_dir)
 
 
@@ -223,5 +512,23 @@ def load_paper_as_file_by_url(urls: str) -> io.BytesIO | None:
     return arxiv_client.load_paper_as_file_by_url(urls)
 
 
+def fetch_paper_with_pdf_by_url(url: str) -> tuple[Paper, bytes] | None:
+    return arxiv_client.fetch_paper_with_pdf_by_url(url)
+
+
 def extract_refs(papers: Iterable[Paper]) -> list[Paper]:
-    return list(unique_everseen(flatten([paper.flatten() for paper in papers])))
+    """Return the papers and all their nested references once each, in depth-first order."""
+    # Papers are unhashable, so deduplicating by equality would compare each paper with every paper seen so far;
+    # shared references are the same objects, so their identity is enough
+    refs = []
+    seen: set[int] = set()
+    queue = deque(papers)
+    while queue:
+        paper = queue.popleft()
+        if id(paper) in seen:
+            continue
+        seen.add(id(paper))
+        refs.append(paper)
+        if paper.references:
+            queue.extendleft(reversed(paper.references))
+    return refs
@@ -0,0 +1,79 @@
+"""OpenAI Batch API helpers."""
+
+from __future__ import annotations
+
+import json
+import time
+from typing import Iterable, get_args
+
+from openai import OpenAI
+from openai.types import Batch
+
+from arxiv_paper_summarizer.prompt_function import OpenAIModel
+from arxiv_paper_summarizer.types import LLM_TYPE, BatchRequest
+from arxiv_paper_summarizer.utils import get_env_var
+
+BATCH_ENDPOINT = "/v1/chat/completions"
+_FINAL_BATCH_STATUSES = {"completed", "failed", "expired", "cancelled"}
+# The Batch API only serves OpenAI's own models, not the other models reachable through an OpenAI-compatible proxy
+BATCH_MODEL_NAMES = frozenset(get_args(OpenAIModel))
+
+
+def get_llm() -> LLM_TYPE:
+    return OpenAI(
+        api_key=get_env_var("OPENAI_API_KEY"),
+        base_url=get_env_var("OPENAI_BASE_URL"),
+    )
+
+
+def submit_batch(requests: Iterable[BatchRequest], llm: LLM_TYPE | None = None) -> str:
+    """Upload the requests as a JSONL file and create a batch. Returns the batch ID."""
+    requests = list(requests)
+    if unsupported_models := {request.body.get("model") for request in requests} - BATCH_MODEL_NAMES:
+        raise ValueError(f"The Batch API does not serve the models {sorted(map(str, unsupported_models))}; use one of {sorted(BATCH_MODEL_NAMES)}.")
+
+    llm = llm or get_llm()
+    lines = [json.dumps({"custom_id": request.custom_id, "method": "POST", "url": BATCH_ENDPOINT, "body": request.body}) for request in requests]
+    if not lines:
+        raise ValueError("At least one request is required to create a batch.")
+
+    input_file = llm.files.create(file=("requests.jsonl", "\n".join(lines).encode("utf-8")), purpose="batch")
+    batch = llm.batches.create(input_file_id=input_file.id, endpoint=BATCH_ENDPOINT, completion_window="24h")
+    return batch.id
+
+
+def wait_for_batch(batch_id: str, llm: LLM_TYPE | None = None, poll_interval: float = 60.0) -> Batch:
+    """Poll the batch until it reaches a final status."""
+    llm = llm or get_llm()
+    while (batch := llm.batches.retrieve(batch_id)).status not in _FINAL_BATCH_STATUSES:
+        time.sleep(poll_interval)
+
+    if batch.status != "completed" or batch.output_file_id is None:
+        raise RuntimeError(f"Batch '{batch_id}' finished with status '{batch.status}'.")
+    return batch
+
+
+def load_batch_results(batch: Batch, llm: LLM_TYPE | None = None) -> dict[str, str]:
+    """Return the message content of each successful response, keyed by custom ID."""
+    llm = llm or get_llm()
+    if batch.output_file_id is None:
+        return {}
+
+    results: dict[str, str] = {}
+    for line in llm.files.content(batch.output_file_id).text.splitlines():
+        if not line.strip():
+            continue
+        record = json.loads(line)
+        response = record.get("response") or {}
+        if response.get("status_code") != 200:
+            continue
+        results[record["custom_id"]] = response["body"]["choices"][0]["message"]["content"]
+    return results
+
+
+def run_batch(requests: Iterable[BatchRequest], llm: LLM_TYPE | None = None, poll_interval: float = 60.0) -> dict[str, str]:
+    """Submit the requests through the Batch API and block until the results are available."""
+    llm = llm or get_llm()
+    batch_id = submit_batch(requests, llm)
+    batch = wait_for_batch(batch_id, llm, poll_interval)
+    return load_batch_results(batch, llm)
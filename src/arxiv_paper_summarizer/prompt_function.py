@@ -24,9 +24,21 @@ from typing import (
     overload,
 )
 
-from openai import AsyncAzureOpenAI, AsyncOpenAI, AzureOpenAI, OpenAI
+from openai import (
+    APIConnectionError,
+    APITimeoutError,
+    AsyncAzureOpenAI,
+    AsyncOpenAI,
+    AzureOpenAI,
+    InternalServerError,
+    OpenAI,
+    RateLimitError,
+)
 from openai.types.chat import ChatCompletion
+from pydantic import BaseModel
+from tenacity import retry, retry_if_exception_type, stop_after_attempt, wait_exponential_jitter
 
+from arxiv_paper_summarizer.cache import FileCache, get_default_cache, make_cache_key
 from arxiv_paper_summarizer.message import (
     AIMessage,
     Message,
@@ -34,7 +46,7 @@ from arxiv_paper_summarizer.message import (
     SystemMessage,
     UserMessage,
 )
-from arxiv_paper_summarizer.utils import get_env_var, split_union_type
+from arxiv_paper_summarizer.utils import compute_token, get_env_var, split_union_type
 
 P = ParamSpec("P")
 R = TypeVar("R", covariant=True)
@@ -42,6 +54,23 @@ MessageLikeType: TypeAlias = Union[str, tuple[str, str], Message[Any]]
 LLM_Type: TypeAlias = Union[OpenAI, AzureOpenAI, AsyncOpenAI, AsyncAzureOpenAI, Any]
 OpenAIModel: TypeAlias = Literal["gpt-4o", "gpt-4o-mini", "gpt-3.5-turbo"]
 
+MIN_REQUEST_TIMEOUT = 60.0
+REQUEST_TIMEOUT_PER_TOKEN = 0.05
+
+# Retry transient API failures (timeouts, dropped connections, rate limits and 5xx responses) with jittered backoff,
+# so a single failed request does not throw away the rest of the work done for a paper.
+retry_on_api_error = retry(
+    wait=wait_exponential_jitter(initial=1, max=30),
+    stop=stop_after_attempt(5),
+    retry=retry_if_exception_type((APITimeoutError, APIConnectionError, RateLimitError, InternalServerError)),
+    reraise=True,
+)
+
+
+def get_request_timeout(text: str) -> float:
+    """Scale the request timeout with the prompt size, so requests for long papers are not cut off."""
+    return max(MIN_REQUEST_TIMEOUT, REQUEST_TIMEOUT_PER_TOKEN * compute_token(text))
+
 
 class AsyncPromptFunction(Protocol[P, R]):
     async def __call__(self, *args: P.args, **kwargs: P.kwargs) -> R: ...
@@ -72,6 +101,7 @@ class BaseOpenAIPromptFunction(Generic[P, R]):
         model_name: OpenAIModel | None = None,
         response_format: Any | None = None,
         temperature: float | None = None,
+        cache: FileCache | None = None,
     ) -> None:
         self._name = name
         self._llm = llm
@@ -84,6 +114,7 @@ class BaseOpenAIPromptFunction(Generic[P, R]):
         self._return_types = split_union_type(return_type)
         self._response_format = response_format
         self._temperature = temperature or 0.5
+        self._cache = cache
 
     @property
     def return_types(self) -> Sequence[type[R]]:
@@ -95,7 +126,10 @@ class BaseOpenAIPromptFunction(Generic[P, R]):
 
     @property
     def llm(self) -> LLM_Type:
-        return self._llm or self.get_llm()
+        # Built once, so that all the requests of the prompt share one connection pool
+        if self._llm is None:
+            self._llm = self.get_llm()
+        return self._llm
 
     @property
     def response_format(self) -> Any | None:
@@ -105,6 +139,10 @@ class BaseOpenAIPromptFunction(Generic[P, R]):
     def temperature(self) -> float:
         return self._temperature
 
+    @property
+    def cache(self) -> FileCache | None:
+        return self._cache or get_default_cache()
+
     def get_model_name(self) -> str:
         return "gpt-4o"
 
@@ -141,6 +179,10 @@ class BaseOpenAIPromptFunction(Generic[P, R]):
 
         raise TypeError(f"Invalid message type: {type(message)}. Expected str, tuple, or Message instance.")
 
+    def build_request(self, *args: P.args, **kwargs: P.kwargs) -> dict[str, Any]:
+        """Build the chat completion request body without sending it, e.g. for the OpenAI Batch API."""
+        return {"model": self.model_name, "messages": list(self.format(*args, **kwargs))}
+
     def get_bound_args(self, *args: P.args, **kwargs: P.kwargs) -> OrderedDict[str, Any]:
         """Get the bound arguments for the function."""
         bound_args = self._signature.bind(*args, **kwargs)
@@ -149,9 +191,33 @@ class BaseOpenAIPromptFunction(Generic[P, R]):
         bound_args.arguments.pop("self", None)  # Avoid passing `self` twice
         return bound_args.arguments
 
+    def get_timeout(self, messages: Iterable[OpenAIMessageType]) -> float:
+        return get_request_timeout("".join(content for message in messages if isinstance(content := message.get("content"), str)))
+
     def parse_completion_content(self, completion: ChatCompletion) -> R:
         return cast(R, completion.choices[0].message.content)
 
+    def get_cache_key(self, messages: Iterable[OpenAIMessageType]) -> str:
+        response_format = getattr(self.response_format, "__name__", self.response_format)
+        return make_cache_key(self.model_name, list(messages), self.temperature, response_format)
+
+    def load_cached_result(self, key: str) -> R | None:
+        """Return the cached response for the key, or None on a cache miss."""
+        if (cache := self.cache) is None or (value := cache.get(key)) is None:
+            return None
+        if isinstance(self.response_format, type) and issubclass(self.response_format, BaseModel):
+            # Anything but a dumped model, e.g. a refusal cached by an older version, is treated as a miss
+            return cast(R, self.response_format.model_validate(value)) if isinstance(value, dict) else None
+        return cast(R, value)
+
+    def save_cached_result(self, key: str, result: R) -> None:
+        if (cache := self.cache) is None or result is None:
+            return
+        # A refusal is returned as a plain string; caching it would replay the refusal on every retry and later run
+        if isinstance(self.response_format, type) and not isinstance(result, self.response_format):
+            return
+        cache.set(key, result.model_dump(mode="json") if isinstance(result, BaseModel) else result)
+
     def __call__(self, *args: P.args, **kwargs: P.kwargs):
         """OpenAI prompt function."""
         return NotImplemented
@@ -164,14 +230,36 @@ class AsyncOpenAIPromptFunction(BaseOpenAIPromptFunction[P, R], Generic[P, R], A
     async def __call__(self, *args: P.args, **kwargs: P.kwargs) -> R:
         """Async OpenAI prompt function."""
         messages = self.format(*args, **kwargs)
+        cache_key = self.get_cache_key(messages)
+        if (cached_result := self.load_cached_result(cache_key)) is not None:
+            return cached_result
+
+        if (llm := self._llm or self.get_instance_llm(*args, **kwargs)) is not None:
+            result = await self._complete(llm, messages)
+        else:
+            # An async client is bound to the event loop it first ran on, so a standalone prompt closes its own
+            async with self.get_llm() as llm:
+                result = await self._complete(llm, messages)
+        self.save_cached_result(cache_key, result)
+        return result
+
+    def get_instance_llm(self, *args: P.args, **kwargs: P.kwargs) -> LLM_Type | None:
+        """Return the client of the instance a prompt method is bound to, e.g. the summarizer, to share its connection pool."""
+        instance = self._signature.bind_partial(*args, **kwargs).arguments.get("self")
+        return getattr(instance, "llm", None)
+
+    @retry_on_api_error
+    async def _complete(self, llm: LLM_Type, messages: Iterable[OpenAIMessageType]) -> R:
+        timeout = self.get_timeout(messages)
         if self.response_format:
             chat_completion = await cast(
                 ChatCompletion,
-                self.llm.beta.chat.completions.parse(
+                llm.beta.chat.completions.parse(
                     model=self.model_name,
                     messages=messages,
                     response_format=self.response_format,
                     temperature=self.temperature,
+                    timeout=timeout,
                 ),
             )  # type: ignore[misc]
             message = chat_completion.choices[0].message
@@ -179,9 +267,10 @@ class AsyncOpenAIPromptFunction(BaseOpenAIPromptFunction[P, R], Generic[P, R], A
                 return cast(R, message.refusal)
             return cast(R, message.parsed)  # type: ignore[attr-defined]
 
-        chat_completion = await self.llm.chat.completions.create(
+        chat_completion = await llm.chat.completions.create(
             model=self.model_name,
             messages=messages,
+            timeout=timeout,
         )  # type: ignore[misc]
         return cast(R, self.parse_completion_content(chat_completion))
 
@@ -197,6 +286,17 @@ class OpenAIPromptFunction(BaseOpenAIPromptFunction[P, R], Generic[P, R], Prompt
     def __call__(self, *args: P.args, **kwargs: P.kwargs) -> R:
         """OpenAI prompt function."""
         messages = self.format(*args, **kwargs)
+        cache_key = self.get_cache_key(messages)
+        if (cached_result := self.load_cached_result(cache_key)) is not None:
+            return cached_result
+
+        result = self._complete(messages)
+        self.save_cached_result(cache_key, result)
+        return result
+
+    @retry_on_api_error
+    def _complete(self, messages: Iterable[OpenAIMessageType]) -> R:
+        timeout = self.get_timeout(messages)
         if self.response_format:
             chat_completion = cast(
                 ChatCompletion,
@@ -205,6 +305,7 @@ class OpenAIPromptFunction(BaseOpenAIPromptFunction[P, R], Generic[P, R], Prompt
                     messages=messages,
                     response_format=self.response_format,
                     temperature=self.temperature,
+                    timeout=timeout,
                 ),
             )
             message = chat_completion.choices[0].message
@@ -217,6 +318,7 @@ class OpenAIPromptFunction(BaseOpenAIPromptFunction[P, R], Generic[P, R], Prompt
             self.llm.chat.completions.create(
                 model=self.model_name,
                 messages=messages,
+                timeout=timeout,
             ),
         )
         return cast(R, self.parse_completion_content(chat_completion))
@@ -229,12 +331,25 @@ class OpenAIPromptFunction(BaseOpenAIPromptFunction[P, R], Generic[P, R], Prompt
         )
 
 
+def build_request(prompt: Callable[..., Any], *args: Any, **kwargs: Any) -> dict[str, Any]:
+    """Build the chat completion request body of a prompt function without sending it, e.g. for the OpenAI Batch API.
+
+    Prompt methods can be passed as accessed through their instance, e.g. `build_request(self._extract_keynote, text)`.
+    """
+    if isinstance(prompt, MethodType) and isinstance(prompt.__func__, BaseOpenAIPromptFunction):
+        return prompt.__func__.build_request(prompt.__self__, *args, **kwargs)
+    if isinstance(prompt, BaseOpenAIPromptFunction):
+        return prompt.build_request(*args, **kwargs)
+    raise TypeError(f"Expected a prompt function, got {type(prompt)}.")
+
+
 def openai_prompt(
     *messages: MessageLikeType,
     llm: LLM_Type | None = None,
     model_name: OpenAIModel | None = None,
     response_format: Any | None = None,
     temperature: float | None = None,
+    cache: FileCache | None = None,
 ) -> PromptDecorator:
     def decorator(
         func: Callable[P, Awaitable[R]] | Callable[P, R],
@@ -250,6 +365,7 @@ def openai_prompt(
                 model_name=model_name,
                 response_format=response_format,
                 temperature=temperature,
+                cache=cache,
             )
             return cast(
                 AsyncOpenAIPromptFunction[P, R],
@@ -265,6 +381,7 @@ def openai_prompt(
             model_name=model_name,
             response_format=response_format,
             temperature=temperature,
+            cache=cache,
         )
         return cast(OpenAIPromptFunction[P, R], update_wrapper(prompt_func, func))
 
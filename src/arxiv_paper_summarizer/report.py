@@ -6,10 +6,47 @@ from typing import cast
 import markdown2
 from weasyprint import HTML
 
-from arxiv_paper_summarizer.translation import translate_quote, translate_text
+from arxiv_paper_summarizer.translation import translate_quote, translate_text, translate_texts
 from arxiv_paper_summarizer.types import Language, Paper, SectionNote
 from arxiv_paper_summarizer.utils import encode_image
 
+_REPORT_CSS = """
+        blockquote {
+            font-style: italic;
+            color: #555555;
+            padding: 10px 20px;
+            margin: 20px 0;
+            border-left: 4px solid #cccccc;
+            background-color: #f9f9f9;
+        }
+        """
+
+_REPORT_TEMPLATE = """
+        <html>
+        <head>
+            <style>{css}</style>
+        </head>
+        <body>
+            {body}
+        </body>
+        </html>
+        """
+
+
+def write_pdf(html_content: str, output_path: str | Path) -> None:
+    """Render the HTML to a PDF file, without any LLM calls, so it can run in a worker process."""
+    pdf_bytes = HTML(string=html_content).write_pdf()
+
+    # Write to a temporary file and rename it, so a failed or interrupted write never leaves a partial PDF behind
+    output_path = Path(output_path)
+    part_path = output_path.with_name(f"{output_path.name}.part")
+    try:
+        part_path.write_bytes(pdf_bytes)
+        part_path.replace(output_path)
+    except BaseException:
+        part_path.unlink(missing_ok=True)
+        raise
+
 
 class ReportGenerator:
     """Arxiv Paper Report Generator."""
@@ -27,10 +64,12 @@ class ReportGenerator:
         self._paper = paper
         self._keynote = keynote
         self._section_notes = section_notes
-        self._language = language
+        self._language = self._resolve_language(language)
+        self._is_english = self._language == Language.ENGLISH.value
         self._cover_path = cover_path
 
         self._image_path_set: set[str] = set()
+        self._translations: dict[str, str] = {}
 
     @property
     def paper(self) -> Paper:
@@ -50,37 +89,37 @@ class ReportGenerator:
 
     @property
     def language(self) -> str:
-        if self._language is None:
-            self._language = Language.ENGLISH.value
-        elif isinstance(self._language, Language):
-            self._language = self._language.value
-        elif isinstance(self._language, str):
-            try:
-                self._language = Language(self._language).value
-            except ValueError as e:
-                raise ValueError(f"Language '{self._language}' is not supported. Please use one of {Language.__members__}") from e
         return self._language
 
+    @staticmethod
+    def _resolve_language(language: str | Language | None) -> str:
+        if language is None:
+            return Language.ENGLISH.value
+        if isinstance(language, Language):
+            return language.value
+        try:
+            return Language(language).value
+        except ValueError as e:
+            raise ValueError(f"Language '{language}' is not supported. Please use one of {Language.__members__}") from e
+
     @property
     def cover_path(self) -> str | None:
         if self._cover_path is None:
             return None
         return str(self._cover_path)
 
-    def generate_pdf_report(self, output_path: str) -> None:
+    def generate_pdf_report(self, output_path: str | Path) -> None:
         report_content = self.generate_report_content()
-        html_content = self.generate_html(report_content)
-        html = HTML(string=html_content)
-        html.write_pdf(str(output_path))
+        write_pdf(self.generate_html(report_content), output_path)
 
     def generate_report_content(self) -> str:
-        report_content = ""
         title = self.paper.title
         arxiv_url = self.paper.url
         cover_content = self._generate_image_content([self.cover_path]) if self.cover_path else ""
+        self._prefetch_translations()
         comprehensive_analysis_content = self.generate_comprehensive_analysis_content() if self.section_notes else "No section notes."
 
-        report_content += (
+        return (
             f"# {title} ([arxiv]({arxiv_url}))\n\n"
             f"## Key Highlights\n"
             f"{cover_content}\n"
@@ -90,79 +129,64 @@ class ReportGenerator:
             f"## References\n"
             f"{self.generate_reference_content()}\n\n"
         )
-        return report_content
 
     def generate_keynote_content(self) -> str:
-        return self.keynote if self.language == Language.ENGLISH.value else translate_text(self.keynote, self.language)
+        return self._translate_text(self.keynote)
 
     def generate_comprehensive_analysis_content(self) -> str:
-        content = ""
-        for section in self.section_notes:
-            immediate_content = self._generate_comprehensive_analysis_content(section)
-            content += immediate_content
-        return content
+        return "".join(self._generate_comprehensive_analysis_content(section) for section in self.section_notes)
 
     def _generate_comprehensive_analysis_content(self, section: SectionNote) -> str:
-        content = ""
-        content += f"### {section.header}\n"
-        content += self._generate_image_content(section.image_paths)
-        content += f"{self._translate_text(section.summary_content, self.language)}\n\n"
+        parts = [
+            f"### {section.header}\n",
+            self._generate_image_content(section.image_paths),
+            f"{self._translate_text(section.summary_content)}\n\n",
+        ]
         if section.quotes != self._QUOTES_FLAG:
-            content += f"{self._translate_quote(section.quotes, self.language)}\n\n"
-        content += self._generate_image_content(section.table_paths)
-        return content
+            parts.append(f"{self._translate_quote(section.quotes)}\n\n")
+        parts.append(self._generate_image_content(section.table_paths))
+        return "".join(parts)
 
     def generate_reference_content(self) -> str:
         if self.paper.references is None:
             return "No references found."
 
-        content = ""
-        for reference in self.paper.references:
-            content += f"- [{reference.title}]({reference.url})\n"
-        return content
+        return "".join(f"- [{reference.title}]({reference.url})\n" for reference in self.paper.references)
 
     def _generate_image_content(self, paths: list[str]) -> str:
-        content = ""
+        parts = []
         for path in paths:
             # ensure no duplicate image or table
             if path in self._image_path_set:
                 continue
             encoded_image = encode_image(path)
-            content += f'<img src="data:image/jpeg;base64,{encoded_image}" ' f'style="max-width:100%; height:auto;" alt="Image"/>\n\n'
+            parts.append(f'<img src="data:image/jpeg;base64,{encoded_image}" ' f'style="max-width:100%; height:auto;" alt="Image"/>\n\n')
             self._image_path_set.add(path)
-        return content
+        return "".join(parts)
+
+    def _prefetch_translations(self) -> None:
+        """Translate the keynote and the section summaries in batches, rather than with one request each."""
+        if self._is_english:
+            return
+
+        texts = [section.summary_content for section in self._section_notes or []]
+        if self._keynote is not None:
+            texts.insert(0, self._keynote)
+        texts = [text for text in texts if text not in self._translations]
+        self._translations.update(zip(texts, translate_texts(texts, self.language)))
 
-    def _translate_text(self, text: str, language: str) -> str:
-        if language == Language.ENGLISH.value:
+    def _translate_text(self, text: str) -> str:
+        if self._is_english:
             return text
-        return cast(str, translate_text(text, language))
+        if (translation := self._translations.get(text)) is not None:
+            return translation
+        return cast(str, translate_text(text, self.language))
 
-    def _translate_quote(self, text: str, language: str) -> str:
-        if language == Language.ENGLISH.value:
+    def _translate_quote(self, text: str) -> str:
+        if self._is_english:
             return text
-        return cast(str, translate_quote(text, language))
+        return cast(str, translate_quote(text, self.language))
 
     def generate_html(self, text: str):
-        css = """
-        blockquote {
-            font-style: italic;
-            color: #555555;
-            padding: 10px 20px;
-            margin: 20px 0;
-            border-left: 4px solid #cccccc;
-            background-color: #f9f9f9;
-        }
-        """
         html_body = markdown2.markdown(text)
-
-        html_content = f"""
-        <html>
-        <head>
-            <style>{css}</style>
-        </head>
-        <body>
-            {html_body}
-        </body>
-        </html>
-        """
-        return html_content
+        return _REPORT_TEMPLATE.format(css=_REPORT_CSS, body=html_body)
@@ -0,0 +1,63 @@
+"""Local section splitting of paper text based on numbered headings."""
+
+from __future__ import annotations
+
+import re
+
+from arxiv_paper_summarizer.types import ExtractedSectionResult
+
+# A top-level numbered heading, e.g. "1 Introduction" or "2. Related Work". PDF text extraction often puts
+# the number and the title on separate lines, so a single line break between them is allowed.
+_SECTION_HEADING_RE = re.compile(r"^(?P<number>[1-9]\d?)\.?[ \t]*\n?[ \t]*(?P<title>[A-Z][^\n]{1,59})[ \t]*$", re.MULTILINE)
+_REFERENCES_HEADING_RE = re.compile(r"^[ \t]*(?:References|Bibliography)[ \t]*$", re.MULTILINE | re.IGNORECASE)
+_FIGURE_REF_RE = re.compile(r"\b(?:Figure|Fig\.)[ \t]*(\d+)", re.IGNORECASE)
+_TABLE_REF_RE = re.compile(r"\bTable[ \t]*(\d+)", re.IGNORECASE)
+
+MIN_SECTION_COUNT = 3
+MAX_HEADING_WORDS = 8
+
+
+def split_sections_by_headings(text: str) -> list[ExtractedSectionResult] | None:
+    """
+    Split the paper text into sections at its numbered top-level headings, without an LLM request.
+
+    Headings are only accepted in sequence (1, 2, 3, ...), which filters out page numbers and numbered list items.
+    The references section and everything after it are left out. Each figure and table is assigned to the first
+    section that mentions it.
+
+    Returns:
+        The sections, or None if the headings could not be detected reliably (e.g. scanned or unnumbered papers).
+    """
+    if references_match := _REFERENCES_HEADING_RE.search(text):
+        text = text[: references_match.start()]
+
+    headings: list[re.Match[str]] = []
+    expected_number = 1
+    for match in _SECTION_HEADING_RE.finditer(text):
+        title = match.group("title").strip()
+        if int(match.group("number")) != expected_number or title.endswith(".") or len(title.split()) > MAX_HEADING_WORDS:
+            continue
+        headings.append(match)
+        expected_number += 1
+
+    if len(headings) < MIN_SECTION_COUNT:
+        return None
+
+    sections = []
+    seen_refs: set[str] = set()
+    for heading, next_heading in zip(headings, [*headings[1:], None]):
+        content = text[heading.end() : next_heading.start() if next_heading else len(text)].strip()
+        ref_fig = _collect_refs(_FIGURE_REF_RE, "figure", content, seen_refs)
+        ref_tb = _collect_refs(_TABLE_REF_RE, "table", content, seen_refs)
+        sections.append(ExtractedSectionResult(section=heading.group("title").strip(), content=content, ref_fig=ref_fig, ref_tb=ref_tb))
+    return sections
+
+
+def _collect_refs(pattern: re.Pattern[str], prefix: str, content: str, seen_refs: set[str]) -> list[str]:
+    refs = []
+    for number in pattern.findall(content):
+        ref = f"{prefix}-{number}"
+        if ref not in seen_refs:
+            seen_refs.add(ref)
+            refs.append(ref)
+    return refs
@@ -1,64 +1,220 @@
 """AI Summarizer for arXiv papers."""
 
-import json
+import asyncio
+import io
+import logging
+import multiprocessing
 import tempfile
+import threading
 import warnings
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from datetime import datetime, timezone
+from itertools import chain
 from pathlib import Path
+from typing import Any, Coroutine, TypeVar
 
-from pydantic import TypeAdapter
-from tenacity import retry, retry_if_exception_type, stop_after_attempt
+from more_itertools import chunked
+from pydantic import TypeAdapter, ValidationError
+from tenacity import retry, retry_if_exception_type, stop_after_attempt, wait_exponential
 from unstructured.documents.elements import Element
 from unstructured.partition.pdf import partition_pdf
 
-from arxiv_paper_summarizer.arxiv import fetch_papers_by_url, load_paper_as_file_by_url
-from arxiv_paper_summarizer.prompt_function import openai_prompt
+from arxiv_paper_summarizer.arxiv import fetch_paper_with_pdf_by_url, load_paper_as_file_by_url
+from arxiv_paper_summarizer.cache import FileCache, get_cache, get_default_cache, make_cache_key
+from arxiv_paper_summarizer.prompt_function import build_request, get_request_timeout, openai_prompt, retry_on_api_error
+from arxiv_paper_summarizer.sectioning import split_sections_by_headings
 from arxiv_paper_summarizer.types import (
     LLM_TYPE,
+    BatchRequest,
+    ExtractedSectionList,
     ExtractedSectionResult,
     ImagePath,
     Paper,
     SectionInfo,
     SectionNote,
+    SectionSummaryBatch,
     SummaryResult,
 )
 from arxiv_paper_summarizer.utils import (
     encode_image,
-    extract_json_content,
     get_env_var,
     is_first_figure,
     normalize_image_filename,
     patch_nltk_download,
+    run_sync,
     setup_nltk_offline,
     setup_unstructured_environment,
 )
 
 try:
-    from langfuse.openai import OpenAI
+    from langfuse.openai import AsyncOpenAI
 except ImportError:
-    from openai import OpenAI
+    from openai import AsyncOpenAI
+
+logger = logging.getLogger(__name__)
+
+R = TypeVar("R")
+
+
+def partition_paper_pdf(pdf_bytes: bytes, image_output_dir: str) -> list[Element]:
+    """Partition the paper PDF into elements, extracting its figures and tables into `image_output_dir`."""
+    try:
+        # First attempt with high-resolution strategy
+        try:
+            elements = partition_pdf(
+                file=io.BytesIO(pdf_bytes),
+                strategy="hi_res",
+                infer_table_structure=True,
+                extract_images_in_pdf=True,
+                extract_image_block_types=["Image", "Table"],
+                extract_image_block_to_payload=False,
+                extract_image_block_output_dir=image_output_dir,
+            )
+            return elements
+        except Exception as hi_res_error:
+            error_str = str(hi_res_error).lower()
+
+            # If it's an NLTK/HTTP error, try fallback strategy
+            if ("nltk" in error_str and ("403" in error_str or "forbidden" in error_str)) or "http error 403" in error_str:
+                warnings.warn(f"High-resolution processing failed due to NLTK download issue, trying fallback strategy: {hi_res_error}")
+
+                # Try with a simpler strategy that might not require NLTK
+                try:
+                    elements = partition_pdf(
+                        file=io.BytesIO(pdf_bytes),
+                        strategy="fast",
+                        extract_images_in_pdf=False,  # Disable image extraction to avoid NLTK issues
+                        extract_image_block_types=[],
+                    )
+                    warnings.warn("Using fallback strategy without image extraction due to NLTK issues")
+                    return elements
+                except Exception as fallback_error:
+                    # If fallback also fails, provide comprehensive error message
+                    raise RuntimeError(
+                        "PDF processing failed with both high-resolution and fallback strategies. "
+                        "This appears to be due to NLTK resource download issues in a restricted network environment. "
+                        "To fix this issue:\n"
+                        "1. Pre-download NLTK packages: python -c \"import nltk; nltk.download('punkt'); nltk.download('punkt_tab')\"\n"
+                        "2. Or set NLTK_DATA environment variable to point to existing NLTK data\n"
+                        "3. Or ensure network access for NLTK downloads\n"
+                        f"Original high-res error: {hi_res_error}\n"
+                        f"Fallback error: {fallback_error}"
+                    ) from hi_res_error
+            else:
+                # Re-raise the original error if it's not NLTK-related
+                raise hi_res_error
+
+    except Exception as e:
+        # Check for specific dependency errors
+        error_str = str(e).lower()
+        if "pdfinfo" in error_str or "poppler" in error_str:
+            raise RuntimeError(
+                "PDF processing failed due to missing poppler dependency. "
+                "Please install poppler-utils: 'sudo apt-get install poppler-utils' (Ubuntu/Debian) "
+                "or 'brew install poppler' (macOS). "
+                "For more details, see: https://pdf2image.readthedocs.io/en/latest/installation.html "
+                f"Original error: {e}"
+            ) from e
+        elif "tesseract" in error_str:
+            raise RuntimeError(
+                "PDF processing failed due to missing tesseract dependency. "
+                "Please install tesseract: 'sudo apt-get install tesseract-ocr' (Ubuntu/Debian) "
+                "or 'brew install tesseract' (macOS). "
+                f"Original error: {e}"
+            ) from e
+        else:
+            # If we've already handled NLTK errors above, this is something else
+            raise RuntimeError(f"Failed to process PDF document: {e}") from e
+
+
+def _init_partition_worker() -> None:
+    """Setup NLTK and unstructured environment in the worker process, which may not inherit the patches."""
+    try:
+        setup_unstructured_environment()
+        patch_nltk_download()
+        setup_nltk_offline()
+    except Exception as e:
+        warnings.warn(f"Environment setup encountered issues: {e}")
+
+
+# hi_res layout analysis loads its detection model in every worker, so only a few papers are partitioned at once
+_PARTITION_MAX_WORKERS = 2
+_partition_executor: ProcessPoolExecutor | None = None
+_partition_executor_lock = threading.Lock()
+
+
+def _get_partition_executor(replace_broken: bool = False) -> ProcessPoolExecutor:
+    """Return the process pool shared by all summarizers, creating it on first use.
+
+    The workers are spawned rather than forked: summarizers run alongside thread pools and the asyncio/httpx threads,
+    and forking a multi-threaded process can deadlock the child.
+    """
+    global _partition_executor
+    with _partition_executor_lock:
+        if _partition_executor is None or replace_broken:
+            _partition_executor = ProcessPoolExecutor(
+                max_workers=_PARTITION_MAX_WORKERS,
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=_init_partition_worker,
+            )
+        return _partition_executor
+
+
+# Building a TypeAdapter compiles its validator, so it is done once rather than per paper
+_SECTION_LIST_ADAPTER = TypeAdapter(list[ExtractedSectionResult])
 
 
 class ArxivPaperSummarizer:
     """Summarizer for arXiv papers."""
 
+    _MAX_CONCURRENCY = 8
+    _SECTION_BATCH_SIZE = 4
+    # Bump when the section extraction prompt changes, so that stale cached section lists are not reused
+    _SECTION_PROMPT_VERSION = "v2"
+    _SECTION_MODEL_NAME = "gpt-4o-mini"
+    # Shared by the per-section and the batched section summary prompts, so batching does not change the model
+    _SECTION_SUMMARY_MODEL_NAME = "claude-4-sonnet"
+    _KEYNOTE_MODEL_NAME = "claude-4-sonnet"
+    # The keynote model is not served by the OpenAI Batch API, so batched keynotes use this model instead
+    _BATCH_MODEL_NAME = "gpt-4o"
+
     def __init__(
         self,
         arxiv_url: str,
         llm: LLM_TYPE | None = None,
         extract_section_notes: bool = False,
         verbose: bool = False,  # TODO: Implement verbose mode
+        max_concurrency: int = _MAX_CONCURRENCY,
+        cache_dir: str | Path | None = None,
     ) -> None:
-        """Initialize the summarizer."""
+        """Initialize the summarizer.
+
+        `max_concurrency` bounds how many section batches are summarized at once, and then how many section notes are
+        written at once (each note makes several LLM requests); lower it to stay under the rate limits.
+        `cache_dir` enables caching of the extracted section list, which is the most expensive LLM request of a paper.
+        """
+        if max_concurrency < 1:
+            raise ValueError(f"max_concurrency must be at least 1, got {max_concurrency}.")
+
         self._arxiv_url = arxiv_url
         self._llm = llm
+        # Only a client built by `get_llm` is closed by the summarizer; a client passed in belongs to the caller
+        self._owns_llm = False
         self._extract_section_notes = extract_section_notes
         self._verbose = verbose
+        self._max_concurrency = max_concurrency
+        self._cache_dir = cache_dir
 
         self._paper: Paper | None = None
+        self._pdf_bytes: bytes | None = None
         self._elements: list[Element] | None = None
+        self._elements_future: Future[list[Element]] | None = None
 
         self._img_path_map: dict[str, str] = {}
-        self._image_path_list: list[ImagePath] = []
+        self._image_path_list: list[ImagePath] | None = None
+        self._image_filename_set: set[str] | None = None
+        self._image_encodings: dict[str, str] = {}
         self._image_output_dir = tempfile.mkdtemp()
 
         # Setup NLTK and unstructured environment before processing
@@ -87,26 +243,65 @@ class ArxivPaperSummarizer:
 
     def _post_init(self):
         self._paper = self.get_paper()
-        self._elements = self.get_partition_elements()
-        self._image_path_list = self.get_image_path_list()
+        # The elements are only needed for the section notes, so the PDF is partitioned while the LLM requests run
+        self._elements_future = self._submit_partition()
 
     def summarize(self) -> SummaryResult:
         """Summarize the arXiv paper."""
-        section_list = self.extract_section_list(self.paper.text)
+        return self._run_sync(self._summarize_async())
+
+    async def _summarize_async(self) -> SummaryResult:
+        """Extract the keynote and the section notes concurrently."""
+        keynote, section_notes = await asyncio.gather(
+            self._extract_keynote_async(),
+            self._extract_section_notes_async(),
+        )
+        return SummaryResult(keynote=keynote, section_notes=section_notes)
+
+    async def _extract_section_notes_async(self) -> list[SectionNote]:
+        if not self._extract_section_notes:
+            return []
+
+        section_list = await self._extract_section_list_async(self.paper.text)
+        await self._wait_for_elements()
         section_info_list = self.get_section_info_list(section_list)
-        keynote = self.extract_keynote()
+        # Log counts only: formatting the section infos would walk every base64-encoded image
+        logger.debug("Processing %d sections", len(section_info_list))
+        return await self._extract_section_note_list_async(section_info_list)
 
-        if self._extract_section_notes:
-            section_notes = self.extract_section_note_list(section_info_list)
-        else:
-            section_notes = []
+    def build_batch_requests(self) -> list[BatchRequest]:
+        """Build the LLM requests of this paper that can be submitted through the OpenAI Batch API.
 
-        return SummaryResult(keynote=keynote, section_notes=section_notes)
+        Only the keynote is batched; section notes depend on earlier responses and are written in `apply_batch_responses`.
+        The keynote is written by `get_keynote_model_name(batch=True)`, so it differs from the one `summarize` writes.
+        """
+        body = {**build_request(self._extract_keynote, self.paper.text), "model": self._BATCH_MODEL_NAME}
+        return [BatchRequest(custom_id=self._get_batch_custom_id("keynote"), body=body)]
+
+    def apply_batch_responses(self, responses: dict[str, str]) -> SummaryResult:
+        """Build the summary from the Batch API responses, keyed by custom ID."""
+        custom_id = self._get_batch_custom_id("keynote")
+        if custom_id not in responses:
+            raise RuntimeError(f"No batch response found for the keynote of '{self.arxiv_url}'.")
+
+        section_notes = self._run_sync(self._extract_section_notes_async())
+        return SummaryResult(keynote=responses[custom_id], section_notes=section_notes)
+
+    @classmethod
+    def get_keynote_model_name(cls, batch: bool = False) -> str:
+        """Return the model that writes the keynote, through the Batch API if `batch` is set."""
+        return cls._BATCH_MODEL_NAME if batch else cls._KEYNOTE_MODEL_NAME
+
+    def _get_batch_custom_id(self, name: str) -> str:
+        return f"{self.paper.url}#{name}"
 
     def extract_keynote(self) -> str:
         """Extract the keynote of the paper."""
+        return self._run_sync(self._extract_keynote_async())
+
+    async def _extract_keynote_async(self) -> str:
         try:
-            return self._extract_keynote(self.paper.text)  # type: ignore
+            return await self._extract_keynote(self.paper.text)  # type: ignore
         except Exception as e:
             error_msg = f"Failed to extract keynote from paper: {e}"
             warnings.warn(error_msg)
@@ -115,19 +310,56 @@ class ArxivPaperSummarizer:
 
     def extract_section_note_list(self, section_info_list: list[SectionInfo]) -> list[SectionNote]:
         """Extract the section notes of the paper."""
-        try:
-            section_note_list = [self._write_section_note(section) for section in section_info_list]
-            return TypeAdapter(list[SectionNote]).validate_python(section_note_list)
-        except Exception as e:
-            warnings.warn(f"Error in writing comprehensive analysis note: {e}")
-            return []
+        return self._run_sync(self._extract_section_note_list_async(section_info_list))
+
+    async def _extract_section_note_list_async(self, section_info_list: list[SectionInfo]) -> list[SectionNote]:
+        """Write the section notes concurrently, with at most `max_concurrency` batches, then notes, in progress."""
+        semaphore = asyncio.Semaphore(self._max_concurrency)
+
+        async def summarize_section_batch(batch: list[SectionInfo]) -> list[str | None]:
+            async with semaphore:
+                try:
+                    return await self.summarize_section_batch(batch)
+                except Exception as e:
+                    warnings.warn(f"Error in batch summarizing sections, falling back to one request per section: {e}")
+                    return [None] * len(batch)
+
+        batch_summaries = await asyncio.gather(
+            *(summarize_section_batch(batch) for batch in chunked(section_info_list, self._SECTION_BATCH_SIZE))
+        )
+        summaries = [summary for batch_summary in batch_summaries for summary in batch_summary]
+
+        async def write_section_note(section: SectionInfo, summary: str | None) -> SectionNote:
+            async with semaphore:
+                return await self._write_section_note(section, summary)
 
-    def _write_section_note(self, section: SectionInfo) -> SectionNote:
+        results = await asyncio.gather(
+            *(write_section_note(section, summary) for section, summary in zip(section_info_list, summaries)),
+            return_exceptions=True,
+        )
+
+        section_note_list = []
+        for section, result in zip(section_info_list, results):
+            if isinstance(result, BaseException):
+                warnings.warn(f"Error in writing comprehensive analysis note for section '{section.title}': {result}")
+                continue
+            section_note_list.append(result)
+        return section_note_list
+
+    async def _write_section_note(self, section: SectionInfo, summary: str | None = None) -> SectionNote:
         """Summarize the section."""
-        summary = self.summarize_section(text=section.content, title=section.title)  # type: ignore
-        img_summaries = [self.summarize_images(img_enc, summary) for img_enc in section.image_encoding_str_list]  # type: ignore
-        structured_section_summary = self.organize_section_summary(summary, img_summaries)  # type: ignore
-        quotes = self.extract_section_quotes(section.content, title=section.title)  # type: ignore
+
+        async def write_summary(summary: str | None) -> str:
+            if summary is None:
+                summary = await self.summarize_section(text=section.content, title=section.title)  # type: ignore
+            img_summaries = await asyncio.gather(*(self.summarize_images(img_enc, summary) for img_enc in section.image_encoding_str_list))
+            return await self.organize_section_summary(summary, list(img_summaries))  # type: ignore
+
+        # The quotes only depend on the section content, so they are extracted while the summary is written
+        structured_section_summary, quotes = await asyncio.gather(
+            write_summary(summary),
+            self.extract_section_quotes(section.content, title=section.title),  # type: ignore
+        )
         return SectionNote(
             header=section.title,
             summary_content=structured_section_summary,
@@ -145,8 +377,28 @@ class ArxivPaperSummarizer:
 
     @property
     def llm(self) -> LLM_TYPE:
-        """Return the language model."""
-        return self._llm or self.get_llm()
+        """Return the language model, shared by all the LLM requests of the summarizer."""
+        if self._llm is None:
+            self._llm = self.get_llm()
+            self._owns_llm = True
+        return self._llm
+
+    async def _close_llm(self) -> None:
+        # An async client is bound to the event loop it ran on, so the next run builds a new one
+        if self._owns_llm:
+            llm, self._llm, self._owns_llm = self._llm, None, False
+            await llm.close()  # type: ignore[union-attr]
+
+    def _run_sync(self, coro: Coroutine[Any, Any, R]) -> R:
+        """Run a coroutine of the summarizer to completion, closing its client on the same event loop."""
+
+        async def run() -> R:
+            try:
+                return await coro
+            finally:
+                await self._close_llm()
+
+        return run_sync(run())
 
     @property
     def paper(self) -> Paper:
@@ -158,8 +410,22 @@ class ArxivPaperSummarizer:
     @property
     def image_path_list(self) -> list[ImagePath]:
         """Return the list of image paths."""
+        if self._image_path_list is None:
+            self._image_path_list = self.get_image_path_list()
         return self._image_path_list
 
+    @property
+    def image_filename_set(self) -> set[str]:
+        """Return the set of normalized image filenames."""
+        if self._image_filename_set is None:
+            self._image_filename_set = self.get_image_filename_set()
+        return self._image_filename_set
+
+    @property
+    def section_cache(self) -> FileCache | None:
+        """Return the cache of extracted section lists, or None when caching is disabled."""
+        return get_cache(self._cache_dir, "sections")
+
     @property
     def elements(self) -> list[Element]:
         """Return the partition elements of the paper."""
@@ -169,7 +435,7 @@ class ArxivPaperSummarizer:
 
     def get_llm(self) -> LLM_TYPE:
         """Get the language model."""
-        return OpenAI(
+        return AsyncOpenAI(
             api_key=get_env_var("OPENAI_API_KEY"),
             base_url=get_env_var("OPENAI_BASE_URL"),
         )
@@ -177,14 +443,12 @@ class ArxivPaperSummarizer:
     def get_paper(self) -> Paper:
         """Get the arXiv paper."""
         try:
-            papers = fetch_papers_by_url(self.arxiv_url)
-            if not papers:
+            fetched = fetch_paper_with_pdf_by_url(self.arxiv_url)
+            if fetched is None:
                 raise ValueError(f"No paper found for URL '{self.arxiv_url}'. Please verify the URL is correct and the paper exists.")
 
-            if len(papers) > 1:
-                warnings.warn(f"Multiple papers found for URL '{self.arxiv_url}'. Using the first one.")
-
-            paper = papers[0]
+            # Keep the PDF so that partitioning does not download it again
+            paper, self._pdf_bytes = fetched
             if not paper.title:
                 raise ValueError("Paper fetched successfully but has no title. This might indicate a parsing issue.")
 
@@ -194,108 +458,61 @@ class ArxivPaperSummarizer:
 
     def get_partition_elements(self) -> list[Element]:
         """Get the partition elements of the paper."""
-        try:
-            file = load_paper_as_file_by_url(self.arxiv_url)
-
-            # First attempt with high-resolution strategy
-            try:
-                elements = partition_pdf(
-                    file=file,
-                    strategy="hi_res",
-                    infer_table_structure=True,
-                    extract_images_in_pdf=True,
-                    extract_image_block_types=["Image", "Table"],
-                    extract_image_block_to_payload=False,
-                    extract_image_block_output_dir=self._image_output_dir,
-                )
-                return elements
-            except Exception as hi_res_error:
-                error_str = str(hi_res_error).lower()
-
-                # If it's an NLTK/HTTP error, try fallback strategy
-                if ("nltk" in error_str and ("403" in error_str or "forbidden" in error_str)) or "http error 403" in error_str:
-                    warnings.warn(f"High-resolution processing failed due to NLTK download issue, trying fallback strategy: {hi_res_error}")
-
-                    # Try with a simpler strategy that might not require NLTK
-                    try:
-                        elements = partition_pdf(
-                            file=file,
-                            strategy="fast",
-                            extract_images_in_pdf=False,  # Disable image extraction to avoid NLTK issues
-                            extract_image_block_types=[],
-                        )
-                        warnings.warn("Using fallback strategy without image extraction due to NLTK issues")
-                        return elements
-                    except Exception as fallback_error:
-                        # If fallback also fails, provide comprehensive error message
-                        raise RuntimeError(
-                            "PDF processing failed with both high-resolution and fallback strategies. "
-                            "This appears to be due to NLTK resource download issues in a restricted network environment. "
-                            "To fix this issue:\n"
-                            "1. Pre-download NLTK packages: python -c \"import nltk; nltk.download('punkt'); nltk.download('punkt_tab')\"\n"
-                            "2. Or set NLTK_DATA environment variable to point to existing NLTK data\n"
-                            "3. Or ensure network access for NLTK downloads\n"
-                            f"Original high-res error: {hi_res_error}\n"
-                            f"Fallback error: {fallback_error}"
-                        ) from hi_res_error
-                else:
-                    # Re-raise the original error if it's not NLTK-related
-                    raise hi_res_error
+        future = self._elements_future or self._submit_partition()
+        self._elements_future = None
+        return future.result()
 
-        except Exception as e:
-            # Check for specific dependency errors
-            error_str = str(e).lower()
-            if "pdfinfo" in error_str or "poppler" in error_str:
-                raise RuntimeError(
-                    "PDF processing failed due to missing poppler dependency. "
-                    "Please install poppler-utils: 'sudo apt-get install poppler-utils' (Ubuntu/Debian) "
-                    "or 'brew install poppler' (macOS). "
-                    "For more details, see: https://pdf2image.readthedocs.io/en/latest/installation.html "
-                    f"Original error: {e}"
-                ) from e
-            elif "tesseract" in error_str:
-                raise RuntimeError(
-                    "PDF processing failed due to missing tesseract dependency. "
-                    "Please install tesseract: 'sudo apt-get install tesseract-ocr' (Ubuntu/Debian) "
-                    "or 'brew install tesseract' (macOS). "
-                    f"Original error: {e}"
-                ) from e
-            else:
-                # If we've already handled NLTK errors above, this is something else
-                raise RuntimeError(f"Failed to process PDF document: {e}") from e
+    def _submit_partition(self) -> Future[list[Element]]:
+        """Start partitioning the paper PDF in a worker process, since the layout analysis is CPU-bound and slow."""
+        pdf_bytes = self._get_pdf_bytes()
+        try:
+            return _get_partition_executor().submit(partition_paper_pdf, pdf_bytes, self._image_output_dir)
+        except BrokenProcessPool:
+            # A worker died (e.g. out of memory on a huge PDF), which breaks the whole pool; start a fresh one
+            return _get_partition_executor(replace_broken=True).submit(partition_paper_pdf, pdf_bytes, self._image_output_dir)
+
+    async def _wait_for_elements(self) -> None:
+        """Wait for the partition elements without blocking the event loop."""
+        if self._elements is None and self._elements_future is not None:
+            await asyncio.wrap_future(self._elements_future)
+
+    def _get_pdf_bytes(self) -> bytes:
+        """Return the paper PDF, reusing the PDF downloaded with the paper."""
+        if self._pdf_bytes is None:
+            pdf_file = load_paper_as_file_by_url(self.arxiv_url)
+            if pdf_file is None:
+                raise RuntimeError(f"Failed to download the PDF of '{self.arxiv_url}'.")
+            self._pdf_bytes = pdf_file.getvalue()
+        return self._pdf_bytes
 
     def get_image_path_list(self) -> list[ImagePath]:
         """Get the list of image paths."""
         image_path_list: list[ImagePath] = []
         for element in self.elements:
-            element_dict = element.to_dict()
-            if element_dict["type"] == "Image" or element_dict["type"] == "Table":
-                img_path = element_dict["metadata"]["image_path"]
-                filename = str(Path(img_path).stem)
-                image_path_list.append(ImagePath(path=str(img_path), filename=filename))
+            # Read the attributes directly: `to_dict` would serialize the text and metadata of every element
+            if element.category in ("Image", "Table") and (img_path := element.metadata.image_path) is not None:
+                image_path_list.append(ImagePath(path=str(img_path), filename=Path(img_path).stem))
         return image_path_list
 
     def get_image_filename_set(self) -> set[str]:
-        """Get the set of image paths."""
-        filename_list: list[str] = []
+        """Get the set of normalized image filenames."""
         for image_path in self.image_path_list:
-            norm_filename = normalize_image_filename(image_path.filename)
-            self._img_path_map[norm_filename] = image_path.filename  # Need this map to get the original filename
-            filename_list.append(norm_filename)
-        return set(filename_list)
+            self._img_path_map[normalize_image_filename(image_path.filename)] = image_path.filename  # Need this map to get the original filename
+        return set(self._img_path_map)
 
     def get_section_info_list(self, section_list: list[ExtractedSectionResult]) -> list[SectionInfo]:
         """Get the section info of the paper."""
-        result = []
+        image_filename_set = self.image_filename_set
+        sections_with_images = []
         for section in section_list:
             if section.content == "":
                 continue
 
             image_paths = []
             table_paths = []
-            image_encoding_str_list = []
-            for filename in section.ref_fig + section.ref_tb:
-                if filename not in self.get_image_filename_set():
+            section_image_paths = []
+            for filename in chain(section.ref_fig, section.ref_tb):
+                if filename not in image_filename_set:
                     continue
 
                 image_path = str(Path(self._image_output_dir) / f"{self.get_image_filename(filename)}.jpg")
@@ -303,20 +520,29 @@ class ArxivPaperSummarizer:
                     image_paths.append(image_path)
                 elif filename.startswith("table"):
                     table_paths.append(image_path)
+                section_image_paths.append(image_path)
+            sections_with_images.append((section, image_paths, table_paths, section_image_paths))
 
-                img_enc = encode_image(image_path)
-                image_encoding_str_list.append(img_enc)
-
-            result.append(
-                SectionInfo(
-                    title=section.section,
-                    content=section.content,
-                    image_encoding_str_list=image_encoding_str_list,
-                    image_paths=image_paths,
-                    table_paths=table_paths,
-                )
+        # Encoding reads each image from disk, so each image is encoded once per paper and the new ones concurrently
+        image_encodings = self._image_encodings
+        new_image_paths = list(
+            dict.fromkeys(path for *_, section_image_paths in sections_with_images for path in section_image_paths if path not in image_encodings)
+        )
+        if new_image_paths:
+            with ThreadPoolExecutor(max_workers=self._max_concurrency) as executor:
+                image_encodings.update(zip(new_image_paths, executor.map(encode_image, new_image_paths)))
+
+        result = [
+            SectionInfo(
+                title=section.section,
+                content=section.content,
+                image_encoding_str_list=[image_encodings[path] for path in section_image_paths],
+                image_paths=image_paths,
+                table_paths=table_paths,
             )
-        return TypeAdapter(list[SectionInfo]).validate_python(result)
+            for section, image_paths, table_paths, section_image_paths in sections_with_images
+        ]
+        return result
 
     def get_image_filename(self, norm_filename: str) -> str:
         """Get the original image filename."""
@@ -333,15 +559,54 @@ class ArxivPaperSummarizer:
                 return img_path.path
         return None
 
+    def extract_section_list(self, text: str) -> list[ExtractedSectionResult]:
+        """Extract the sections from the content of paper."""
+        return self._run_sync(self._extract_section_list_async(text))
+
+    async def _extract_section_list_async(self, text: str) -> list[ExtractedSectionResult]:
+        # Most papers have numbered headings, which makes the sectioning LLM request over the whole paper unnecessary
+        if (section_list := split_sections_by_headings(text)) is not None:
+            return section_list
+
+        cache = self.section_cache
+        cache_key = make_cache_key(self._SECTION_PROMPT_VERSION, self._SECTION_MODEL_NAME, text)
+        if cache is not None and (section_list := self._load_cached_section_list(cache, cache_key)) is not None:
+            return section_list
+
+        section_list = await self._extract_section_list_with_llm(text)
+        if cache is not None:
+            cache.set(
+                cache_key,
+                {
+                    "prompt_version": self._SECTION_PROMPT_VERSION,
+                    "model_name": self._SECTION_MODEL_NAME,
+                    "created_at": datetime.now(timezone.utc).isoformat(),
+                    "sections": [section.model_dump(mode="json") for section in section_list],
+                },
+            )
+        return section_list
+
+    @staticmethod
+    def _load_cached_section_list(cache: FileCache, key: str) -> list[ExtractedSectionResult] | None:
+        if (value := cache.get(key)) is None:
+            return None
+        try:
+            return _SECTION_LIST_ADAPTER.validate_python(value["sections"])
+        except (KeyError, TypeError, ValidationError) as e:
+            warnings.warn(f"Ignoring invalid cached section list: {e}")
+            return None
+
     @retry(
         stop=stop_after_attempt(3),
-        retry=(retry_if_exception_type(json.JSONDecodeError) | retry_if_exception_type(ValueError)),
+        wait=wait_exponential(min=1, max=10),
+        retry=retry_if_exception_type(ValueError),
     )
-    def extract_section_list(self, text: str) -> list[ExtractedSectionResult]:
-        """Extract the sections from the content of paper."""
-        json_str = self._extract_paper_sections(text)  # type: ignore
-        json_obj = extract_json_content(json_str)
-        return TypeAdapter(list[ExtractedSectionResult]).validate_python(json_obj)
+    async def _extract_section_list_with_llm(self, text: str) -> list[ExtractedSectionResult]:
+        # Structured outputs guarantee schema-valid JSON, so the response needs neither cleanup nor repair
+        result = await self._extract_paper_sections(text)  # type: ignore
+        if not isinstance(result, ExtractedSectionList):
+            raise ValueError(f"Unexpected section list response: {result}")
+        return result.sections
 
     @openai_prompt(
         ("system", "You are a helpful AI assistant."),
@@ -359,14 +624,11 @@ class ArxivPaperSummarizer:
             "Do not include the references section.\n"
             "Do not duplicate the ref_fig and ref_tb to each section. Include them only once.",
         ),
-        (
-            "user",
-            '### Response Format:\n```json\n[{{"section": "str", "content": "str", "ref_fig": ["str"], "ref_tb": ["str"]}}]\n```',
-        ),
         ("user", "Paper content: ```{text}```"),
-        model_name="gpt-4o-mini",
+        model_name=_SECTION_MODEL_NAME,
+        response_format=ExtractedSectionList,
     )
-    def _extract_paper_sections(self, text: str) -> str: ...  # type: ignore[empty-body]
+    async def _extract_paper_sections(self, text: str) -> ExtractedSectionList: ...  # type: ignore[empty-body]
 
     @openai_prompt(
         ("system", "You are a AI Research."),
@@ -377,9 +639,40 @@ class ArxivPaperSummarizer:
         ),
         ("user", "## Response Format\n## {title}\n```{text}```"),
         ("user", "## Title: {title}\nContent:\n```\n{text}\n```"),
-        model_name="claude-4-sonnet",  # type: ignore[arg-type]
+        model_name=_SECTION_SUMMARY_MODEL_NAME,  # type: ignore[arg-type]
     )
-    def summarize_section(self, text: str, title: str) -> str: ...  # type: ignore[empty-body]
+    async def summarize_section(self, text: str, title: str) -> str: ...  # type: ignore[empty-body]
+
+    async def summarize_section_batch(self, sections: list[SectionInfo]) -> list[str | None]:
+        """Summarize several sections with a single LLM request.
+
+        Returns one summary per section, in order; None for sections missing from the response.
+        """
+        section_ids = [f"s{i}" for i in range(1, len(sections) + 1)]
+        sections_text = "\n\n".join(
+            f"## Section [id={section_id}]\n## Title: {section.title}\nContent:\n```\n{section.content}\n```"
+            for section_id, section in zip(section_ids, sections)
+        )
+        result = await self._summarize_sections(sections=sections_text)  # type: ignore
+        if not isinstance(result, SectionSummaryBatch):
+            raise ValueError(f"Unexpected batch summary response: {result}")
+        summaries = {item.id: item.summary for item in result.summaries}
+        return [summaries.get(section_id) for section_id in section_ids]
+
+    @openai_prompt(
+        ("system", "You are a AI Research."),
+        (
+            "user",
+            "I am reading a machine learning and deep learning paper and will provide you with several sections of its content. "
+            "Provide a brief summary of each section. "
+            "Return one summary per section, using the section id given in brackets, e.g. 's1'.",
+        ),
+        ("user", "## Summary Format\n## <section title>\n<summary>"),
+        ("user", "{sections}"),
+        model_name=_SECTION_SUMMARY_MODEL_NAME,  # type: ignore[arg-type]
+        response_format=SectionSummaryBatch,
+    )
+    async def _summarize_sections(self, sections: str) -> SectionSummaryBatch: ...  # type: ignore[empty-body]
 
     @openai_prompt(
         ("system", "You are an AI research assistant."),
@@ -402,9 +695,10 @@ class ArxivPaperSummarizer:
         ("user", "## Title: {title}\nContent:\n```\n{text}\n```"),
         model_name="claude-4-sonnet",  # type: ignore[arg-type]
     )
-    def extract_section_quotes(self, text: str, title: str) -> str: ...  # type: ignore[empty-body]
+    async def extract_section_quotes(self, text: str, title: str) -> str: ...  # type: ignore[empty-body]
 
-    def summarize_images(self, base64_img: str, section_summary: str) -> str:
+    @retry_on_api_error
+    async def summarize_images(self, base64_img: str, section_summary: str) -> str:
         content = []
         content += [
             {
@@ -415,16 +709,26 @@ class ArxivPaperSummarizer:
         content += [{"type": "text", "text": section_summary}]
         content += [{"type": "image_url", "image_url": {"url": f"data:image/jpeg;base64,{base64_img}"}}]  # type: ignore
 
-        response = self.llm.chat.completions.create(
-            model="gpt-4.1",
+        model_name = "gpt-4.1"
+        cache = get_default_cache()
+        cache_key = make_cache_key(model_name, content)
+        if cache is not None and (cached_summary := cache.get(cache_key)) is not None:
+            return cached_summary
+
+        response = await self.llm.chat.completions.create(
+            model=model_name,
             messages=[
                 {  # type: ignore
                     "role": "user",
                     "content": content,
                 }
             ],
+            timeout=get_request_timeout(section_summary),
         )  # type: ignore
-        return response.choices[0].message.content  # type: ignore
+        image_summary = response.choices[0].message.content
+        if cache is not None and image_summary is not None:
+            cache.set(cache_key, image_summary)
+        return image_summary  # type: ignore
 
     @openai_prompt(
         ("system", "You are an AI research assistant."),
@@ -439,7 +743,7 @@ class ArxivPaperSummarizer:
         ("user", "Image Summary: ```{image_summary}```"),
         model_name="gpt-4o",
     )
-    def organize_section_summary(self, summary: str, image_summary: list[str]): ...  # type: ignore[empty-body]
+    async def organize_section_summary(self, summary: str, image_summary: list[str]): ...  # type: ignore[empty-body]
 
     @openai_prompt(
         ("system", "You are an AI research assistant."),
@@ -465,6 +769,6 @@ class ArxivPaperSummarizer:
             "Do NOT include any content outside this format.\n",
         ),
         ("user", "Section Content: ```{text}```"),
-        model_name="claude-4-sonnet",  # type: ignore[arg-type]
+        model_name=_KEYNOTE_MODEL_NAME,  # type: ignore[arg-type]
     )
-    def _extract_keynote(self, text: str) -> str: ...  # type: ignore[empty-body]
+    async def _extract_keynote(self, text: str) -> str: ...  # type: ignore[empty-body]
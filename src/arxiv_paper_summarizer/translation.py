@@ -1,7 +1,21 @@
 """Translation utilities for the summarizer."""
 
+import re
+from functools import lru_cache
+from typing import Sequence
+
+from more_itertools import chunked
+
 from arxiv_paper_summarizer.prompt_function import openai_prompt
 
+# Reports repeat passages such as section headings and boilerplate, so identical translations are
+# served from memory; the prompt functions additionally use the on-disk response cache when it is enabled.
+_TRANSLATION_CACHE_SIZE = 4096
+
+# Number of notes translated with a single request by `translate_texts`
+TRANSLATION_BATCH_SIZE = 8
+_BATCH_ITEM_RE = re.compile(r"^===ITEM (\d+)===[ \t]*$", re.MULTILINE)
+
 
 @openai_prompt(
     ("system", "You are an AI research assistant."),
@@ -18,7 +32,7 @@ from arxiv_paper_summarizer.prompt_function import openai_prompt
     ),
     model_name="gpt-4o",
 )
-def translate_text(text: str, language: str): ...  # type: ignore[empty-body]
+def _translate_text(text: str, language: str): ...  # type: ignore[empty-body]
 
 
 @openai_prompt(
@@ -41,4 +55,64 @@ def translate_text(text: str, language: str): ...  # type: ignore[empty-body]
     ),
     model_name="gpt-4o",
 )
-def translate_quote(text: str, language: str): ...  # type: ignore[empty-body]
+def _translate_quote(text: str, language: str): ...  # type: ignore[empty-body]
+
+
+@openai_prompt(
+    ("system", "You are an AI research assistant."),
+    (
+        "user",
+        "##Task\n"
+        "Translate each of the provided notes into the specified language, {language}. "
+        "Follow these rules for translation:\n"
+        "- Preserve the original meaning as closely as possible.\n"
+        "- Use terminology commonly used by data scientists and AI researchers.\n"
+        "- Avoid over-translation; keep terms intact where applicable.\n\n"
+        "## Response Format\n"
+        "Each note is enclosed in <<<ITEM k>>> and <<<END k>>> markers. "
+        "For every note, write a line '===ITEM k===' with the same number k, followed by the translation of the note. "
+        "Do not add anything else.\n\n"
+        "Here are the notes:\n"
+        "{items}",
+    ),
+    model_name="gpt-4o",
+)
+def _translate_text_batch(items: str, language: str): ...  # type: ignore[empty-body]
+
+
+def _parse_batch_translation(response: str, count: int) -> list[str | None]:
+    """Split a batch response into one translation per item; None for items missing from the response."""
+    parts = _BATCH_ITEM_RE.split(response)
+    translations = {int(number): text.strip() for number, text in zip(parts[1::2], parts[2::2])}
+    return [translations.get(number) or None for number in range(1, count + 1)]
+
+
+@lru_cache(maxsize=_TRANSLATION_CACHE_SIZE)
+def translate_text(text: str, language: str) -> str:
+    """Translate a note into the given language."""
+    return _translate_text(text, language)
+
+
+@lru_cache(maxsize=_TRANSLATION_CACHE_SIZE)
+def translate_quote(text: str, language: str) -> str:
+    """Translate a quote into the given language, keeping the original quote."""
+    return _translate_quote(text, language)
+
+
+def translate_texts(texts: Sequence[str], language: str, batch_size: int = TRANSLATION_BATCH_SIZE) -> list[str]:
+    """
+    Translate several notes into the given language, with one request per batch of notes.
+
+    Notes missing from a batch response are translated one by one.
+    """
+    translations: dict[str, str] = {}
+    for batch in chunked(dict.fromkeys(texts), batch_size):
+        if len(batch) == 1:
+            translations[batch[0]] = translate_text(batch[0], language)
+            continue
+
+        items = "\n\n".join(f"<<<ITEM {number}>>>\n{text}\n<<<END {number}>>>" for number, text in enumerate(batch, start=1))
+        response = _translate_text_batch(items, language)
+        for text, translation in zip(batch, _parse_batch_translation(response, len(batch))):
+            translations[text] = translation if translation is not None else translate_text(text, language)
+    return [translations[text] for text in texts]
@@ -5,10 +5,10 @@ from __future__ import annotations
 from enum import Enum
 from typing import Any, TypeAlias, Union
 
-from openai import AzureOpenAI, OpenAI
+from openai import AsyncAzureOpenAI, AsyncOpenAI, AzureOpenAI, OpenAI
 from pydantic import AnyHttpUrl, BaseModel, Field
 
-SUPPORTED_MODEL_TYPE: TypeAlias = Union[OpenAI, AzureOpenAI]
+SUPPORTED_MODEL_TYPE: TypeAlias = Union[AsyncOpenAI, AsyncAzureOpenAI, OpenAI, AzureOpenAI]
 LLM_TYPE: TypeAlias = SUPPORTED_MODEL_TYPE | Any
 
 
@@ -28,10 +28,14 @@ class Paper(BaseModel):
     references: list[Paper] | None = None  # type: ignore
 
     def flatten(self) -> list[Paper]:
-        papers = [self]
-        if self.references:
-            for paper in self.references:
-                papers.extend(paper.flatten())
+        """Return the paper and all its nested references in depth-first order, without recursion."""
+        papers = []
+        stack = [self]
+        while stack:
+            paper = stack.pop()
+            papers.append(paper)
+            if paper.references:
+                stack.extend(reversed(paper.references))
         return papers
 
 
@@ -42,6 +46,10 @@ class ExtractedSectionResult(BaseModel):
     ref_tb: list[str] = Field(..., description="List of table references in 'Table-<page>' format.")
 
 
+class ExtractedSectionList(BaseModel):
+    sections: list[ExtractedSectionResult] = Field(default_factory=list, description="Sections of the paper, in order.")
+
+
 class SectionInfo(BaseModel):
     title: str
     content: str
@@ -54,6 +62,15 @@ class SectionInfo(BaseModel):
     table_paths: list[str] = Field(default_factory=list, description="List of table paths.")
 
 
+class SectionSummary(BaseModel):
+    id: str = Field(..., description="Identifier of the summarized section, e.g. 's1'.")
+    summary: str = Field(..., description="Brief summary of the section.")
+
+
+class SectionSummaryBatch(BaseModel):
+    summaries: list[SectionSummary] = Field(default_factory=list, description="One summary per provided section.")
+
+
 class SectionNote(BaseModel):
     header: str
     summary_content: str
@@ -67,6 +84,11 @@ class ImagePath(BaseModel):
     filename: str
 
 
+class BatchRequest(BaseModel):
+    custom_id: str = Field(..., description="Unique identifier used to match the batch response.")
+    body: dict[str, Any] = Field(..., description="Chat completion request body.")
+
+
 class SummaryResult(BaseModel):
     keynote: str = Field(..., description="Keynote summary.")
     section_notes: list[SectionNote] = Field(default_factory=list, description="List of section notes.")
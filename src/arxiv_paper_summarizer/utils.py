@@ -1,15 +1,19 @@
 """Utilities helper functions."""
 
-import base64
+import asyncio
 import json
+import mmap
 import os
 import re
 import ssl
 import types
 import warnings
+from base64 import b64encode
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, ParamSpec, Sequence, TypeVar, Union, get_args, get_origin
+from typing import Any, Coroutine, ParamSpec, Sequence, TypeVar, Union, get_args, get_origin
 
 import tiktoken
 
@@ -17,6 +21,8 @@ P = ParamSpec("P")
 R = TypeVar("R")
 TypeT = type[R]
 
+_FIRST_FIGURE_RE = re.compile(r"figure-\d+-1")
+
 
 def get_env_var(name: str) -> str:
     if name in os.environ:
@@ -24,76 +30,61 @@ def get_env_var(name: str) -> str:
     raise ValueError(f"Environment variable '{name}' is not set.")
 
 
-def compute_token(text: str, model_name: str = "gpt-4o") -> int:
-    enc = tiktoken.encoding_for_model(model_name)
-    return len(enc.encode(text))
+MMAP_MIN_IMAGE_SIZE = 1024 * 1024
 
 
-def encode_image(image_path: str) -> str:
-    with open(image_path, "rb") as image_file:
-        return base64.b64encode(image_file.read()).decode("utf-8")
-
-
-def is_union_type(type_: type) -> bool:
-    """Return True if the type is a union type."""
-    type_ = get_origin(type_) or type_
-    return type_ is Union or type_ is types.UnionType
-
-
-def split_union_type(type_: TypeT) -> Sequence[TypeT]:
-    """Split a union type into its constituent types."""
-    return get_args(type_) if is_union_type(type_) else [type_]
+@lru_cache(maxsize=16)
+def _get_encoding(model_name: str) -> tiktoken.Encoding:
+    return tiktoken.encoding_for_model(model_name)
 
 
-def _extract_json_block(text: str) -> str | None:
-    pattern = re.compile(r"```json\s*(\[[\s\S]*?\])\s*```", re.MULTILINE)
-    match = pattern.search(text)
-    return match.group(1) if match else None
+def compute_token(text: str, model_name: str = "gpt-4o") -> int:
+    return len(_get_encoding(model_name).encode(text))
 
 
-def _clean_json_text(json_text: str) -> str:
-    string_pattern = re.compile(r"\"(.*?)(?<!\\)\"", re.DOTALL)
+def encode_image(image_path: str) -> str:
+    with open(image_path, "rb") as image_file:
+        if os.fstat(image_file.fileno()).st_size < MMAP_MIN_IMAGE_SIZE:
+            return b64encode(image_file.read()).decode("ascii")
 
-    def replace_newlines(match: re.Match) -> str:
-        string_content = match.group(1).replace("\n", " ")
-        return f'"{string_content}"'
+        # Encode large images straight from the page cache instead of copying the whole file into memory first
+        with mmap.mmap(image_file.fileno(), 0, access=mmap.ACCESS_READ) as image_data:
+            return b64encode(image_data).decode("ascii")
 
-    return string_pattern.sub(replace_newlines, json_text)
 
+def run_sync(coro: Coroutine[Any, Any, R]) -> R:
+    """Run a coroutine to completion from synchronous code.
 
-def extract_json_content(text: str) -> list[dict[str, str]] | None | Any:
+    Falls back to a helper thread when an event loop is already running (e.g. in Jupyter),
+    where `asyncio.run` cannot be called directly.
     """
-    Extract JSON content enclosed within ```json ... ``` from the given text.
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return asyncio.run(coro)
 
-    This function searches for a JSON block in the provided text that is enclosed within triple backticks
-    and labeled as 'json'. It cleans the JSON text by removing unescaped newline characters within strings,
-    which are invalid in JSON. The cleaned JSON text is then parsed and returned as a list of dictionaries.
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        return executor.submit(asyncio.run, coro).result()
 
-    Args:
-        text (str): The input text containing the JSON block.
 
-    Returns:
-        Optional[List[Dict[str, str]]]: The parsed JSON content as a list of dictionaries,
-        or None if no valid JSON block is found.
-    """
-    json_text = _extract_json_block(text)
-    if json_text is None:
-        return None
+def is_union_type(type_: type) -> bool:
+    """Return True if the type is a union type."""
+    type_ = get_origin(type_) or type_
+    return type_ is Union or type_ is types.UnionType
 
-    cleaned_json_text = _clean_json_text(json_text)
 
-    try:
-        return json.loads(cleaned_json_text)
-    except json.JSONDecodeError:
-        return None
+def split_union_type(type_: TypeT) -> Sequence[TypeT]:
+    """Split a union type into its constituent types."""
+    return get_args(type_) if is_union_type(type_) else [type_]
 
 
 def normalize_image_filename(filename: str) -> str:
     """
     Normalize image filenames by removing unnecessary parts.
     """
-    path = Path(filename)
-    stem, suffix = path.stem, path.suffix
+    # Plain string operations: this runs for every extracted image, and a Path is not needed to split the extension
+    dot = filename.rfind(".")
+    stem, suffix = (filename[:dot], filename[dot:]) if dot > 0 else (filename, "")
 
     if stem.startswith(("figure", "table")) and stem.count("-") > 1:
         parts = stem.split("-")
@@ -103,7 +94,7 @@ def normalize_image_filename(filename: str) -> str:
 
 
 def is_first_figure(path: str) -> bool:
-    return bool(re.match(r"^figure-\d+-1$", Path(path).stem))
+    return _FIRST_FIGURE_RE.fullmatch(Path(path).stem) is not None
 
 
 def get_publication_week_folder(published_date: str | None, base_dir: str | Path = "papers") -> Path:
@@ -120,27 +111,45 @@ def get_publication_week_folder(published_date: str | None, base_dir: str | Path
     """
     base_path = Path(base_dir)
 
-    try:
-        if published_date:
+    pub_date = None
+    if published_date:
+        try:
             # Parse ISO format date string (e.g., "2024-10-15T10:30:00Z")
             pub_date = datetime.fromisoformat(published_date.replace("Z", "+00:00"))
-            year = pub_date.year
-            month_name = pub_date.strftime("%B")  # Full month name (e.g., "October")
-            week_num = pub_date.isocalendar()[1]
-        else:
-            # Fallback to current date if no publication date
-            current_date = datetime.now()
-            year = current_date.year
-            month_name = current_date.strftime("%B")
-            week_num = current_date.isocalendar()[1]
-    except (ValueError, AttributeError):
-        # Fallback to current date if parsing fails
-        current_date = datetime.now()
-        year = current_date.year
-        month_name = current_date.strftime("%B")
-        week_num = current_date.isocalendar()[1]
-
-    return base_path / f"{year}/{month_name}/week_{week_num:02d}"
+        except (ValueError, AttributeError):
+            pass
+
+    # Fallback to current date if no publication date or parsing fails
+    date = pub_date or datetime.now()
+    month_name = date.strftime("%B")  # Full month name (e.g., "October")
+    week_num = date.isocalendar()[1]
+
+    return base_path / f"{date.year}/{month_name}/week_{week_num:02d}"
+
+
+def get_report_metadata_path(output_path: str | Path) -> Path:
+    """Return the `<output>.meta.json` sidecar path that records how a report was generated."""
+    output_path = Path(output_path)
+    return output_path.with_name(f"{output_path.name}.meta.json")
+
+
+def is_report_up_to_date(output_path: str | Path, metadata: dict[str, Any]) -> bool:
+    """
+    Check whether a report exists and was generated with the same metadata, so it can be skipped on reruns.
+    """
+    if not Path(output_path).exists():
+        return False
+    try:
+        with open(get_report_metadata_path(output_path), encoding="utf-8") as f:
+            return json.load(f) == metadata
+    except (FileNotFoundError, json.JSONDecodeError):
+        return False
+
+
+def write_report_metadata(output_path: str | Path, metadata: dict[str, Any]) -> None:
+    """Write the metadata sidecar next to a generated report."""
+    with open(get_report_metadata_path(output_path), "w", encoding="utf-8") as f:
+        json.dump(metadata, f, ensure_ascii=False, indent=2)
 
 
 # NLTK utilities for handling package downloads and initialization
@@ -185,20 +194,28 @@ def setup_nltk_offline():
         return False
 
 
+_NLTK_DATA_PATHS = (
+    os.path.expanduser("~/.local/share/nltk_data"),
+    os.path.expanduser("~/nltk_data"),
+    "/usr/local/share/nltk_data",
+    "/usr/share/nltk_data",
+)
+_UNSTRUCTURED_ENV_SETUP_DONE = False
+
+
 def setup_unstructured_environment():
     """Setup environment variables to prevent unstructured from downloading NLTK packages."""
+    global _UNSTRUCTURED_ENV_SETUP_DONE
+    # Called for every summarizer and in each partition worker; the environment only needs to be set once per process
+    if _UNSTRUCTURED_ENV_SETUP_DONE:
+        return
+
     # Set environment variables to prevent unstructured from trying to download NLTK data
-    os.environ["NLTK_DATA"] = os.pathsep.join(
-        [
-            os.path.expanduser("~/.local/share/nltk_data"),
-            os.path.expanduser("~/nltk_data"),
-            "/usr/local/share/nltk_data",
-            "/usr/share/nltk_data",
-        ]
-    )
+    os.environ["NLTK_DATA"] = os.pathsep.join(_NLTK_DATA_PATHS)
 
     # Disable automatic NLTK downloads
     os.environ["UNSTRUCTURED_DISABLE_NLTK_DOWNLOAD"] = "1"
+    _UNSTRUCTURED_ENV_SETUP_DONE = True
 
 
 def patch_nltk_download():
@@ -1,49 +1,129 @@
+from pathlib import Path
+
 import pytest
-from unittest.mock import patch, MagicMock, mock_open
+from unittest.mock import patch, MagicMock
+from arxiv_paper_summarizer.cache import FileCache
 from arxiv_paper_summarizer.error import InvalidArxivURLException
 from arxiv_paper_summarizer.arxiv import (
+    _PDF_TEXT_FLAGS,
     ArxivClient,
+    fetch_metadata_by_url,
     fetch_papers_by_url,
     fetch_papers_by_query,
     load_papers_by_url,
     load_papers_by_query,
     load_paper_as_file_by_url,
+    _parse_pdf_pages,
     extract_refs,
+    parse_arxiv_id,
+    parse_references,
     Paper,
 )
 
 
-def test_parse_arxiv_id():
-    client = ArxivClient()
+@pytest.fixture
+def minimal_pdf():
+    """A real two-page PDF whose second page cites https://arxiv.org/abs/9876.54321."""
+    return (Path(__file__).parent / "fixtures" / "minimal.pdf").read_bytes()
+
+
+@pytest.fixture(scope="module")
+def worker_process_client():
+    # Starting worker processes is slow, so the tests that use them share one client and its process pool
+    client = ArxivClient(max_workers=4, num_workers=2)
+    yield client
+    client.close()
+
+
+@pytest.fixture(scope="module")
+def shared_client():
+    return ArxivClient()
+
 
+@pytest.fixture
+def client(shared_client):
+    # Reuse one client across the module, but start each test with empty search caches
+    shared_client._search_cache.clear()
+    shared_client._query_cache.clear()
+    return shared_client
+
+
+def test_parse_arxiv_id(client):
     # Valid cases
     assert client.parse_arxiv_id("https://arxiv.org/abs/2404.01475") == "2404.01475"
     assert client.parse_arxiv_id("https://arxiv.org/abs/2404.01475v1") == "2404.01475"
+    assert client.parse_arxiv_id("https://arxiv.org/abs/2404.01475v2?context=cs#fragment") == "2404.01475"
+    assert client.parse_arxiv_id("https://arxiv.org/pdf/2404.01475v1.pdf") == "2404.01475"
 
     # Invalid case
     with pytest.raises(InvalidArxivURLException):
         client.parse_arxiv_id("https://invalid.url/not_an_arxiv_id")
 
+    # Module-level function
+    assert parse_arxiv_id("https://huggingface.co/papers/2404.01475") == "2404.01475"
+
 
-def test_parse_references():
-    client = ArxivClient()
+def test_parse_references(client):
     text = "Refer to https://arxiv.org/abs/1234.56789 and https://arxiv.org/abs/9876.54321v2."
     expected = ["https://arxiv.org/abs/1234.56789", "https://arxiv.org/abs/9876.54321v2"]
     assert client.parse_references(text) == expected
+    assert client.parse_reference_ids(text) == ["1234.56789", "9876.54321"]
+    assert parse_references(text) == expected
+    assert parse_references("No arXiv links, only https://example.org/abs/1234.56789") == []
 
 
-def test_fetch_papers_by_url_empty():
-    client = ArxivClient()
+def test_parse_page_reference_ids(client):
+    page_texts = [
+        "Intro citing https://arxiv.org/abs/1111.11111",
+        "Body without links",
+        "References: https://arxiv.org/abs/1234.56789",
+        "References without arXiv links",
+        "https://arxiv.org/abs/9876.54321v2",
+        "Appendix",
+    ]
+    assert client.parse_page_reference_ids(page_texts) == ["1111.11111", "1234.56789", "9876.54321"]
+    assert client.parse_page_reference_ids(["No references"]) == []
+
+
+def test_search_by_url_cached(client):
+    mock_paper = MagicMock()
+    mock_paper.entry_id = "http://arxiv.org/abs/1234.56789v2"
+
+    with patch.object(client.client, "results", return_value=[mock_paper]) as mock_results:
+        assert list(client.search_by_url(["1234.56789", "9876.54321"])) == [mock_paper]
+        assert list(client.search_by_url(["9876.54321", "1234.56789"])) == [mock_paper]
+        assert list(client.search_by_url([])) == []
+
+    # The ID without a result is cached too
+    mock_results.assert_called_once()
+    assert mock_results.call_args.kwargs["search"].id_list == ["1234.56789", "9876.54321"]
+
+
+def test_search_by_url_in_batches(client):
+    id_list = [f"1234.{i:05d}" for i in range(150)]
+
+    with patch.object(client.client, "results", return_value=[]) as mock_results:
+        assert list(client.search_by_url(id_list)) == []
+
+    assert [call.kwargs["search"].id_list for call in mock_results.call_args_list] == [id_list[:100], id_list[100:]]
+    assert mock_results.call_args_list[1].kwargs["search"].max_results == 50
+
+
+def test_fetch_papers_by_url_empty(client):
     assert client.fetch_papers_by_url([]) == []
 
 
-def test_fetch_papers_by_url():
-    client = ArxivClient()
+def test_fetch_papers_with_references_by_url_empty(client):
+    with patch.object(client, "search_by_url") as mock_search_by_url:
+        assert client.fetch_papers_with_references_by_url([]) == []
+    mock_search_by_url.assert_not_called()
+
+
+def test_fetch_papers_by_url(client, minimal_pdf):
     urls = ["https://arxiv.org/abs/1234.56789"]
     mock_paper = MagicMock()
     mock_paper.title = "Sample Paper"
     mock_paper.entry_id = "https://arxiv.org/abs/1234.56789"
-    mock_paper.download_pdf.return_value = "/tmp/sample.pdf"
 
     # Mock authors
     mock_author1 = MagicMock()
@@ -57,67 +137,226 @@ def test_fetch_papers_by_url():
 
     mock_paper.published = datetime(2024, 1, 15, 10, 30)
 
+    with patch.object(client, "search_by_url", return_value=[mock_paper]), patch.object(client, "download_pdf_bytes", return_value=minimal_pdf):
+        papers = client.fetch_papers_by_url(urls)
+        assert len(papers) == 1
+        assert papers[0].title == "Sample Paper"
+        assert papers[0].text == "Sample Paper\nIntroduction to the sample paper.\nReferences\nhttps://arxiv.org/abs/9876.54321\n"
+        assert papers[0].authors == ["John Doe", "Jane Smith"]
+        assert papers[0].published == "2024-01-15T10:30:00"
+
+
+def test_fetch_metadata_by_url(client):
+    urls = ["https://arxiv.org/abs/1234.56789", "https://arxiv.org/pdf/1234.56789v2", "https://arxiv.org/abs/9876.54321"]
+    mock_paper = MagicMock()
+    mock_paper.entry_id = "http://arxiv.org/abs/1234.56789v2"
+
+    with patch.object(client, "search_by_url", return_value=[mock_paper]) as mock_search_by_url:
+        metadata = client.fetch_metadata_by_url(urls)
+        mock_search_by_url.assert_called_once_with(["1234.56789", "9876.54321"])
+        assert metadata == {urls[0]: mock_paper, urls[1]: mock_paper}
+
+
+def test_fetch_papers_by_url_concurrently():
+    client = ArxivClient(max_workers=4, num_workers=1)
+    urls = [f"https://arxiv.org/abs/1234.5678{i}" for i in range(5)]
+    mock_papers = []
+    for i in range(5):
+        mock_paper = MagicMock()
+        mock_paper.title = f"Paper {i}"
+        mock_paper.entry_id = urls[i]
+        mock_paper.authors = []
+        mock_paper.published = None
+        mock_papers.append(mock_paper)
+
     mock_doc = MagicMock()
+    mock_doc.needs_pass = False
     mock_page = MagicMock()
     mock_page.get_text.return_value = "Paper content"
     mock_doc.__iter__ = lambda self: iter([mock_page])
 
-    with patch.object(client, "search_by_url", return_value=[mock_paper]):
+    with patch.object(client, "search_by_url", return_value=mock_papers), patch.object(client, "download_pdf_bytes", return_value=b"%PDF-content"):
         with patch("fitz.open", return_value=mock_doc):
             papers = client.fetch_papers_by_url(urls)
-            assert len(papers) == 1
-            assert papers[0].title == "Sample Paper"
-            assert papers[0].authors == ["John Doe", "Jane Smith"]
-            assert papers[0].published == "2024-01-15T10:30:00"
-            mock_doc.close.assert_called_once()
+            assert [paper.title for paper in papers] == [f"Paper {i}" for i in range(5)]
+            assert mock_doc.close.call_count == 5
+
+
+def test_fetch_papers_by_url_in_worker_processes(worker_process_client):
+    import fitz
+
+    client = worker_process_client
+    urls = [f"https://arxiv.org/abs/1234.5678{i}" for i in range(3)]
+    mock_papers = []
+    pdf_bytes_by_paper = {}
+    for i in range(3):
+        mock_paper = MagicMock()
+        mock_paper.title = f"Paper {i}"
+        mock_paper.entry_id = urls[i]
+        mock_paper.authors = []
+        mock_paper.published = None
+        mock_papers.append(mock_paper)
+
+        doc = fitz.open()
+        doc.new_page().insert_text((72, 72), f"Content of paper {i}")
+        pdf_bytes_by_paper[mock_paper.title] = doc.tobytes()
+        doc.close()
+
+    with patch.object(client, "search_by_url", return_value=mock_papers), patch.object(
+        client, "download_pdf_bytes", side_effect=lambda paper: pdf_bytes_by_paper[paper.title]
+    ):
+        papers = client.fetch_papers_by_url(urls)
+
+    assert [paper.title for paper in papers] == [f"Paper {i}" for i in range(3)]
+    assert [paper.text.strip() for paper in papers] == [f"Content of paper {i}" for i in range(3)]
+    # The pool is reused by later fetches, and its workers are not forked from this multi-threaded process
+    assert client._get_process_pool() is client._process_pool
+    assert client._process_pool._mp_context.get_start_method() != "fork"
+
+
+def test_fetch_papers_by_url_in_worker_processes_cached(worker_process_client, monkeypatch, tmp_path):
+    import fitz
+
+    cache = FileCache(tmp_path)
+    client = worker_process_client
+    monkeypatch.setattr(client, "_cache", cache)
+    urls = [f"https://arxiv.org/abs/1234.5678{i}" for i in range(3)]
+    mock_papers = []
+    for i in range(3):
+        mock_paper = MagicMock()
+        mock_paper.title = f"Paper {i}"
+        mock_paper.entry_id = urls[i]
+        mock_paper.authors = []
+        mock_paper.published = None
+        mock_paper.get_short_id.return_value = f"1234.5678{i}v1"
+        mock_papers.append(mock_paper)
+    cache.set("1234.56781v1", Paper(title="Paper 1", text="Cached content", url=urls[1]).model_dump(mode="json"))
+
+    doc = fitz.open()
+    doc.new_page().insert_text((72, 72), "Downloaded content")
+    pdf_bytes = doc.tobytes()
+    doc.close()
+
+    with patch.object(client, "search_by_url", return_value=mock_papers), patch.object(
+        client, "download_pdf_bytes", return_value=pdf_bytes
+    ) as mock_download_pdf_bytes:
+        papers = client.fetch_papers_by_url(urls)
+
+    assert mock_download_pdf_bytes.call_count == 2
+    assert [paper.text.strip() for paper in papers] == ["Downloaded content", "Cached content", "Downloaded content"]
+    assert Paper.model_validate(cache.get("1234.56782v1")).text.strip() == "Downloaded content"
+
+
+def test_parse_pdf_pages_skips_password_protected_pdf():
+    import fitz
+
+    doc = fitz.open()
+    doc.new_page().insert_text((72, 72), "Secret content")
+    pdf_bytes = doc.tobytes(encryption=fitz.PDF_ENCRYPT_AES_256, owner_pw="owner", user_pw="user")
+    doc.close()
+
+    assert _parse_pdf_pages(pdf_bytes) == []
+
+
+def test_fetch_papers_by_url_cached(tmp_path):
+    client = ArxivClient(cache=FileCache(tmp_path))
+    urls = ["https://arxiv.org/abs/1234.56789"]
+    mock_paper = MagicMock()
+    mock_paper.title = "Sample Paper"
+    mock_paper.entry_id = "https://arxiv.org/abs/1234.56789v1"
+    mock_paper.authors = []
+    mock_paper.published = None
+    mock_paper.get_short_id.return_value = "1234.56789v1"
+
+    mock_doc = MagicMock()
+    mock_doc.needs_pass = False
+    mock_page = MagicMock()
+    mock_page.get_text.return_value = "Paper content"
+    mock_doc.__iter__ = lambda self: iter([mock_page])
+
+    with patch.object(client, "search_by_url", return_value=[mock_paper]), patch.object(client, "download_pdf_bytes", return_value=b"%PDF-content") as mock_download_pdf_bytes:
+        with patch("fitz.open", return_value=mock_doc):
+            first_papers = client.fetch_papers_by_url(urls)
+            second_papers = client.fetch_papers_by_url(urls)
+
+    mock_download_pdf_bytes.assert_called_once()
+    assert second_papers == first_papers
+    assert second_papers[0].text == "Paper content"
 
 
-def test_fetch_papers_with_references_by_url():
-    client = ArxivClient()
+def test_fetch_papers_with_references_by_url(client, minimal_pdf):
     urls = ["https://arxiv.org/abs/1234.56789"]
     main_paper = MagicMock()
     main_paper.title = "Main Paper"
     main_paper.entry_id = "https://arxiv.org/abs/1234.56789"
-    main_paper.download_pdf.return_value = "/tmp/main.pdf"
     main_paper.authors = []
     main_paper.published = None
 
     ref_paper = MagicMock()
     ref_paper.title = "Reference Paper"
     ref_paper.entry_id = "https://arxiv.org/abs/9876.54321"
-    ref_paper.download_pdf.return_value = "/tmp/ref.pdf"
     ref_paper.authors = []
     ref_paper.published = None
 
-    mock_doc = MagicMock()
-    mock_page = MagicMock()
-    mock_page.get_text.return_value = "Content with https://arxiv.org/abs/9876.54321"
-    mock_doc.__iter__ = lambda self: iter([mock_page])
+    with patch.object(client, "search_by_url", side_effect=[[main_paper], [ref_paper]]) as mock_search_by_url, patch.object(
+        client, "download_pdf_bytes", return_value=minimal_pdf
+    ):
+        papers = client.fetch_papers_with_references_by_url(urls)
+        assert len(papers) == 1
+        assert papers[0].references is not None
+        assert [paper.title for paper in papers[0].references] == ["Reference Paper"]
+        assert mock_search_by_url.call_args.args[0] == ["9876.54321"]
+
+
+def test_fetch_papers_with_shared_references_by_url(client):
+    urls = ["https://arxiv.org/abs/1111.11111", "https://arxiv.org/abs/2222.22222"]
+    parent_papers = [
+        Paper(title="First Paper", text="Cites https://arxiv.org/abs/9876.54321 twice: https://arxiv.org/abs/9876.54321v2", url=urls[0]),
+        Paper(title="Second Paper", text="Also cites https://arxiv.org/abs/9876.54321", url=urls[1]),
+    ]
+    ref_paper = Paper(title="Reference Paper", text="Content", url="https://arxiv.org/abs/9876.54321v2")
+
+    with patch.object(client, "search_by_url", return_value=[MagicMock(), MagicMock()]), patch.object(
+        client, "_fetch_all_with_pages", return_value=[(paper, None) for paper in parent_papers]
+    ), patch.object(client, "fetch_papers_by_id", return_value=[ref_paper]) as mock_fetch_papers_by_id:
+        papers = client.fetch_papers_with_references_by_url(urls)
+
+    mock_fetch_papers_by_id.assert_called_once_with(["9876.54321"])
+    assert papers[0].references == [ref_paper]
+    assert papers[1].references == [ref_paper]
+
+
+def test_fetch_papers_with_references_by_url_capped(client):
+    reference_ids = [f"9876.{i:05d}" for i in range(250)]
+    parent_paper = Paper(
+        title="Survey",
+        text=" ".join(f"https://arxiv.org/abs/{id_}" for id_ in reference_ids * 2),
+        url="https://arxiv.org/abs/1111.11111",
+    )
 
-    with patch.object(client, "search_by_url", side_effect=[[main_paper], [ref_paper]]):
-        with patch("fitz.open", return_value=mock_doc):
-            papers = client.fetch_papers_with_references_by_url(urls)
-            assert len(papers) == 1
-            assert papers[0].references is not None
-            assert len(papers[0].references) == 1
+    with patch.object(client, "search_by_url", return_value=[MagicMock()]), patch.object(
+        client, "_fetch_all_with_pages", return_value=[(parent_paper, None)]
+    ), patch.object(client, "fetch_papers_by_id", return_value=[]) as mock_fetch_papers_by_id:
+        client.fetch_papers_with_references_by_url(["https://arxiv.org/abs/1111.11111"])
+
+    mock_fetch_papers_by_id.assert_called_once_with(reference_ids[:200])
 
 
-def test_fetch_papers_by_query():
-    client = ArxivClient()
+def test_fetch_papers_by_query(client):
     queries = ["Sample Query"]
     mock_paper = MagicMock()
     mock_paper.title = "Sample Query"
     mock_paper.entry_id = "https://arxiv.org/abs/1234.56789"
-    mock_paper.download_pdf.return_value = "/tmp/sample.pdf"
     mock_paper.authors = []
     mock_paper.published = None
 
     mock_doc = MagicMock()
+    mock_doc.needs_pass = False
     mock_page = MagicMock()
     mock_page.get_text.return_value = "Paper content"
     mock_doc.__iter__ = lambda self: iter([mock_page])
 
-    with patch.object(client, "search_by_query", return_value=[mock_paper]):
+    with patch.object(client, "search_by_query", return_value=[mock_paper]), patch.object(client, "download_pdf_bytes", return_value=b"%PDF-content"):
         with patch("fitz.open", return_value=mock_doc):
             papers = client.fetch_papers_by_query(queries)
             assert len(papers) == 1
@@ -125,30 +364,28 @@ def test_fetch_papers_by_query():
             mock_doc.close.assert_called_once()
 
 
-def test_fetch_papers_with_references_by_query():
-    client = ArxivClient()
+def test_fetch_papers_with_references_by_query(client):
     queries = ["Sample Query"]
     main_paper = MagicMock()
     main_paper.title = "Sample Query"
     main_paper.entry_id = "https://arxiv.org/abs/1234.56789"
-    main_paper.download_pdf.return_value = "/tmp/main.pdf"
     main_paper.authors = []
     main_paper.published = None
 
     ref_paper = MagicMock()
     ref_paper.title = "Reference Paper"
     ref_paper.entry_id = "https://arxiv.org/abs/9876.54321"
-    ref_paper.download_pdf.return_value = "/tmp/ref.pdf"
     ref_paper.authors = []
     ref_paper.published = None
 
-    with patch.object(client, "search_by_query", return_value=[main_paper]):
+    with patch.object(client, "search_by_query", return_value=[main_paper]), patch.object(client, "download_pdf_bytes", return_value=b"%PDF-content"):
         with patch.object(
             client,
-            "fetch_papers_by_url",
+            "fetch_papers_by_id",
             return_value=[Paper(title="Reference Paper", text="Content", url="https://arxiv.org/abs/9876.54321")],
         ):
             mock_doc = MagicMock()
+            mock_doc.needs_pass = False
             mock_page = MagicMock()
             mock_page.get_text.return_value = "Content with https://arxiv.org/abs/9876.54321"
             mock_doc.__iter__ = lambda self: iter([mock_page])
@@ -160,41 +397,108 @@ def test_fetch_papers_with_references_by_query():
                 assert len(papers[0].references) == 1
 
 
-def test_download_papers_by_url():
-    client = ArxivClient()
+def test_download_papers_by_url(client):
     urls = ["https://arxiv.org/abs/1234.56789"]
     mock_paper = MagicMock()
     mock_paper.title = "Sample Paper"
-    mock_paper.download_pdf = MagicMock()
 
-    with patch.object(client, "search_by_url", return_value=[mock_paper]):
+    with patch.object(client, "search_by_url", return_value=[mock_paper]), patch.object(client, "download_pdf") as mock_download_pdf:
         client.download_papers_by_url(urls, save_dir="/tmp")
-        mock_paper.download_pdf.assert_called_once()
+        mock_download_pdf.assert_called_once_with(mock_paper, dirpath="/tmp", filename="Sample_Paper.pdf")
 
 
-def test_download_papers_by_query():
-    client = ArxivClient()
+def test_download_papers_by_query(client):
     queries = ["Sample Query"]
     mock_paper = MagicMock()
     mock_paper.title = "Sample Query"
-    mock_paper.download_pdf = MagicMock()
 
-    with patch.object(client, "search_by_query", return_value=[mock_paper]):
+    with patch.object(client, "search_by_query", return_value=[mock_paper]), patch.object(client, "download_pdf") as mock_download_pdf:
         client.download_papers_by_query(queries, save_dir="/tmp")
-        mock_paper.download_pdf.assert_called_once()
+        mock_download_pdf.assert_called_once_with(mock_paper, dirpath="/tmp", filename="Sample_Query.pdf")
+
+
+def test_client_configuration(client):
+    assert client.client.page_size == 100
+    assert client.client.delay_seconds == 3
+    assert client.session.get_adapter("https://export.arxiv.org").max_retries.total == 3
+
+
+def test_download_pdf(tmp_path):
+    mock_session = MagicMock()
+    mock_response = mock_session.get.return_value.__enter__.return_value
+    mock_response.iter_content.return_value = [b"%PDF-", b"content"]
+    client = ArxivClient(session=mock_session)
 
+    mock_paper = MagicMock()
+    mock_paper.pdf_url = "http://arxiv.org/pdf/1234.56789v1"
+
+    pdf_path = client.download_pdf(mock_paper, dirpath=str(tmp_path), filename="sample.pdf")
+
+    assert pdf_path == str(tmp_path / "sample.pdf")
+    assert (tmp_path / "sample.pdf").read_bytes() == b"%PDF-content"
+    assert mock_session.get.call_args.args[0] == "https://export.arxiv.org/pdf/1234.56789v1"
+    mock_response.raise_for_status.assert_called_once()
 
-def test_load_paper_as_file_by_url():
-    client = ArxivClient()
+
+def test_download_pdf_rejects_non_pdf(tmp_path):
+    mock_session = MagicMock()
+    mock_response = mock_session.get.return_value.__enter__.return_value
+    mock_response.iter_content.return_value = [b"<html>Rate limited</html>"]
+    client = ArxivClient(session=mock_session)
+
+    mock_paper = MagicMock()
+    mock_paper.pdf_url = "http://arxiv.org/pdf/1234.56789v1"
+
+    with pytest.raises(ValueError):
+        client.download_pdf(mock_paper, dirpath=str(tmp_path), filename="sample.pdf")
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_download_pdf_bytes():
+    mock_session = MagicMock()
+    mock_session.get.return_value.content = b"%PDF-content"
+    client = ArxivClient(session=mock_session)
+
+    mock_paper = MagicMock()
+    mock_paper.pdf_url = "http://arxiv.org/pdf/1234.56789v1"
+
+    assert client.download_pdf_bytes(mock_paper) == b"%PDF-content"
+    assert mock_session.get.call_args.args[0] == "https://export.arxiv.org/pdf/1234.56789v1"
+    mock_session.get.return_value.raise_for_status.assert_called_once()
+
+
+def test_load_paper_as_file_by_url(client):
     url = "https://arxiv.org/abs/1234.56789"
     mock_paper = MagicMock()
-    mock_paper.download_pdf.return_value = "/tmp/sample.pdf"
 
-    with patch.object(client, "search_by_url", return_value=[mock_paper]):
-        m_open = mock_open(read_data=b"PDF content")
-        with patch("builtins.open", m_open):
-            file_obj = client.load_paper_as_file_by_url(url)
-            assert file_obj.read() == b"PDF content"
+    with patch.object(client, "search_by_url", return_value=[mock_paper]), patch.object(client, "download_pdf_bytes", return_value=b"%PDF-content"):
+        file_obj = client.load_paper_as_file_by_url(url)
+        assert file_obj.read() == b"%PDF-content"
+
+
+def test_fetch_paper_with_pdf_by_url(client):
+    mock_paper = MagicMock()
+    mock_paper.title = "Sample Paper"
+    mock_paper.entry_id = "https://arxiv.org/abs/1234.56789"
+    mock_paper.authors = []
+    mock_paper.published = None
+
+    mock_doc = MagicMock()
+    mock_doc.needs_pass = False
+    mock_page = MagicMock()
+    mock_page.get_text.return_value = "Paper content"
+    mock_doc.__iter__ = lambda self: iter([mock_page])
+
+    with patch.object(client, "search_by_url", return_value=[mock_paper]), patch.object(
+        client, "download_pdf_bytes", return_value=b"%PDF-content"
+    ) as mock_download_pdf_bytes:
+        with patch("fitz.open", return_value=mock_doc):
+            paper, pdf_bytes = client.fetch_paper_with_pdf_by_url("https://arxiv.org/abs/1234.56789")
+
+    mock_download_pdf_bytes.assert_called_once_with(mock_paper)
+    assert paper.title == "Sample Paper"
+    assert paper.text == "Paper content"
+    assert pdf_bytes == b"%PDF-content"
 
 
 def test_fetch_papers_by_url_function():
@@ -204,6 +508,13 @@ def test_fetch_papers_by_url_function():
         mock_client.fetch_papers_by_url.assert_called_once_with(urls)
 
 
+def test_fetch_metadata_by_url_function():
+    url = "https://arxiv.org/abs/1234.56789"
+    with patch("arxiv_paper_summarizer.arxiv.arxiv_client") as mock_client:
+        fetch_metadata_by_url(url)
+        mock_client.fetch_metadata_by_url.assert_called_once_with([url])
+
+
 def test_fetch_papers_by_query_function():
     queries = ["Sample Query"]
     with patch("arxiv_paper_summarizer.arxiv.arxiv_client") as mock_client:
@@ -242,6 +553,23 @@ def test_extract_refs():
     assert paper2 in refs
 
 
+def test_extract_refs_shared_references():
+    shared = Paper(title="Shared", text="Text", url="https://example.com/shared")
+    paper1 = Paper(title="Paper 1", text="Text 1", url="https://example.com/url1", references=[shared])
+    paper2 = Paper(title="Paper 2", text="Text 2", url="https://example.com/url2", references=[shared])
+
+    assert [paper.title for paper in extract_refs([paper1, paper2])] == ["Paper 1", "Shared", "Paper 2"]
+
+
+def test_paper_flatten():
+    leaf = Paper(title="Leaf", text="Text", url="https://example.com/leaf")
+    first = Paper(title="First", text="Text", url="https://example.com/first", references=[leaf])
+    second = Paper(title="Second", text="Text", url="https://example.com/second")
+    root = Paper(title="Root", text="Text", url="https://example.com/root", references=[first, second])
+
+    assert [paper.title for paper in root.flatten()] == ["Root", "First", "Leaf", "Second"]
+
+
 def test_paper_model_with_authors_and_published():
     """Test that Paper model correctly handles authors and published fields."""
     # Test with all fields provided
@@ -269,14 +597,12 @@ def test_paper_model_with_authors_and_published():
     assert paper_defaults.published is None  # Default None
 
 
-def test_fetch_papers_by_query_with_authors_and_published():
+def test_fetch_papers_by_query_with_authors_and_published(client):
     """Test that fetch_papers_by_query correctly populates authors and published fields."""
-    client = ArxivClient()
     queries = ["Sample Query"]
     mock_paper = MagicMock()
     mock_paper.title = "Sample Query"
     mock_paper.entry_id = "https://arxiv.org/abs/1234.56789"
-    mock_paper.download_pdf.return_value = "/tmp/sample.pdf"
 
     # Mock authors
     mock_author1 = MagicMock()
@@ -291,11 +617,12 @@ def test_fetch_papers_by_query_with_authors_and_published():
     mock_paper.published = datetime(2023, 12, 5, 14, 45)
 
     mock_doc = MagicMock()
+    mock_doc.needs_pass = False
     mock_page = MagicMock()
     mock_page.get_text.return_value = "Paper content"
     mock_doc.__iter__ = lambda self: iter([mock_page])
 
-    with patch.object(client, "search_by_query", return_value=[mock_paper]):
+    with patch.object(client, "search_by_query", return_value=[mock_paper]), patch.object(client, "download_pdf_bytes", return_value=b"%PDF-content"):
         with patch("fitz.open", return_value=mock_doc):
             papers = client.fetch_papers_by_query(queries)
             assert len(papers) == 1
@@ -305,47 +632,46 @@ def test_fetch_papers_by_query_with_authors_and_published():
             mock_doc.close.assert_called_once()
 
 
-def test_pdf_documents_are_closed_after_processing():
+def test_pdf_documents_are_closed_after_processing(client):
     """Test that PDF documents are properly closed after processing."""
-    client = ArxivClient()
     urls = ["https://arxiv.org/abs/1234.56789"]
 
     mock_paper = MagicMock()
     mock_paper.title = "Test Paper"
     mock_paper.entry_id = "https://arxiv.org/abs/1234.56789"
-    mock_paper.download_pdf.return_value = "/tmp/test.pdf"
     mock_paper.authors = []
     mock_paper.published = None
 
     mock_doc = MagicMock()
+    mock_doc.needs_pass = False
     mock_doc.get_text.return_value = "Test content"
     mock_doc.__iter__ = lambda self: iter([mock_doc])
 
-    with patch.object(client, "search_by_url", return_value=[mock_paper]):
+    with patch.object(client, "search_by_url", return_value=[mock_paper]), patch.object(client, "download_pdf_bytes", return_value=b"%PDF-content"):
         with patch("fitz.open", return_value=mock_doc) as mock_fitz_open:
             client.fetch_papers_by_url(urls)
-            mock_fitz_open.assert_called_once_with("/tmp/test.pdf")
+            mock_fitz_open.assert_called_once_with(stream=b"%PDF-content", filetype="pdf")
+            mock_doc.get_text.assert_called_once_with("text", flags=_PDF_TEXT_FLAGS)
             mock_doc.close.assert_called_once()
 
 
-def test_pdf_documents_are_closed_after_processing_by_query():
+def test_pdf_documents_are_closed_after_processing_by_query(client):
     """Test that PDF documents are properly closed after processing by query."""
-    client = ArxivClient()
     queries = ["Test Query"]
 
     mock_paper = MagicMock()
     mock_paper.title = "Test Query"
     mock_paper.entry_id = "https://arxiv.org/abs/1234.56789"
-    mock_paper.download_pdf.return_value = "/tmp/test.pdf"
     mock_paper.authors = []
     mock_paper.published = None
 
     mock_doc = MagicMock()
+    mock_doc.needs_pass = False
     mock_doc.get_text.return_value = "Test content"
     mock_doc.__iter__ = lambda self: iter([mock_doc])
 
-    with patch.object(client, "search_by_query", return_value=[mock_paper]):
+    with patch.object(client, "search_by_query", return_value=[mock_paper]), patch.object(client, "download_pdf_bytes", return_value=b"%PDF-content"):
         with patch("fitz.open", return_value=mock_doc) as mock_fitz_open:
             client.fetch_papers_by_query(queries)
-            mock_fitz_open.assert_called_once_with("/tmp/test.pdf")
+            mock_fitz_open.assert_called_once_with(stream=b"%PDF-content", filetype="pdf")
             mock_doc.close.assert_called_once()
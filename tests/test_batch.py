@@ -0,0 +1,58 @@
+import json
+from unittest.mock import MagicMock
+
+import pytest
+
+from arxiv_paper_summarizer.batch import BATCH_ENDPOINT, load_batch_results, run_batch, submit_batch
+from arxiv_paper_summarizer.types import BatchRequest
+
+
+def _make_output_line(custom_id, content, status_code=200):
+    return json.dumps(
+        {
+            "custom_id": custom_id,
+            "response": {"status_code": status_code, "body": {"choices": [{"message": {"content": content}}]}},
+        }
+    )
+
+
+def test_submit_batch():
+    llm = MagicMock()
+    llm.files.create.return_value.id = "file-1"
+    llm.batches.create.return_value.id = "batch-1"
+    requests = [BatchRequest(custom_id="paper#keynote", body={"model": "gpt-4o", "messages": []})]
+
+    assert submit_batch(requests, llm) == "batch-1"
+
+    _, jsonl = llm.files.create.call_args.kwargs["file"]
+    assert json.loads(jsonl) == {"custom_id": "paper#keynote", "method": "POST", "url": BATCH_ENDPOINT, "body": requests[0].body}
+    llm.batches.create.assert_called_once_with(input_file_id="file-1", endpoint=BATCH_ENDPOINT, completion_window="24h")
+
+    with pytest.raises(ValueError):
+        submit_batch([], llm)
+
+
+def test_submit_batch_rejects_unsupported_models():
+    llm = MagicMock()
+    requests = [BatchRequest(custom_id="paper#keynote", body={"model": "claude-4-sonnet", "messages": []})]
+
+    with pytest.raises(ValueError, match="claude-4-sonnet"):
+        submit_batch(requests, llm)
+    llm.files.create.assert_not_called()
+
+
+def test_load_batch_results():
+    llm = MagicMock()
+    llm.files.content.return_value.text = "\n".join([_make_output_line("a", "Keynote A"), _make_output_line("b", "Error", status_code=500)])
+    batch = MagicMock(output_file_id="file-2")
+
+    assert load_batch_results(batch, llm) == {"a": "Keynote A"}
+
+
+def test_run_batch_failed():
+    llm = MagicMock()
+    llm.batches.retrieve.return_value = MagicMock(status="failed", output_file_id=None)
+    requests = [BatchRequest(custom_id="paper#keynote", body={"model": "gpt-4o", "messages": []})]
+
+    with pytest.raises(RuntimeError):
+        run_batch(requests, llm, poll_interval=0)
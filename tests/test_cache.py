@@ -0,0 +1,71 @@
+import pytest
+
+from arxiv_paper_summarizer.cache import CACHE_DIR_ENV_VAR, FileCache, get_cache, get_default_cache, make_cache_key
+from arxiv_paper_summarizer.types import Paper
+
+
+def test_file_cache(tmp_path):
+    cache = FileCache(tmp_path)
+    key = make_cache_key("gpt-4o", [{"role": "user", "content": "Hello"}])
+
+    assert cache.get(key) is None
+    assert key not in cache
+
+    cache.set(key, "Hi there!")
+
+    assert key in cache
+    assert cache.get(key) == "Hi there!"
+    assert FileCache(tmp_path).get(key) == "Hi there!"
+
+
+def test_file_cache_paper(tmp_path):
+    cache = FileCache(tmp_path)
+    paper = Paper(title="Test Paper", text="Ünïcode text", url="https://arxiv.org/abs/2410.20672v1", authors=["Author"])
+
+    cache.set("2410.20672v1", paper.model_dump(mode="json"))
+
+    assert Paper.model_validate(cache.get("2410.20672v1")) == paper
+
+
+def test_file_cache_corrupted(tmp_path):
+    cache = FileCache(tmp_path)
+    cache.set("key", "value")
+    (tmp_path / "ke" / "key.json").write_text("{not json")
+
+    assert cache.get("key") is None
+
+
+def test_file_cache_bytes(tmp_path):
+    cache = FileCache(tmp_path)
+
+    assert cache.get_bytes("2410.20672v1") is None
+
+    cache.set_bytes("2410.20672v1", b"%PDF-1.7")
+
+    assert cache.get_bytes("2410.20672v1") == b"%PDF-1.7"
+    assert cache.get("2410.20672v1") is None
+
+
+def test_make_cache_key():
+    assert make_cache_key("gpt-4o", {"a": 1, "b": 2}) == make_cache_key("gpt-4o", {"b": 2, "a": 1})
+    assert make_cache_key("gpt-4o", "text") != make_cache_key("gpt-4o-mini", "text")
+    assert len(make_cache_key("gpt-4o", "text")) == 32
+
+
+def test_get_default_cache(monkeypatch: pytest.MonkeyPatch, tmp_path):
+    monkeypatch.delenv(CACHE_DIR_ENV_VAR, raising=False)
+    assert get_default_cache() is None
+
+    monkeypatch.setenv(CACHE_DIR_ENV_VAR, str(tmp_path))
+    cache = get_default_cache("summaries")
+    assert cache is not None
+    assert cache.cache_dir == tmp_path / "summaries"
+
+
+def test_get_cache(monkeypatch: pytest.MonkeyPatch, tmp_path):
+    monkeypatch.delenv(CACHE_DIR_ENV_VAR, raising=False)
+    assert get_cache(None, "sections") is None
+
+    cache = get_cache(tmp_path, "sections")
+    assert cache is not None
+    assert cache.cache_dir == tmp_path / "sections"
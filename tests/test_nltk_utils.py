@@ -3,22 +3,21 @@
 import os
 import sys
 import warnings
-from pathlib import Path
 from unittest.mock import Mock, patch
 
 import pytest
 
-# Add src to path
-sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
-
+from arxiv_paper_summarizer import utils
 from arxiv_paper_summarizer.utils import patch_nltk_download, setup_nltk_offline, setup_unstructured_environment
 
 
 class TestNLTKUtils:
     """Test cases for NLTK utility functions."""
 
-    def test_setup_unstructured_environment(self):
+    def test_setup_unstructured_environment(self, monkeypatch):
         """Test that environment variables are set correctly."""
+        monkeypatch.setattr(utils, "_UNSTRUCTURED_ENV_SETUP_DONE", False)
+
         # Store original environment variables
         original_nltk_data = os.environ.get("NLTK_DATA")
         original_disable_download = os.environ.get("UNSTRUCTURED_DISABLE_NLTK_DOWNLOAD")
@@ -44,6 +43,11 @@ class TestNLTKUtils:
             for expected_path in expected_paths:
                 assert expected_path in nltk_data_paths
 
+            # Later calls in the same process leave the environment alone
+            os.environ["NLTK_DATA"] = "/custom/nltk_data"
+            setup_unstructured_environment()
+            assert os.environ["NLTK_DATA"] == "/custom/nltk_data"
+
         finally:
             # Restore original environment variables
             if original_nltk_data is not None:
@@ -78,7 +82,7 @@ class TestNLTKUtils:
 
     @patch("arxiv_paper_summarizer.utils.ssl")
     @patch("arxiv_paper_summarizer.utils.warnings.warn")
-    def test_setup_nltk_offline_success(self, mock_warn, mock_ssl):
+    def test_setup_nltk_offline_success(self, mock_warn, mock_ssl, monkeypatch):
         """Test successful NLTK offline setup."""
         # Mock nltk module
         mock_nltk = Mock()
@@ -86,64 +90,68 @@ class TestNLTKUtils:
         mock_nltk.data.find = Mock(side_effect=LookupError("Not found"))
         mock_nltk.download = Mock(return_value=True)
 
-        with patch.dict("sys.modules", {"nltk": mock_nltk}):
-            with patch("os.path.exists", return_value=True):
-                result = setup_nltk_offline()
+        monkeypatch.setitem(sys.modules, "nltk", mock_nltk)
 
-                assert result is True
-                # Check that SSL context was set
-                mock_ssl._create_default_https_context = mock_ssl._create_unverified_context
+        with patch("os.path.exists", return_value=True):
+            result = setup_nltk_offline()
+
+            assert result is True
+            # Check that SSL context was set
+            mock_ssl._create_default_https_context = mock_ssl._create_unverified_context
 
-                # Check that NLTK paths were added
-                assert len(mock_nltk.data.path) > 0
+            # Check that NLTK paths were added
+            assert len(mock_nltk.data.path) > 0
 
     @patch("arxiv_paper_summarizer.utils.warnings.warn")
-    def test_patch_nltk_download_success(self, mock_warn):
+    def test_patch_nltk_download_success(self, mock_warn, monkeypatch):
         """Test successful NLTK download patching."""
         # Mock nltk module
         mock_nltk = Mock()
         original_download = Mock()
         mock_nltk.download = original_download
 
-        with patch.dict("sys.modules", {"nltk": mock_nltk}):
-            result = patch_nltk_download()
+        monkeypatch.setitem(sys.modules, "nltk", mock_nltk)
 
-            assert result is True
-            # Check that download function was replaced
-            assert mock_nltk.download != original_download
+        result = patch_nltk_download()
+
+        assert result is True
+        # Check that download function was replaced
+        assert mock_nltk.download != original_download
 
     @patch("arxiv_paper_summarizer.utils.warnings.warn")
-    def test_patched_download_handles_403_error(self, mock_warn):
+    def test_patched_download_handles_403_error(self, mock_warn, monkeypatch):
         """Test that patched download function handles 403 errors gracefully."""
         # Mock nltk module
         mock_nltk = Mock()
         original_download = Mock(side_effect=Exception("HTTP Error 403: Forbidden"))
         mock_nltk.download = original_download
 
-        with patch.dict("sys.modules", {"nltk": mock_nltk}):
-            patch_nltk_download()
+        monkeypatch.setitem(sys.modules, "nltk", mock_nltk)
 
-            # Test the patched download function
-            result = mock_nltk.download("punkt")
+        patch_nltk_download()
 
-            assert result is False
-            mock_warn.assert_called()
-            assert "NLTK download blocked" in str(mock_warn.call_args[0][0])
+        # Test the patched download function
+        result = mock_nltk.download("punkt")
+
+        assert result is False
+        mock_warn.assert_called()
+        assert "NLTK download blocked" in str(mock_warn.call_args[0][0])
 
     @patch("arxiv_paper_summarizer.utils.warnings.warn")
-    def test_patched_download_reraises_other_errors(self, mock_warn):
+    def test_patched_download_reraises_other_errors(self, mock_warn, monkeypatch):
         """Test that patched download function reraises non-HTTP errors."""
         # Mock nltk module
         mock_nltk = Mock()
         original_download = Mock(side_effect=ValueError("Some other error"))
         mock_nltk.download = original_download
 
-        with patch.dict("sys.modules", {"nltk": mock_nltk}):
-            patch_nltk_download()
+        monkeypatch.setitem(sys.modules, "nltk", mock_nltk)
+
+        patch_nltk_download()
 
-            # Test the patched download function
-            with pytest.raises(ValueError, match="Some other error"):
-                mock_nltk.download("punkt")
+        # Test the patched download function
+        with pytest.raises(ValueError, match="Some other error"):
+            mock_nltk.download("punkt")
 
 
 if __name__ == "__main__":
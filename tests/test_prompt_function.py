@@ -0,0 +1,96 @@
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+import httpx
+import pytest
+from openai import APITimeoutError, BadRequestError
+from pydantic import BaseModel
+
+from arxiv_paper_summarizer.cache import FileCache
+
+from arxiv_paper_summarizer.prompt_function import MIN_REQUEST_TIMEOUT, build_request, openai_prompt
+
+
+def make_completion(content):
+    completion = MagicMock()
+    completion.choices[0].message.content = content
+    return completion
+
+
+@pytest.fixture
+def fast_retries(mocker):
+    mocker.patch("arxiv_paper_summarizer.prompt_function.compute_token", return_value=10)
+    return mocker.patch("time.sleep")
+
+
+def test_prompt_function_retries_transient_errors(fast_retries):
+    llm = MagicMock()
+    request = httpx.Request("POST", "https://api.openai.com/v1/chat/completions")
+    llm.chat.completions.create.side_effect = [APITimeoutError(request=request), make_completion("Hello, World!")]
+
+    @openai_prompt("Say hello to {name}", llm=llm)
+    def greet(name: str) -> str: ...
+
+    assert greet("World") == "Hello, World!"
+    assert llm.chat.completions.create.call_count == 2
+    assert llm.chat.completions.create.call_args.kwargs["timeout"] == MIN_REQUEST_TIMEOUT
+
+
+def test_prompt_function_does_not_retry_invalid_requests(fast_retries):
+    llm = MagicMock()
+    response = httpx.Response(400, request=httpx.Request("POST", "https://api.openai.com/v1/chat/completions"))
+    llm.chat.completions.create.side_effect = BadRequestError("Invalid request", response=response, body=None)
+
+    @openai_prompt("Say hello to {name}", llm=llm)
+    def greet(name: str) -> str: ...
+
+    with pytest.raises(BadRequestError):
+        greet("World")
+    assert llm.chat.completions.create.call_count == 1
+
+
+def test_async_prompt_function(fast_retries):
+    llm = MagicMock()
+    llm.chat.completions.create = AsyncMock(return_value=make_completion("Hello, World!"))
+
+    @openai_prompt("Say hello to {name}", llm=llm)
+    async def greet(name: str) -> str: ...
+
+    assert asyncio.run(greet("World")) == "Hello, World!"
+    llm.chat.completions.create.assert_awaited_once()
+
+
+def test_prompt_function_does_not_cache_refusals(fast_retries, tmp_path):
+    class Greeting(BaseModel):
+        text: str
+
+    refusal = MagicMock()
+    refusal.choices[0].message.refusal = "I can't help with that."
+    parsed = MagicMock()
+    parsed.choices[0].message.refusal = None
+    parsed.choices[0].message.parsed = Greeting(text="Hello, World!")
+    llm = MagicMock()
+    llm.beta.chat.completions.parse.side_effect = [refusal, parsed]
+
+    @openai_prompt("Say hello to {name}", llm=llm, response_format=Greeting, cache=FileCache(tmp_path))
+    def greet(name: str) -> Greeting: ...
+
+    assert greet("World") == "I can't help with that."
+    assert greet("World") == Greeting(text="Hello, World!")
+    assert greet("World") == Greeting(text="Hello, World!")
+    assert llm.beta.chat.completions.parse.call_count == 2
+
+
+def test_build_request():
+    class Greeter:
+        @openai_prompt("Say hello to {name}", model_name="gpt-4o-mini")
+        async def greet(self, name: str) -> str: ...
+
+    @openai_prompt("Say goodbye to {name}", model_name="gpt-4o")
+    def farewell(name: str) -> str: ...
+
+    assert build_request(Greeter().greet, "World") == {"model": "gpt-4o-mini", "messages": [{"role": "user", "content": "Say hello to World"}]}
+    assert build_request(farewell, name="World") == {"model": "gpt-4o", "messages": [{"role": "user", "content": "Say goodbye to World"}]}
+
+    with pytest.raises(TypeError):
+        build_request(print, "World")
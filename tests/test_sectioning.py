@@ -0,0 +1,38 @@
+from arxiv_paper_summarizer.sectioning import split_sections_by_headings
+
+PAPER_TEXT = """A Great Paper
+Abstract
+We propose a method.
+1
+Introduction
+Transformers are popular (see Figure 1).
+2
+2. Related Work
+Prior work is summarized in Table 1 and Figure 1.
+3 Method
+Our method is shown in Fig. 2.
+1. First we tokenize.
+4 Experiments
+Results are in Table 2.
+References
+[1] Attention is all you need.
+"""
+
+
+def test_split_sections_by_headings():
+    sections = split_sections_by_headings(PAPER_TEXT)
+
+    assert sections is not None
+    assert [section.section for section in sections] == ["Introduction", "Related Work", "Method", "Experiments"]
+    assert sections[0].content == "Transformers are popular (see Figure 1).\n2"
+    assert sections[0].ref_fig == ["figure-1"]
+    assert sections[1].ref_fig == []
+    assert sections[1].ref_tb == ["table-1"]
+    assert sections[2].ref_fig == ["figure-2"]
+    assert "First we tokenize." in sections[2].content
+    assert sections[3].ref_tb == ["table-2"]
+    assert "Attention is all you need" not in sections[3].content
+
+
+def test_split_sections_by_headings_without_headings():
+    assert split_sections_by_headings("A scanned paper without any numbered headings.\nIt has some text.") is None
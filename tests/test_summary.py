@@ -0,0 +1,155 @@
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import AsyncMock, MagicMock
+
+from unstructured.documents.elements import ElementMetadata, Image, Text
+
+from arxiv_paper_summarizer import ArxivPaperSummarizer, summary
+from arxiv_paper_summarizer.cache import CACHE_DIR_ENV_VAR
+from arxiv_paper_summarizer.types import ExtractedSectionList, ExtractedSectionResult, Paper, SectionInfo
+
+
+def make_summarizer() -> ArxivPaperSummarizer:
+    # Skip __init__, which downloads and partitions the paper
+    summarizer = ArxivPaperSummarizer.__new__(ArxivPaperSummarizer)
+    summarizer._max_concurrency = 2
+    summarizer._cache_dir = None
+    summarizer._image_encodings = {}
+    summarizer._llm = None
+    summarizer._owns_llm = False
+    return summarizer
+
+
+def test_extract_section_note_list(mocker):
+    summarizer = make_summarizer()
+    sections = [
+        SectionInfo(title="Introduction", content="Intro content", image_encoding_str_list=["img"], image_paths=["figure-1.jpg"], table_paths=[]),
+        SectionInfo(title="Method", content="Method content", image_encoding_str_list=[], image_paths=[], table_paths=["table-1.jpg"]),
+    ]
+    mocker.patch.object(ArxivPaperSummarizer, "summarize_section_batch", AsyncMock(return_value=["Intro summary", None]))
+    mocker.patch.object(ArxivPaperSummarizer, "summarize_section", AsyncMock(return_value="Method summary"))
+    mocker.patch.object(ArxivPaperSummarizer, "summarize_images", AsyncMock(return_value="Image summary"))
+    mocker.patch.object(ArxivPaperSummarizer, "organize_section_summary", AsyncMock(side_effect=lambda summary, images: f"{summary} {images}"))
+    mocker.patch.object(ArxivPaperSummarizer, "extract_section_quotes", AsyncMock(return_value="NO_QUOTES"))
+
+    section_notes = summarizer.extract_section_note_list(sections)
+
+    assert [note.header for note in section_notes] == ["Introduction", "Method"]
+    assert section_notes[0].summary_content == "Intro summary ['Image summary']"
+    assert section_notes[1].summary_content == "Method summary []"
+    assert section_notes[1].table_paths == ["table-1.jpg"]
+    ArxivPaperSummarizer.summarize_section.assert_awaited_once_with(text="Method content", title="Method")
+
+
+def test_get_section_info_list(mocker, tmp_path):
+    summarizer = make_summarizer()
+    summarizer._image_output_dir = str(tmp_path)
+    summarizer._image_filename_set = {"figure-1", "table-1"}
+    summarizer._img_path_map = {"figure-1": "figure-1-1", "table-1": "table-2-1"}
+    mock_encode_image = mocker.patch("arxiv_paper_summarizer.summary.encode_image", side_effect=lambda path: f"enc:{path}")
+    sections = [
+        ExtractedSectionResult(section="Introduction", content="Intro", ref_fig=["figure-1", "figure-9"], ref_tb=[]),
+        ExtractedSectionResult(section="Empty", content="", ref_fig=[], ref_tb=[]),
+        ExtractedSectionResult(section="Results", content="Results", ref_fig=["figure-1"], ref_tb=["table-1"]),
+    ]
+
+    section_info_list = summarizer.get_section_info_list(sections)
+
+    figure_path, table_path = str(tmp_path / "figure-1-1.jpg"), str(tmp_path / "table-2-1.jpg")
+    assert [section.title for section in section_info_list] == ["Introduction", "Results"]
+    assert section_info_list[0].image_encoding_str_list == [f"enc:{figure_path}"]
+    assert section_info_list[1].image_paths == [figure_path]
+    assert section_info_list[1].table_paths == [table_path]
+    assert section_info_list[1].image_encoding_str_list == [f"enc:{figure_path}", f"enc:{table_path}"]
+    assert mock_encode_image.call_count == 2
+
+    # Images encoded for an earlier section list are reused
+    summarizer.get_section_info_list(sections)
+    assert mock_encode_image.call_count == 2
+
+
+def test_extract_section_list_cached(mocker, tmp_path):
+    summarizer = make_summarizer()
+    summarizer._cache_dir = tmp_path
+    sections = [ExtractedSectionResult(section="Introduction", content="Intro", ref_fig=[], ref_tb=[])]
+    mocker.patch("arxiv_paper_summarizer.summary.split_sections_by_headings", return_value=None)
+    mock_extract = mocker.patch.object(ArxivPaperSummarizer, "_extract_section_list_with_llm", AsyncMock(return_value=sections))
+
+    assert summarizer.extract_section_list("Paper text") == sections
+    assert summarizer.extract_section_list("Paper text") == sections
+    mock_extract.assert_awaited_once_with("Paper text")
+
+
+def test_partition_runs_in_background(mocker, tmp_path):
+    summarizer = make_summarizer()
+    summarizer._arxiv_url = "https://arxiv.org/abs/1234.56789"
+    summarizer._pdf_bytes = b"%PDF-content"
+    summarizer._image_output_dir = str(tmp_path)
+    summarizer._elements = None
+    summarizer._image_path_list = None
+    elements = [Text("Intro"), Image("Figure", metadata=ElementMetadata(image_path=str(tmp_path / "figure-3-1.jpg")))]
+    # Threads stand in for the worker process, which would not see the mock
+    mocker.patch("arxiv_paper_summarizer.summary._get_partition_executor", return_value=ThreadPoolExecutor(max_workers=1))
+    mock_partition = mocker.patch("arxiv_paper_summarizer.summary.partition_paper_pdf", return_value=elements)
+
+    summarizer._elements_future = summarizer._submit_partition()
+
+    assert summarizer.elements == elements
+    assert [image_path.filename for image_path in summarizer.image_path_list] == ["figure-3-1"]
+    mock_partition.assert_called_once_with(b"%PDF-content", str(tmp_path))
+
+
+def test_partition_executor_is_shared_and_spawned(mocker):
+    mocker.patch("arxiv_paper_summarizer.summary._partition_executor", None)
+
+    executor = summary._get_partition_executor()
+    try:
+        assert summary._get_partition_executor() is executor
+        assert executor._mp_context.get_start_method() == "spawn"
+    finally:
+        executor.shutdown()
+
+
+def test_extract_section_list_with_llm(mocker):
+    summarizer = make_summarizer()
+    sections = [ExtractedSectionResult(section="Introduction", content="Intro", ref_fig=["figure-1"], ref_tb=[])]
+    mocker.patch("arxiv_paper_summarizer.summary.split_sections_by_headings", return_value=None)
+    mocker.patch.object(ArxivPaperSummarizer, "_extract_paper_sections", AsyncMock(return_value=ExtractedSectionList(sections=sections)))
+
+    assert summarizer.extract_section_list("Paper text") == sections
+
+
+def test_prompts_share_the_summarizer_llm(mocker, monkeypatch):
+    monkeypatch.delenv(CACHE_DIR_ENV_VAR, raising=False)
+    mocker.patch("arxiv_paper_summarizer.prompt_function.compute_token", return_value=10)
+    summarizer = make_summarizer()
+    summarizer._paper = Paper(title="Sample Paper", text="Paper text", url="https://arxiv.org/abs/1234.56789")
+    llm = MagicMock()
+    llm.close = AsyncMock()
+    completion = MagicMock()
+    completion.choices[0].message.content = "Keynote"
+    llm.chat.completions.create = AsyncMock(return_value=completion)
+    get_llm = mocker.patch.object(ArxivPaperSummarizer, "get_llm", return_value=llm)
+
+    assert summarizer.extract_keynote() == "Keynote"
+
+    get_llm.assert_called_once()
+    llm.chat.completions.create.assert_awaited_once()
+    llm.close.assert_awaited_once()
+    assert summarizer._llm is None
+
+
+def test_section_summary_prompts_share_model():
+    prompts = ArxivPaperSummarizer.__dict__
+    assert prompts["_summarize_sections"].model_name == prompts["summarize_section"].model_name == ArxivPaperSummarizer._SECTION_SUMMARY_MODEL_NAME
+
+
+def test_build_batch_requests(mocker):
+    summarizer = make_summarizer()
+    summarizer._paper = Paper(title="Sample Paper", text="Paper text", url="https://arxiv.org/abs/1234.56789")
+
+    (request,) = summarizer.build_batch_requests()
+
+    assert request.custom_id == "https://arxiv.org/abs/1234.56789#keynote"
+    assert request.body["model"] == ArxivPaperSummarizer.get_keynote_model_name(batch=True)
+    assert ArxivPaperSummarizer.__dict__["_extract_keynote"].model_name == ArxivPaperSummarizer.get_keynote_model_name()
+    assert "Paper text" in request.body["messages"][-1]["content"]
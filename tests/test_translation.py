@@ -0,0 +1,29 @@
+from arxiv_paper_summarizer import translation
+
+
+def test_translate_text_is_cached(mocker):
+    translation.translate_text.cache_clear()
+    mock_translate = mocker.patch.object(translation, "_translate_text", return_value="你好")
+
+    assert translation.translate_text("Hello", "Traditional Chinese") == "你好"
+    assert translation.translate_text("Hello", "Traditional Chinese") == "你好"
+    mock_translate.assert_called_once_with("Hello", "Traditional Chinese")
+
+    translation.translate_text("Hello", "Japanese")
+    assert mock_translate.call_count == 2
+
+
+def test_translate_texts(mocker):
+    translation.translate_text.cache_clear()
+    mock_translate_batch = mocker.patch.object(
+        translation, "_translate_text_batch", return_value="===ITEM 1===\n你好\n\n===ITEM 3===\n再見\n"
+    )
+    mock_translate = mocker.patch.object(translation, "_translate_text", return_value="謝謝")
+
+    translations = translation.translate_texts(["Hello", "Thanks", "Hello", "Bye"], "Traditional Chinese")
+
+    assert translations == ["你好", "謝謝", "你好", "再見"]
+    mock_translate_batch.assert_called_once()
+    assert "<<<ITEM 3>>>\nBye\n<<<END 3>>>" in mock_translate_batch.call_args.args[0]
+    # The note missing from the batch response is translated on its own
+    mock_translate.assert_called_once_with("Thanks", "Traditional Chinese")
@@ -1,9 +1,26 @@
+import asyncio
+import os
+from datetime import datetime
+from pathlib import Path
+
 import pytest
 import base64
 
-from unittest.mock import patch, mock_open
+from unittest.mock import patch
 
-from arxiv_paper_summarizer.utils import get_env_var, compute_token, encode_image
+from arxiv_paper_summarizer.utils import (
+    MMAP_MIN_IMAGE_SIZE,
+    _get_encoding,
+    compute_token,
+    encode_image,
+    get_env_var,
+    get_publication_week_folder,
+    is_first_figure,
+    is_report_up_to_date,
+    normalize_image_filename,
+    run_sync,
+    write_report_metadata,
+)
 
 
 def test_get_env_var(monkeypatch: pytest.MonkeyPatch):
@@ -23,6 +40,7 @@ def test_compute_token():
     sample_text = "Hello, world!"
     expected_token_count = 3  # Assuming the text splits into 3 tokens
 
+    _get_encoding.cache_clear()
     with patch("arxiv_paper_summarizer.utils.tiktoken") as mock_tiktoken:
         mock_encoder = mock_tiktoken.encoding_for_model.return_value
         mock_encoder.encode.return_value = ["Hello", ",", "world!"]
@@ -32,14 +50,96 @@ def test_compute_token():
         assert token_count == expected_token_count
         mock_tiktoken.encoding_for_model.assert_called_with("gpt-4o")
         mock_encoder.encode.assert_called_with(sample_text)
+    _get_encoding.cache_clear()
+
+
+def test_compute_token_reuses_encoder():
+    _get_encoding.cache_clear()
+    with patch("arxiv_paper_summarizer.utils.tiktoken") as mock_tiktoken:
+        mock_tiktoken.encoding_for_model.return_value.encode.return_value = ["Hello"]
 
+        compute_token("Hello")
+        compute_token("Hello")
+        compute_token("Hello", model_name="gpt-4o-mini")
 
-def test_encode_image():
+        assert mock_tiktoken.encoding_for_model.call_count == 2
+    _get_encoding.cache_clear()
+
+
+def test_encode_image(tmp_path):
     sample_image_content = b"\x89PNG\r\n\x1a\n\x00\x00\x00\rIHDR"
     expected_base64_encoded = base64.b64encode(sample_image_content).decode("utf-8")
+    image_path = tmp_path / "image.png"
+    image_path.write_bytes(sample_image_content)
+
+    assert encode_image(str(image_path)) == expected_base64_encoded
+
+    # The file is read again on every call, so changes on disk are never masked by a stale encoding
+    image_path.write_bytes(b"changed")
+    assert encode_image(str(image_path)) == base64.b64encode(b"changed").decode("utf-8")
+
+
+def test_encode_large_image(tmp_path):
+    sample_image_content = os.urandom(MMAP_MIN_IMAGE_SIZE + 1)
+    image_path = tmp_path / "large.png"
+    image_path.write_bytes(sample_image_content)
+
+    assert encode_image(str(image_path)) == base64.b64encode(sample_image_content).decode("ascii")
+
+
+def test_encode_empty_image(tmp_path):
+    image_path = tmp_path / "empty.png"
+    image_path.write_bytes(b"")
+
+    assert encode_image(str(image_path)) == ""
+
+
+def test_run_sync():
+    async def add(a, b):
+        await asyncio.sleep(0)
+        return a + b
+
+    assert run_sync(add(1, 2)) == 3
+
+    async def inside_running_loop():
+        return run_sync(add(3, 4))
+
+    assert asyncio.run(inside_running_loop()) == 7
+
+
+def test_get_publication_week_folder():
+    assert get_publication_week_folder("2024-10-15T10:30:00Z") == Path("papers/2024/October/week_42")
+    assert get_publication_week_folder("2025-01-22T00:00:00", "reports") == Path("reports/2025/January/week_04")
+
+    now = datetime.now()
+    expected_fallback = Path(f"papers/{now.year}/{now:%B}/week_{now.isocalendar()[1]:02d}")
+    assert get_publication_week_folder(None) == expected_fallback
+    assert get_publication_week_folder("not a date") == expected_fallback
+
+
+def test_is_report_up_to_date(tmp_path):
+    output_path = tmp_path / "report.pdf"
+    metadata = {"arxiv_id": "2410.20672", "language": "English", "mode": "simple", "prompt_version": "v1"}
+    assert not is_report_up_to_date(output_path, metadata)
+
+    output_path.write_bytes(b"%PDF-1.7")
+    assert not is_report_up_to_date(output_path, metadata)
+
+    write_report_metadata(output_path, metadata)
+    assert (tmp_path / "report.pdf.meta.json").exists()
+    assert is_report_up_to_date(output_path, metadata)
+    assert not is_report_up_to_date(output_path, {**metadata, "mode": "detailed"})
+
+
+def test_is_first_figure():
+    assert is_first_figure("/tmp/images/figure-3-1.jpg")
+    assert not is_first_figure("/tmp/images/figure-3-2.jpg")
+    assert not is_first_figure("/tmp/images/table-3-1.jpg")
+    assert not is_first_figure("/tmp/images/figure-3-1-extra.jpg")
 
-    with patch("builtins.open", mock_open(read_data=sample_image_content)) as mock_file:
-        result = encode_image("path/to/image.png")
 
-        assert result == expected_base64_encoded
-        mock_file.assert_called_once_with("path/to/image.png", "rb")
+def test_normalize_image_filename():
+    assert normalize_image_filename("figure-3-1") == "figure-1"
+    assert normalize_image_filename("table-12-2.jpg") == "table-2.jpg"
+    assert normalize_image_filename("figure-1.jpg") == "figure-1.jpg"
+    assert normalize_image_filename("image-3-1.jpg") == "image-3-1.jpg"